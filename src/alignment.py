@@ -0,0 +1,167 @@
+﻿"""
+Türkiye İlleri Sosyo-Ekonomik Kümeleme Projesi
+Etiket Hizalama Modülü
+
+Bu modül farklı algoritma, yıl veya yeniden örneklem çalıştırmalarından
+gelen keyfi küme kimliklerini bir referansa (SEGE kademe sırası veya seçilen
+bir çalıştırma) toplu olarak hizalayan araçları içerir.
+"""
+
+import pandas as pd
+import numpy as np
+from itertools import permutations
+from scipy.optimize import linear_sum_assignment
+from typing import Tuple, Union
+
+# Bu küme sayısına kadar optimal eşleme tüm permütasyonlar üzerinde
+# vektörel aranır (SEGE'nin 6 kademesi dahil; k=7'den itibaren k! büyüdüğü
+# için çalıştırma başına Macar algoritması daha hızlı)
+PERMUTATION_SEARCH_MAX_K = 6
+
+# Permütasyon aramasında tek seferde oluşturulacak en büyük skor dizisi
+_SEARCH_BLOCK_ELEMENTS = 4_000_000
+
+
+def sege_reference(df: pd.DataFrame, column: str = 'sege_kademe') -> np.ndarray:
+    """
+    SEGE kademelerinden `ClusterVisualizer` sırasına uygun referans etiketler üret.
+    
+    Kademe 1 en gelişmiş olduğundan etiketler ters çevrilir: en az gelişmiş
+    kademe 0, en gelişmiş kademe (1. Kademe) en büyük kimliği alır.
+    
+    Args:
+        df: SEGE kademe sütununu içeren DataFrame
+        column: Kademe sütun adı
+        
+    Returns:
+        0 tabanlı referans etiketler
+    """
+    kademe = df[column].to_numpy()
+    return (kademe.max() - kademe).astype(np.int64)
+
+
+def contingency_tables(labels: np.ndarray,
+                       reference: np.ndarray,
+                       n_reference: int = None,
+                       n_labels: int = None) -> np.ndarray:
+    """
+    Tüm çalıştırmaların referansla çapraz tablolarını tek np.bincount ile kur.
+    
+    Negatif etiketler (DBSCAN gürültüsü, örnekleme girmeyen satırlar)
+    sayılmaz.
+    
+    Args:
+        labels: (çalıştırma × n) veya (n,) etiket dizisi
+        reference: (n,) veya labels ile aynı boyutta referans etiketler
+        n_reference: Referans küme sayısı (None ise max + 1)
+        n_labels: Çalıştırma küme sayısı (None ise max + 1)
+        
+    Returns:
+        (çalıştırma × n_reference × n_labels) kesişim sayıları
+    """
+    labels = np.atleast_2d(np.asarray(labels, dtype=np.int64))
+    reference = np.broadcast_to(np.asarray(reference, dtype=np.int64), labels.shape)
+    
+    if n_reference is None:
+        n_reference = int(reference.max()) + 1
+    if n_labels is None:
+        n_labels = int(labels.max()) + 1
+    n_runs = len(labels)
+    
+    valid = (labels >= 0) & (reference >= 0)
+    runs = np.broadcast_to(np.arange(n_runs)[:, None], labels.shape)
+    flat = (runs[valid] * n_reference + reference[valid]) * n_labels + labels[valid]
+    
+    counts = np.bincount(flat, minlength=n_runs * n_reference * n_labels)
+    return counts.reshape(n_runs, n_reference, n_labels)
+
+
+def _optimal_mappings(tables: np.ndarray) -> np.ndarray:
+    """
+    Kare çapraz tablolar için örtüşmeyi en büyükleyen eşlemeleri bul.
+    
+    Returns:
+        (çalıştırma × k) dizi; mapping[r, j] çalıştırma kümesi j'nin
+        referanstaki karşılığı
+    """
+    n_runs, n_clusters, _ = tables.shape
+    
+    if n_clusters <= PERMUTATION_SEARCH_MAX_K:
+        # perms[p, j]: p. permütasyonda çalıştırma kümesi j'nin referans kimliği
+        perms = np.array(list(permutations(range(n_clusters))), dtype=np.int64)
+        # Gösterge matrisi: düzleştirilmiş tablo @ indicator = permütasyon skorları
+        # (sayımlar float64'te tam temsil edilir, argmax eşitlikte ilk permütasyonu seçer)
+        indicator = np.zeros((n_clusters * n_clusters, len(perms)))
+        indicator[perms * n_clusters + np.arange(n_clusters), np.arange(len(perms))[:, None]] = 1.0
+        flat = tables.reshape(n_runs, -1)
+        block = max(1, _SEARCH_BLOCK_ELEMENTS // len(perms))
+        
+        best = np.empty(n_runs, dtype=np.int64)
+        for start in range(0, n_runs, block):
+            scores = flat[start:start + block].astype(np.float64) @ indicator
+            best[start:start + block] = scores.argmax(axis=1)
+        return perms[best]
+    
+    mappings = np.empty((n_runs, n_clusters), dtype=np.int64)
+    for run, table in enumerate(tables):
+        reference_ids, label_ids = linear_sum_assignment(table, maximize=True)
+        mappings[run, label_ids] = reference_ids
+    return mappings
+
+
+def align_labels(labels: np.ndarray,
+                 reference: np.ndarray,
+                 return_mapping: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Bir veya çok sayıda çalıştırmanın etiketlerini referansa hizala.
+    
+    Her çalıştırma için referansla çapraz tablo kurulur ve ortak üye
+    sayısını en büyükleyen bire bir küme eşlemesi bulunur (optimal atama).
+    Küme sayıları farklıysa tablo sıfırla kareye tamamlanır; referansta
+    karşılığı olmayan kümeler referans kimliklerinden büyük, ayrı kimlikler
+    alır. Negatif etiketler (-1) korunur.
+    
+    Args:
+        labels: (çalıştırma × n) veya (n,) etiket dizisi
+        reference: (n,) referans etiketler (ör. `sege_reference(df)` veya
+            seçilen bir çalıştırmanın etiketleri)
+        return_mapping: True ise eşleme tablosu da döndürülür
+        
+    Returns:
+        Hizalanmış etiketler (girdiyle aynı boyutta); return_mapping=True ise
+        (etiketler, eşleme) tuple
+    """
+    labels = np.asarray(labels)
+    single = labels.ndim == 1
+    runs = np.atleast_2d(labels).astype(np.int64)
+    reference = np.asarray(reference, dtype=np.int64)
+    if reference.shape[-1] != runs.shape[1]:
+        raise ValueError("Etiket ve referans uzunlukları uyuşmuyor!")
+    
+    n_clusters = max(int(reference.max()) + 1, int(runs.max()) + 1, 1)
+    tables = contingency_tables(runs, reference, n_clusters, n_clusters)
+    mappings = _optimal_mappings(tables)
+    
+    noise = runs < 0
+    aligned = np.take_along_axis(mappings, np.where(noise, 0, runs), axis=1)
+    aligned[noise] = -1
+    
+    if single:
+        aligned, mappings = aligned[0], mappings[0]
+    return (aligned, mappings) if return_mapping else aligned
+
+
+def agreement(labels: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """
+    Hizalanmış çalıştırmaların referansla aynı etiketi taşıyan satır oranı.
+    
+    Args:
+        labels: Hizalanmış (çalıştırma × n) veya (n,) etiketler
+        reference: (n,) referans etiketler
+        
+    Returns:
+        Çalıştırma başına uyum oranı
+    """
+    runs = np.atleast_2d(labels)
+    valid = (runs >= 0) & (np.asarray(reference) >= 0)
+    return ((runs == reference) & valid).sum(axis=1) / np.maximum(valid.sum(axis=1), 1)
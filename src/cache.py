@@ -0,0 +1,265 @@
+﻿"""
+Türkiye İlleri Sosyo-Ekonomik Kümeleme Projesi
+Önbellek Modülü
+
+Bu modül işlenmiş veri setleri ve ara sonuçlar için içerik özetine (hash)
+dayalı, boyut sınırlı ve LRU tahliyeli disk önbelleğini içerir.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Any, Callable, Dict, Optional
+import hashlib
+import json
+import os
+import pickle
+import time
+
+# (dosya yolu, boyut, değişiklik zamanı) -> içerik özeti
+_FILE_HASH_MEMO: Dict[tuple, str] = {}
+
+
+def file_hash(filepath: str, block_size: int = 1 << 20) -> str:
+    """
+    Dosya içeriğinin SHA-256 özetini hesapla.
+    
+    Aynı süreç içinde boyutu ve değişiklik zamanı değişmeyen dosyalar için
+    özet yeniden hesaplanmaz.
+    
+    Args:
+        filepath: Dosya yolu
+        block_size: Okuma blok boyutu (byte)
+        
+    Returns:
+        Onaltılık özet
+    """
+    stat = os.stat(filepath)
+    memo_key = (os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns)
+    if memo_key in _FILE_HASH_MEMO:
+        return _FILE_HASH_MEMO[memo_key]
+    
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    
+    _FILE_HASH_MEMO[memo_key] = digest.hexdigest()
+    return _FILE_HASH_MEMO[memo_key]
+
+
+def array_hash(data, block_rows: int = 65_536) -> str:
+    """
+    Dizi içeriğinin (boyut ve dtype dahil) SHA-256 özetini hesapla.
+    
+    Bellek eşlemli diziler satır blokları halinde okunur.
+    
+    Args:
+        data: numpy dizisi
+        block_rows: Blok başına satır sayısı
+        
+    Returns:
+        Onaltılık özet
+    """
+    data = np.asarray(data) if not isinstance(data, np.ndarray) else data
+    digest = hashlib.sha256(f"{data.shape}|{data.dtype.str}".encode('utf-8'))
+    if data.ndim == 0:
+        digest.update(data.tobytes())
+    for start in range(0, len(data) if data.ndim else 0, block_rows):
+        digest.update(np.ascontiguousarray(data[start:start + block_rows]).tobytes())
+    return digest.hexdigest()
+
+
+def make_key(*parts: Any) -> str:
+    """
+    Parçalardan kararlı bir önbellek anahtarı üret.
+    
+    Args:
+        *parts: JSON'a çevrilebilir anahtar parçaları
+        
+    Returns:
+        Onaltılık anahtar
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class DiskCache:
+    """
+    Boyut sınırlı, LRU tahliyeli disk önbelleği.
+    
+    Her kayıt tek bir dosyadır; son erişim zamanı dosyanın mtime değeriyle
+    izlenir. Toplam boyut `max_size_mb` değerini aştığında en uzun süredir
+    kullanılmayan kayıtlar silinir.
+    """
+    
+    def __init__(self, cache_dir: str = 'data/cache/', max_size_mb: float = 512):
+        """
+        DiskCache sınıfını başlat.
+        
+        Args:
+            cache_dir: Önbellek dizini
+            max_size_mb: Maksimum toplam boyut (MB)
+        """
+        self.cache_dir = cache_dir
+        self.max_size_mb = max_size_mb
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _path(self, key: str, suffix: str) -> str:
+        """Anahtar için dosya yolunu döndür."""
+        return os.path.join(self.cache_dir, f"{key}{suffix}")
+    
+    def _find(self, key: str) -> Optional[str]:
+        """Anahtara ait mevcut kayıt dosyasını bul."""
+        for suffix in ('.feather', '.pkl'):
+            path = self._path(key, suffix)
+            if os.path.exists(path):
+                return path
+        return None
+    
+    def _touch(self, path: str):
+        """Kaydın son erişim zamanını güncelle (LRU için)."""
+        now = time.time()
+        os.utime(path, (now, now))
+    
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) is not None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Önbellekten kayıt oku.
+        
+        Args:
+            key: Kayıt anahtarı
+            default: Kayıt yoksa döndürülecek değer
+            
+        Returns:
+            Kayıtlı nesne veya default
+        """
+        path = self._find(key)
+        if path is None:
+            return default
+        
+        try:
+            if path.endswith('.feather'):
+                value = pd.read_feather(path)
+            else:
+                with open(path, 'rb') as f:
+                    value = pickle.load(f)
+        except Exception:
+            # Bozuk/yarım kalmış kayıt: sil ve ıskalama say
+            os.remove(path)
+            return default
+        
+        self._touch(path)
+        return value
+    
+    def set(self, key: str, value: Any) -> str:
+        """
+        Önbelleğe kayıt yaz ve gerekirse tahliye uygula.
+        
+        DataFrame'ler pyarrow kuruluysa Feather (sütunsal ikili) formatında,
+        değilse pickle ile saklanır.
+        
+        Args:
+            key: Kayıt anahtarı
+            value: Saklanacak nesne
+            
+        Returns:
+            Kayıt dosya yolu
+        """
+        path = None
+        if isinstance(value, pd.DataFrame):
+            try:
+                path = self._path(key, '.feather')
+                tmp_path = path + '.tmp'
+                value.reset_index(drop=True).to_feather(tmp_path)
+            except ImportError:
+                path = None
+        
+        if path is None:
+            path = self._path(key, '.pkl')
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        # Eşzamanlı okuyucular yarım dosya görmesin
+        os.replace(tmp_path, path)
+        self.evict()
+        
+        return path
+    
+    def _entries(self) -> list:
+        """(dosya yolu, boyut, son erişim) listesini döndür."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.tmp'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            if os.path.isfile(path):
+                stat = os.stat(path)
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+    
+    def size_mb(self) -> float:
+        """Önbelleğin toplam boyutunu (MB) döndür."""
+        return sum(size for _, size, _ in self._entries()) / 1024 / 1024
+    
+    def evict(self) -> int:
+        """
+        Boyut sınırı aşıldıysa en eski kayıtları sil.
+        
+        Returns:
+            Silinen kayıt sayısı
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_size_mb * 1024 * 1024
+        
+        n_removed = 0
+        for path, size, _ in entries:
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            n_removed += 1
+        
+        return n_removed
+    
+    def clear(self):
+        """Tüm önbellek kayıtlarını sil."""
+        for path, _, _ in self._entries():
+            os.remove(path)
+
+
+def read_csv_cached(filepath: str,
+                    cache: DiskCache,
+                    reader: Callable[[], pd.DataFrame] = None,
+                    **read_kwargs) -> pd.DataFrame:
+    """
+    CSV dosyasını önbellek üzerinden oku.
+    
+    Anahtar, dosya içeriğinin özeti ile okuma parametrelerinden (sütunlar,
+    dtype'lar, kodlama) üretilir; kaynak dosya değiştiğinde eski kayıt
+    kullanılmaz ve zamanla LRU ile tahliye edilir.
+    
+    Args:
+        filepath: CSV dosya yolu
+        cache: DiskCache nesnesi
+        reader: Önbellek ıskalamasında kullanılacak okuyucu (None ise
+            pd.read_csv(filepath, **read_kwargs))
+        **read_kwargs: pd.read_csv parametreleri
+        
+    Returns:
+        Yüklenen DataFrame
+    """
+    key = make_key('csv', file_hash(filepath), read_kwargs)
+    
+    data = cache.get(key)
+    if data is None:
+        data = reader() if reader is not None else pd.read_csv(filepath, **read_kwargs)
+        cache.set(key, data)
+    
+    return data
@@ -8,7 +8,7 @@ optimal küme sayısı belirleme ve değerlendirme metriklerini içerir.
 
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans, AgglomerativeClustering, DBSCAN
+from sklearn.cluster import KMeans, MiniBatchKMeans, AgglomerativeClustering, DBSCAN
 from sklearn.mixture import GaussianMixture
 from sklearn.metrics import (
     silhouette_score, 
@@ -17,14 +17,48 @@ from sklearn.metrics import (
     silhouette_samples
 )
 from sklearn.decomposition import PCA
-from scipy.cluster.hierarchy import dendrogram, linkage, fcluster
+from sklearn.neighbors import NearestNeighbors, kneighbors_graph
+from scipy.cluster.hierarchy import dendrogram, linkage, fcluster, cut_tree
 from scipy.spatial.distance import cdist
+from scipy import sparse, stats
+from scipy.sparse.csgraph import connected_components
 from typing import Tuple, List, Dict, Optional, Union
+import time
 import warnings
 
+try:
+    from .cache import DiskCache, array_hash, make_key
+    from .config import load_config, resolve_path
+    from .parallel import get_shared_data, resolve_n_jobs, run_parallel
+    from .profiling import track_peak_memory
+    from .spatial import contiguity_report
+except ImportError:  # doğrudan `python src/clustering.py` ile çalıştırma
+    from cache import DiskCache, array_hash, make_key
+    from config import load_config, resolve_path
+    from parallel import get_shared_data, resolve_n_jobs, run_parallel
+    from profiling import track_peak_memory
+    from spatial import contiguity_report
+
 warnings.filterwarnings('ignore')
 
 
+# compare_algorithms için varsayılan aday algoritmalar
+DEFAULT_COMPARISON_ALGORITHMS = [
+    {'name': 'K-Means', 'algorithm': 'kmeans', 'params': {'n_init': 10}},
+    {'name': 'Hierarchical (Ward)', 'algorithm': 'hierarchical', 'params': {'linkage': 'ward'}},
+    {'name': 'Hierarchical (Complete)', 'algorithm': 'hierarchical', 'params': {'linkage': 'complete'}},
+    {'name': 'Gaussian Mixture', 'algorithm': 'gmm', 'params': {}}
+]
+
+# Sıkıştırılmış uzaklık dizisi üzerinde Lance-Williams ile güncellenebilen yöntemler
+_CONDENSED_LINKAGES = ('single', 'complete', 'average', 'weighted')
+# k-NN bağlantı kısıtlı yaklaşık ağaçta (AgglomerativeClustering) desteklenen yöntemler
+_KNN_LINKAGES = ('ward', 'complete', 'average', 'single')
+# Uzaklık önbelleği bloklarında eleman başına tepe çalışma alanı (byte):
+# int64 indeks ve ara dizi, float32 okuma ve float64 uzaklık kopyası
+_DISTANCE_ROW_BYTES = 32
+
+
 class ClusteringAnalyzer:
     """
     Kümeleme analizi sınıfı.
@@ -32,6 +66,7 @@ class ClusteringAnalyzer:
     Özellikler:
     - K-Means kümeleme
     - Hiyerarşik kümeleme (Agglomerative)
+    - Komşuluk kısıtlı bölgeselleştirme
     - DBSCAN kümeleme
     - Gaussian Mixture Model
     - Optimal küme sayısı belirleme
@@ -39,35 +74,281 @@ class ClusteringAnalyzer:
     - PCA ile boyut indirgeme
     """
     
-    def __init__(self, data: np.ndarray = None, random_state: int = 42):
+    def __init__(self,
+                 data: np.ndarray = None,
+                 random_state: int = 42,
+                 track_memory: bool = False,
+                 distance_cache_mb: float = 1024,
+                 cache_dir: str = None,
+                 cache_max_mb: float = 256):
         """
         ClusteringAnalyzer sınıfını başlat.
         
         Args:
             data: Normalize edilmiş veri matrisi
             random_state: Rastgelelik kontrolü için seed
+            track_memory: True ise aşama bazında tepe bellek kullanımı
+                `memory_profile` içine yazılır
+            distance_cache_mb: Silhouette hesapları için önbelleklenecek
+                uzaklık dizisinin bellek bütçesi (MB, 0 ise önbellek kapalı)
+            cache_dir: Verilirse eğitim sonuçları (etiketler, merkezler,
+                modeller, metrikler) bu dizinde kalıcı olarak önbelleklenir
+            cache_max_mb: Sonuç önbelleği boyut sınırı (MB, LRU tahliyesi)
         """
         self.data = data
         self.random_state = random_state
+        self.track_memory = track_memory
+        self.memory_profile = {}
+        self.distance_cache_mb = distance_cache_mb
+        self._distance_matrix = None
+        self._distance_chunk = None
+        self._distance_cached = False
+        self.distance_cache_seconds = None
+        self.result_cache = DiskCache(cache_dir, max_size_mb=cache_max_mb) if cache_dir else None
+        self._data_hash = None
+        self.kmeans_engine = 'full'
+        self.minibatch_params = {}
+        self.linkage_params = {}
         self.labels = None
         self.model = None
         self.n_clusters = None
         self.cluster_centers = None
+        # Modelin (ve merkezlerin) ürettiği etiket dizisi; `assign` model yolunu
+        # yalnızca self.labels hâlâ bu diziyse kullanır
+        self._model_labels = None
+        self._medoid_cache = None
         self.evaluation_results = {}
+        self.hierarchical_sweep_labels = {}
+        self.dbscan_sweep_labels = {}
+        self._radius_graph = None
+        
+    @classmethod
+    def from_config(cls, data: np.ndarray = None, config: Dict = None, **kwargs) -> 'ClusteringAnalyzer':
+        """
+        config.yaml 'clustering' bölümünden analiz nesnesi oluştur.
+        
+        random_state, kmeans_engine, minibatch, linkage ve sonuç önbelleği
+        ayarları okunur.
         
+        Args:
+            data: Normalize edilmiş veri matrisi
+            config: Konfigürasyon dictionary (None ise config.yaml okunur)
+            **kwargs: ClusteringAnalyzer parametreleri
+            
+        Returns:
+            ClusteringAnalyzer
+        """
+        if config is None:
+            config = load_config()
+        section = config.get('clustering', {}) or {}
+        
+        kwargs.setdefault('random_state', section.get('random_state', 42))
+        # Göreli önbellek yolu çalışma dizinine değil proje köküne göre çözülür
+        kwargs.setdefault('cache_dir', resolve_path(section.get('result_cache_path')))
+        kwargs.setdefault('cache_max_mb', section.get('result_cache_max_mb', 256))
+        analyzer = cls(data, **kwargs)
+        analyzer.kmeans_engine = section.get('kmeans_engine', 'full')
+        analyzer.minibatch_params = dict(section.get('minibatch', {}) or {})
+        analyzer.linkage_params = dict(section.get('linkage', {}) or {})
+        
+        return analyzer
+    
     def set_data(self, data: np.ndarray):
-        """Veri setini ayarla."""
+        """Veri setini ayarla (uzaklık önbelleği geçersiz kılınır)."""
         self.data = data
+        self._distance_matrix = None
+        self._distance_chunk = None
+        self._distance_cached = False
+        self.distance_cache_seconds = None
+        self._data_hash = None
+        self._radius_graph = None
+    
+    def _cache_key(self, kind: str, **params) -> Optional[str]:
+        """
+        Sonuç önbelleği anahtarı üret (önbellek kapalıysa None).
+        
+        Anahtar veri matrisinin içerik özeti, işlem türü, parametreler ve
+        random_state değerinden oluşur. Özet bir kez hesaplanır ve yalnızca
+        `set_data` ile sıfırlanır; veri değiştirildiğinde `set_data`
+        çağrılmalıdır.
+        """
+        if self.result_cache is None or self.data is None:
+            return None
+        
+        if self._data_hash is None:
+            self._data_hash = array_hash(self.data)
+        
+        return make_key(kind, self._data_hash, self.random_state, params)
+    
+    def _restore_fit(self, key: Optional[str]) -> bool:
+        """Önbellekteki eğitim sonucunu nesneye yükle; bulunamazsa False."""
+        if key is None:
+            return False
+        state = self.result_cache.get(key)
+        if state is None:
+            return False
+        
+        self.model = state['model']
+        self.labels = state['labels']
+        self.cluster_centers = state['cluster_centers']
+        self.n_clusters = state['n_clusters']
+        self._model_labels = self.labels
+        return True
+    
+    def _store_fit(self, key: Optional[str]):
+        """Güncel eğitim sonucunu önbelleğe yaz."""
+        if key is None:
+            return
+        self.result_cache.set(key, {
+            'model': self.model,
+            'labels': self.labels,
+            'cluster_centers': self.cluster_centers,
+            'n_clusters': self.n_clusters
+        })
+    
+    def get_distance_matrix(self) -> Optional[np.ndarray]:
+        """
+        Oturum boyunca paylaşılan sıkıştırılmış (condensed) uzaklık dizisini döndür.
+        
+        Uzaklıklar veri seti başına bir kez, satır blokları halinde doğrudan
+        float32 sıkıştırılmış diziye yazılır (~2·n² byte) ve tüm silhouette
+        hesaplarında yeniden kullanılır. Bütçe, dizi ile birlikte blok
+        çalışma alanının (cdist çıktısı, silhouette blok genişletmesi) tepe
+        değerine göre kontrol edilir; sığmıyorsa None döner ve metrikler
+        doğrudan veriden hesaplanır. Önbellek yalnızca `set_data` ile
+        geçersiz kılınır; kurulum süresi `distance_cache_seconds` içine
+        yazılır.
+        
+        Returns:
+            n·(n-1)/2 uzunluğunda float32 dizi veya None
+        """
+        if self.data is None:
+            return None
+        if self._distance_cached:
+            return self._distance_matrix
+        
+        n_samples, n_features = self.data.shape
+        budget = self.distance_cache_mb * 1024**2
+        # Sabit kısım: float32 dizi ve verinin float64 kopyası
+        remaining = budget - 2.0 * n_samples * (n_samples - 1) - 8.0 * n_samples * n_features
+        # Blok çalışma alanı satır başına en fazla _DISTANCE_ROW_BYTES·n byte
+        chunk_size = min(1024, int(remaining // (_DISTANCE_ROW_BYTES * max(n_samples, 1))))
+        
+        distances = None
+        start = time.perf_counter()
+        if n_samples > 1 and chunk_size >= 1:
+            distances = _condensed_distances(self.data, chunk_size=chunk_size)
+        self.distance_cache_seconds = time.perf_counter() - start
+        
+        self._distance_matrix = distances
+        self._distance_chunk = chunk_size if distances is not None else None
+        self._distance_cached = True
+        return distances
+    
+    def _quality_scores(self, labels: np.ndarray, silhouette_options: Dict = None) -> Dict[str, float]:
+        """
+        Gürültü (-1) hariç silhouette, CH ve DB skorlarını hesapla.
+        
+        silhouette_options: {'mode', 'sample_size', 'n_draws'} (None ise tam hesap)
+        """
+        mask = labels != -1
+        if mask.all():
+            mask = None
+        filtered_labels = labels if mask is None else labels[mask]
+        
+        if len(np.unique(filtered_labels)) < 2:
+            scores = {'silhouette': np.nan}
+            if silhouette_options and silhouette_options['mode'] != 'exact':
+                scores.update({'silhouette_ci_low': np.nan, 'silhouette_ci_high': np.nan})
+            return {**scores, 'calinski_harabasz': np.nan, 'davies_bouldin': np.nan}
+        
+        data = self.data if mask is None else self.data[mask]
+        return {
+            **self._silhouette_fields(filtered_labels, silhouette_options, mask),
+            'calinski_harabasz': calinski_harabasz_score(data, filtered_labels),
+            'davies_bouldin': davies_bouldin_score(data, filtered_labels)
+        }
+    
+    def _silhouette_fields(self,
+                           labels: np.ndarray,
+                           silhouette_options: Dict = None,
+                           mask: np.ndarray = None) -> Dict[str, float]:
+        """
+        Tarama satırı için silhouette (ve yaklaşık modda güven aralığı) alanları.
+        
+        silhouette_options: {'mode', 'sample_size', 'n_draws'} (None ise tam hesap)
+        mask: Verinin hangi satırlarının etiketlere karşılık geldiği
+        """
+        options = silhouette_options or {'mode': 'exact'}
+        if options['mode'] == 'exact':
+            return {'silhouette': self._silhouette(labels, mask)}
+        
+        estimate = self.estimate_silhouette(labels, mode=options['mode'],
+                                            sample_size=options.get('sample_size', 2000),
+                                            n_draws=options.get('n_draws', 10),
+                                            mask=mask)
+        return {
+            'silhouette': estimate['silhouette'],
+            'silhouette_ci_low': estimate['ci_low'],
+            'silhouette_ci_high': estimate['ci_high']
+        }
+    
+    def _silhouette(self, labels: np.ndarray, mask: np.ndarray = None) -> float:
+        """Silhouette skorunu (varsa) önbellekteki uzaklıklarla hesapla."""
+        if self.get_distance_matrix() is None:
+            data = self.data if mask is None else self.data[mask]
+            return silhouette_score(data, labels)
+        return float(np.mean(self._silhouette_samples(labels, mask)))
+    
+    def _silhouette_samples(self, labels: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
+        """Örnek bazlı silhouette değerlerini (varsa) önbellekle hesapla."""
+        distances = self.get_distance_matrix()
+        if distances is None:
+            data = self.data if mask is None else self.data[mask]
+            return silhouette_samples(data, labels)
+        # Alt küme kare matris olarak kopyalanmaz; satırlar bloklar halinde açılır
+        rows = None if mask is None else np.flatnonzero(mask)
+        return _condensed_silhouette_samples(distances, len(self.data), labels, rows,
+                                             chunk_size=self._distance_chunk)
         
     def find_optimal_k(self, 
                       k_range: range = range(2, 11),
-                      method: str = 'all') -> pd.DataFrame:
+                      method: str = 'all',
+                      n_init: int = 10,
+                      n_jobs: int = 1,
+                      split_restarts: bool = False,
+                      linkage_method: str = 'ward',
+                      warm_start: bool = False,
+                      n_fresh: int = 1,
+                      silhouette_mode: str = 'exact',
+                      sample_size: int = 2000,
+                      n_draws: int = 10) -> pd.DataFrame:
         """
         Optimal küme sayısını bul.
         
         Args:
             k_range: Denenecek k değerleri aralığı
-            method: Değerlendirme yöntemi ('elbow', 'silhouette', 'all')
+            method: Değerlendirme yöntemi ('elbow', 'silhouette', 'all') veya
+                'hierarchical' (K-Means yerine tek bir bağlantı ağacının
+                tüm k değerlerinde kesilmesi, bkz. `sweep_hierarchical`)
+            n_init: K-Means başlangıç sayısı
+            n_jobs: Paralel süreç sayısı (1: seri, -1/None: tüm CPU'lar).
+                Veri matrisi süreçlere görev başına pickle edilmek yerine
+                paylaşılan bellekle aktarılır; sonuçlar seri çalışmayla aynıdır.
+            split_restarts: True ise her k'nın n_init başlangıcı da ayrı
+                görevler olarak paralelleştirilir. Başlangıç tohumları
+                random_state'ten türetildiği için sonuç tekrarlanabilir,
+                ancak seri K-Means(n_init=...) çalışmasıyla birebir aynı
+                olması garanti edilmez.
+            linkage_method: method='hierarchical' için bağlantı yöntemi
+            warm_start: True ise k+1 çözümü, k çözümünün merkezlerinden en
+                kötü küme bölünerek başlatılır (bkz. `sweep_kmeans_warm`)
+            n_fresh: warm_start modunda k başına ek rastgele başlangıç sayısı
+            silhouette_mode: 'exact', 'sampled' veya 'centroid' (bkz.
+                `estimate_silhouette`); yaklaşık modlarda sonuca
+                silhouette_ci_low/silhouette_ci_high sütunları eklenir
+            sample_size: 'sampled' modunda çekiliş başına örnek boyutu
+            n_draws: 'sampled' modunda çekiliş sayısı
             
         Returns:
             K değerleri ve metrikleri içeren DataFrame
@@ -75,30 +356,27 @@ class ClusteringAnalyzer:
         if self.data is None:
             raise ValueError("Veri seti yüklenmedi!")
         
-        results = []
-        
         print("Optimal K Değeri Aranıyor...")
         print("-" * 50)
         
-        for k in k_range:
-            kmeans = KMeans(n_clusters=k, random_state=self.random_state, n_init=10)
-            labels = kmeans.fit_predict(self.data)
-            
-            # Metrikler
-            inertia = kmeans.inertia_
-            silhouette = silhouette_score(self.data, labels)
-            calinski = calinski_harabasz_score(self.data, labels)
-            davies = davies_bouldin_score(self.data, labels)
-            
-            results.append({
-                'k': k,
-                'inertia': inertia,
-                'silhouette': silhouette,
-                'calinski_harabasz': calinski,
-                'davies_bouldin': davies
-            })
-            
-            print(f"K={k}: Silhouette={silhouette:.4f}, CH={calinski:.2f}, DB={davies:.4f}")
+        silhouette_options = {'mode': silhouette_mode, 'sample_size': sample_size,
+                              'n_draws': n_draws}
+        if method == 'hierarchical':
+            results = self.sweep_hierarchical(k_range, linkage_methods=[linkage_method],
+                                              silhouette_options=silhouette_options)
+            results = results.drop(columns='linkage').to_dict('records')
+        elif warm_start:
+            results = self.sweep_kmeans_warm(k_range, n_init=n_init, n_fresh=n_fresh,
+                                             silhouette_options=silhouette_options)
+            results = results.drop(columns=['n_iter', 'sicak_secildi', 'fit_seconds']
+                                   ).to_dict('records')
+        else:
+            results = self._sweep_kmeans(k_range, n_init, n_jobs, split_restarts,
+                                         silhouette_options)
+        
+        for row in results:
+            print(f"K={row['k']}: Silhouette={row['silhouette']:.4f}, "
+                  f"CH={row['calinski_harabasz']:.2f}, DB={row['davies_bouldin']:.4f}")
         
         results_df = pd.DataFrame(results)
         
@@ -115,13 +393,231 @@ class ClusteringAnalyzer:
         
         return results_df
     
-    def fit_kmeans(self, n_clusters: int, n_init: int = 10) -> np.ndarray:
+    def _sweep_kmeans(self,
+                      k_range: range,
+                      n_init: int,
+                      n_jobs: int,
+                      split_restarts: bool,
+                      silhouette_options: Dict = None) -> List[Dict]:
+        """K-Means ile k taraması yap (bkz. `find_optimal_k`)."""
+        silhouette_options = silhouette_options or {'mode': 'exact'}
+        # Uzaklık matrisi önbellekteyse silhouette burada, paylaşılan
+        # matrisle hesaplanır; işçiler yalnızca diğer metrikleri hesaplar
+        with_silhouette = (silhouette_options['mode'] == 'exact'
+                           and self.get_distance_matrix() is None)
+        
+        if split_restarts:
+            results = self._sweep_split_restarts(list(k_range), n_init, n_jobs, with_silhouette)
+        else:
+            tasks = [(k, self.random_state, n_init, with_silhouette) for k in k_range]
+            results = run_parallel(_kmeans_sweep_task, tasks, self.data, n_jobs)
+        
+        for row in results:
+            labels = row.pop('labels')
+            if not with_silhouette:
+                row.update(self._silhouette_fields(labels, silhouette_options))
+        
+        return results
+    
+    def sweep_kmeans_warm(self,
+                          k_range: range = range(2, 11),
+                          n_init: int = 10,
+                          n_fresh: int = 1,
+                          silhouette_options: Dict = None) -> pd.DataFrame:
+        """
+        K-Means taramasını ardışık k değerleri arasında sıcak başlatmayla yap.
+        
+        İlk k normal şekilde (n_init başlangıçla) eğitilir. Sonraki her k
+        için önceki çözümün merkezleri alınır ve eksik merkez sayısı kadar,
+        kareler toplamı en yüksek küme birinci temel bileşeni boyunca ikiye
+        bölünür; model bu merkezlerden tek başlangıçla eğitilir. Ayrıca
+        `n_fresh` rastgele başlangıç denenir ve daha düşük inertia'lı çözüm
+        seçilir.
+        
+        Args:
+            k_range: Denenecek k değerleri
+            n_init: İlk k için başlangıç sayısı
+            n_fresh: Sonraki k değerleri için ek rastgele başlangıç sayısı
+            silhouette_options: Silhouette hesap ayarları {'mode', 'sample_size',
+                'n_draws'} (None ise tam hesap, bkz. `find_optimal_k`)
+            
+        Returns:
+            k, inertia, metrikler, n_iter (k için yapılan tüm başlangıçların
+            toplam Lloyd iterasyonu), sicak_secildi ve fit_seconds sütunlarını
+            içeren DataFrame
+        """
+        if self.data is None:
+            raise ValueError("Veri seti yüklenmedi!")
+        
+        data = np.asarray(self.data, dtype=np.float64)
+        centers = None
+        results = []
+        
+        for k in sorted(int(k) for k in k_range):
+            start = time.perf_counter()
+            if centers is None or len(centers) >= k:
+                model, n_iter = _kmeans_restarts(data, k, n_init, self.random_state)
+                warm_chosen = False
+            else:
+                init = _split_worst_clusters(data, centers, k)
+                model = KMeans(n_clusters=k, init=init, n_init=1).fit(data)
+                n_iter, warm_chosen = model.n_iter_, True
+                if n_fresh > 0:
+                    fresh, fresh_iter = _kmeans_restarts(data, k, n_fresh, self.random_state)
+                    n_iter += fresh_iter
+                    if fresh.inertia_ < model.inertia_:
+                        model, warm_chosen = fresh, False
+            fit_seconds = time.perf_counter() - start
+            
+            centers = model.cluster_centers_
+            labels = model.labels_
+            results.append({
+                'k': k,
+                'inertia': model.inertia_,
+                **self._silhouette_fields(labels, silhouette_options),
+                'calinski_harabasz': calinski_harabasz_score(data, labels),
+                'davies_bouldin': davies_bouldin_score(data, labels),
+                'n_iter': n_iter,
+                'sicak_secildi': warm_chosen,
+                'fit_seconds': fit_seconds
+            })
+        
+        return pd.DataFrame(results)
+    
+    def warm_start_report(self,
+                          k_range: range = range(2, 11),
+                          n_init: int = 10,
+                          n_fresh: int = 1) -> pd.DataFrame:
+        """
+        Sıcak başlatmalı taramayı soğuk başlatmalı taramayla karşılaştır.
+        
+        Soğuk taramada her k için K-Means(n_init) eğitilir. Her iki tarafta
+        iterasyon sayısı, her başlangıç ayrı eğitilerek toplanır.
+        
+        Args:
+            k_range: Denenecek k değerleri
+            n_init: Soğuk tarama (ve sıcak taramanın ilk k'sı) başlangıç sayısı
+            n_fresh: Sıcak taramada ek rastgele başlangıç sayısı
+            
+        Returns:
+            k başına inertia, silhouette, iterasyon ve süre karşılaştırması
+        """
+        if self.data is None:
+            raise ValueError("Veri seti yüklenmedi!")
+        
+        data = np.asarray(self.data, dtype=np.float64)
+        warm = self.sweep_kmeans_warm(k_range, n_init=n_init, n_fresh=n_fresh)
+        
+        rows = []
+        for row in warm.itertuples(index=False):
+            start = time.perf_counter()
+            best, cold_iter = _kmeans_restarts(data, row.k, n_init, self.random_state)
+            cold_seconds = time.perf_counter() - start
+            
+            rows.append({
+                'k': row.k,
+                'inertia_soguk': best.inertia_,
+                'inertia_sicak': row.inertia,
+                'inertia_fark_yuzde': (row.inertia - best.inertia_) / best.inertia_ * 100,
+                'silhouette_soguk': self._silhouette(best.labels_),
+                'silhouette_sicak': row.silhouette,
+                'n_iter_soguk': cold_iter,
+                'n_iter_sicak': row.n_iter,
+                'sure_soguk_sn': cold_seconds,
+                'sure_sicak_sn': row.fit_seconds
+            })
+        
+        report = pd.DataFrame(rows)
+        
+        print("\nSıcak / Soğuk Başlatma Karşılaştırması:")
+        print("=" * 70)
+        print(report[['k', 'inertia_fark_yuzde', 'silhouette_soguk', 'silhouette_sicak',
+                      'n_iter_soguk', 'n_iter_sicak']].to_string(index=False))
+        print("=" * 70)
+        print(f"Toplam iterasyon: soğuk={report['n_iter_soguk'].sum()}, "
+              f"sıcak={report['n_iter_sicak'].sum()}")
+        
+        return report
+    
+    def sweep_hierarchical(self,
+                           k_range: range = None,
+                           linkage_methods: Union[str, List[str]] = 'ward',
+                           silhouette_options: Dict = None) -> pd.DataFrame:
+        """
+        Hiyerarşik kümelemeyi tüm k değerleri için tek ağaçtan değerlendir.
+        
+        Her bağlantı yöntemi için linkage matrisi bir kez hesaplanır ve
+        `cut_tree` ile tüm k değerlerinde tek geçişte kesilir; k başına
+        AgglomerativeClustering yeniden eğitilmez. Etiketler
+        `hierarchical_sweep_labels[(yöntem, k)]` içinde saklanır.
+        
+        Args:
+            k_range: Denenecek k değerleri (None ise config.yaml clustering.k_range)
+            linkage_methods: Bağlantı yöntemi veya yöntem listesi
+            silhouette_options: Silhouette hesap ayarları {'mode', 'sample_size',
+                'n_draws'} (None ise tam hesap, bkz. `find_optimal_k`)
+            
+        Returns:
+            linkage, k ve metrikleri içeren DataFrame
+        """
+        if self.data is None:
+            raise ValueError("Veri seti yüklenmedi!")
+        
+        if k_range is None:
+            k_range = load_config().get('clustering', {}).get('k_range', list(range(2, 11)))
+        k_values = [int(k) for k in k_range]
+        if isinstance(linkage_methods, str):
+            linkage_methods = [linkage_methods]
+        
+        self.hierarchical_sweep_labels = {}
+        results = []
+        for method in linkage_methods:
+            linkage_matrix = self.get_linkage_matrix(method=method)
+            all_labels = cut_tree(linkage_matrix, n_clusters=k_values)
+            
+            for k, labels in zip(k_values, all_labels.T):
+                labels = np.ascontiguousarray(labels)
+                self.hierarchical_sweep_labels[(method, k)] = labels
+                results.append({
+                    'linkage': method,
+                    'k': k,
+                    'inertia': _within_cluster_ss(self.data, labels),
+                    **self._silhouette_fields(labels, silhouette_options),
+                    'calinski_harabasz': calinski_harabasz_score(self.data, labels),
+                    'davies_bouldin': davies_bouldin_score(self.data, labels)
+                })
+        
+        return pd.DataFrame(results)
+    
+    def _sweep_split_restarts(self,
+                              k_values: List[int],
+                              n_init: int,
+                              n_jobs: int,
+                              with_silhouette: bool = True) -> List[Dict]:
+        """Her (k, başlangıç) çiftini ayrı görev olarak çalıştır, k başına en iyisini seç."""
+        seeds = np.random.RandomState(self.random_state).randint(
+            np.iinfo(np.int32).max, size=n_init
+        )
+        tasks = [(k, int(seed)) for k in k_values for seed in seeds]
+        restarts = run_parallel(_kmeans_restart_task, tasks, self.data, n_jobs)
+        
+        best = {}
+        for k, inertia, labels in restarts:
+            if k not in best or inertia < best[k][0]:
+                best[k] = (inertia, labels)
+        
+        metric_tasks = [(k, best[k][0], best[k][1], with_silhouette) for k in k_values]
+        return run_parallel(_sweep_metrics_task, metric_tasks, self.data, n_jobs)
+    
+    def fit_kmeans(self, n_clusters: int, n_init: int = 10, engine: str = None) -> np.ndarray:
         """
         K-Means kümeleme uygula.
         
         Args:
             n_clusters: Küme sayısı
             n_init: Farklı başlangıç merkez sayısı
+            engine: 'full' veya 'minibatch' (None ise self.kmeans_engine,
+                bkz. `from_config`)
             
         Returns:
             Küme etiketleri
@@ -129,6 +625,18 @@ class ClusteringAnalyzer:
         if self.data is None:
             raise ValueError("Veri seti yüklenmedi!")
         
+        engine = engine or self.kmeans_engine
+        if engine == 'minibatch':
+            return self.fit_minibatch_kmeans(n_clusters, **self.minibatch_params)
+        if engine != 'full':
+            raise ValueError(f"Bilinmeyen K-Means motoru: {engine}")
+        
+        key = self._cache_key('kmeans', n_clusters=n_clusters, n_init=n_init, max_iter=300)
+        if self._restore_fit(key):
+            print(f"✓ K-Means sonucu önbellekten yüklendi (K={n_clusters})")
+            self._print_cluster_distribution()
+            return self.labels
+        
         self.n_clusters = n_clusters
         self.model = KMeans(
             n_clusters=n_clusters, 
@@ -138,12 +646,150 @@ class ClusteringAnalyzer:
         )
         self.labels = self.model.fit_predict(self.data)
         self.cluster_centers = self.model.cluster_centers_
+        self._model_labels = self.labels
+        self._store_fit(key)
         
         print(f"✓ K-Means kümeleme tamamlandı (K={n_clusters})")
         self._print_cluster_distribution()
         
         return self.labels
     
+    def fit_minibatch_kmeans(self,
+                             n_clusters: int,
+                             batch_size: int = 4096,
+                             max_epochs: int = 10,
+                             chunk_size: int = 100_000,
+                             gap_sample_size: int = 10_000) -> np.ndarray:
+        """
+        Mini-batch K-Means uygula (büyük ve bellek eşlemli veriler için).
+        
+        Veri `chunk_size` satırlık parçalar halinde okunur ve her parça
+        `batch_size` boyutlu mini partilerle `partial_fit` edilir; bellek
+        eşlemli (memmap) veri hiçbir zaman tamamen belleğe alınmaz. Eğitim
+        sonunda tam K-Means ile inertia farkı bir örnek üzerinde ölçülür
+        (bkz. `kmeans_inertia_gap`). `partial_fit` tek başlangıçla
+        başlatıldığından birden fazla başlangıç (n_init) desteklenmez.
+        
+        Args:
+            n_clusters: Küme sayısı
+            batch_size: Mini parti boyutu
+            max_epochs: Veri üzerinden geçiş sayısı
+            chunk_size: Parça başına satır sayısı
+            gap_sample_size: İnertia farkı için örnek boyutu (0 ise ölçülmez)
+            
+        Returns:
+            Küme etiketleri
+        """
+        if self.data is None:
+            raise ValueError("Veri seti yüklenmedi!")
+        
+        n_samples = len(self.data)
+        rng = np.random.RandomState(self.random_state)
+        
+        self.n_clusters = n_clusters
+        self.model = MiniBatchKMeans(
+            n_clusters=n_clusters,
+            batch_size=batch_size,
+            random_state=self.random_state,
+            n_init=1  # partial_fit her durumda tek başlangıç kullanır
+        )
+        
+        # Parça sırası her geçişte karıştırılır; parça içi mini partiler
+        # ardışık satırlardan oluşur
+        chunk_starts = np.arange(0, n_samples, chunk_size)
+        for _ in range(max_epochs):
+            for start in rng.permutation(chunk_starts):
+                chunk = np.asarray(self.data[start:start + chunk_size], dtype=np.float64)
+                order = rng.permutation(len(chunk))
+                for batch_start in range(0, len(chunk), batch_size):
+                    batch = chunk[order[batch_start:batch_start + batch_size]]
+                    # İlk adım (başlatma) en az n_clusters satır gerektirir
+                    if len(batch) >= n_clusters or hasattr(self.model, 'cluster_centers_'):
+                        self.model.partial_fit(batch)
+        
+        self.cluster_centers = self.model.cluster_centers_
+        self.labels, inertia = self._assign_in_chunks(self.cluster_centers, chunk_size)
+        self._model_labels = self.labels
+        self.model.inertia_ = inertia
+        
+        print(f"✓ Mini-batch K-Means kümeleme tamamlandı (K={n_clusters}, {max_epochs} geçiş)")
+        self._print_cluster_distribution()
+        
+        if gap_sample_size:
+            gap = self.kmeans_inertia_gap(sample_size=gap_sample_size)
+            print(f"  Tam K-Means'e göre inertia farkı (örnek n={gap['orneklem']}): "
+                  f"%{gap['fark_yuzde']:.2f}")
+        
+        return self.labels
+    
+    def partial_fit_kmeans(self, new_data: np.ndarray) -> np.ndarray:
+        """
+        Eğitilmiş mini-batch K-Means modelini yeni satırlarla güncelle.
+        
+        Akış halinde gelen yeni satırlar için merkezler tek bir mini-batch
+        adımıyla güncellenir; tüm veri yeniden eğitilmez.
+        
+        Args:
+            new_data: Yeni satırlar (aynı ölçekte normalize edilmiş)
+            
+        Returns:
+            Yeni satırların küme etiketleri
+        """
+        if not isinstance(self.model, MiniBatchKMeans):
+            raise ValueError("Önce fit_minibatch_kmeans() ile model eğitilmeli!")
+        
+        new_data = np.asarray(new_data, dtype=np.float64)
+        self.model.partial_fit(new_data)
+        self.cluster_centers = self.model.cluster_centers_
+        
+        return self.model.predict(new_data)
+    
+    def kmeans_inertia_gap(self, sample_size: int = 10_000, n_init: int = 10) -> Dict:
+        """
+        Mevcut K-Means merkezlerinin, aynı örnek üzerinde eğitilen tam
+        K-Means'e göre inertia farkını ölç.
+        
+        Args:
+            sample_size: Örnek boyutu
+            n_init: Tam K-Means başlangıç sayısı
+            
+        Returns:
+            'orneklem', 'mevcut_inertia', 'tam_kmeans_inertia', 'fark_yuzde'
+        """
+        if self.cluster_centers is None:
+            raise ValueError("Önce K-Means modeli eğitilmeli!")
+        
+        n_samples = len(self.data)
+        rng = np.random.RandomState(self.random_state)
+        if sample_size < n_samples:
+            idx = np.sort(rng.choice(n_samples, sample_size, replace=False))
+            sample = np.asarray(self.data[idx], dtype=np.float64)
+        else:
+            sample = np.asarray(self.data, dtype=np.float64)
+        
+        current = float(cdist(sample, self.cluster_centers, 'sqeuclidean').min(axis=1).sum())
+        full = KMeans(n_clusters=len(self.cluster_centers), random_state=self.random_state,
+                      n_init=n_init).fit(sample).inertia_
+        
+        return {
+            'orneklem': len(sample),
+            'mevcut_inertia': current,
+            'tam_kmeans_inertia': full,
+            'fark_yuzde': (current - full) / full * 100 if full > 0 else 0.0
+        }
+    
+    def _assign_in_chunks(self, centers: np.ndarray, chunk_size: int) -> Tuple[np.ndarray, float]:
+        """Satırları parça parça en yakın merkeze ata; etiketler ve inertia döndür."""
+        n_samples = len(self.data)
+        labels = np.empty(n_samples, dtype=np.int32)
+        inertia = 0.0
+        for start in range(0, n_samples, chunk_size):
+            chunk = np.asarray(self.data[start:start + chunk_size], dtype=np.float64)
+            distances = cdist(chunk, centers, 'sqeuclidean')
+            labels[start:start + len(chunk)] = distances.argmin(axis=1)
+            inertia += float(distances.min(axis=1).sum())
+        return labels, inertia
+    
     def fit_hierarchical(self, 
                         n_clusters: int,
                         linkage_method: str = 'ward',
@@ -162,7 +808,15 @@ class ClusteringAnalyzer:
         if self.data is None:
             raise ValueError("Veri seti yüklenmedi!")
         
+        key = self._cache_key('hierarchical', n_clusters=n_clusters, linkage=linkage_method,
+                              metric=distance_metric)
+        if self._restore_fit(key):
+            print(f"✓ Hiyerarşik kümeleme sonucu önbellekten yüklendi (K={n_clusters}, {linkage_method})")
+            self._print_cluster_distribution()
+            return self.labels
+        
         self.n_clusters = n_clusters
+        self.cluster_centers = None
         
         # Ward linkage sadece Euclidean ile çalışır
         if linkage_method == 'ward':
@@ -177,12 +831,57 @@ class ClusteringAnalyzer:
                 metric=distance_metric
             )
         self.labels = self.model.fit_predict(self.data)
+        self._model_labels = self.labels
+        self._store_fit(key)
         
         print(f"✓ Hiyerarşik kümeleme tamamlandı (K={n_clusters}, {linkage_method})")
         self._print_cluster_distribution()
         
         return self.labels
     
+    def fit_regionalization(self,
+                            n_clusters: int,
+                            connectivity,
+                            linkage_method: str = 'ward') -> np.ndarray:
+        """
+        Komşuluk kısıtlı hiyerarşik kümeleme (bölgeselleştirme) uygula.
+        
+        Birleşmeler yalnızca komşuluk grafiğinde kenarı olan kümeler
+        arasında yapılır; bağlantılı bir grafikte her küme mekânsal olarak
+        bitişiktir. Aday birleşme sayısı kenar sayısıyla sınırlı olduğundan
+        süre ve bellek n ile yaklaşık doğrusal artar.
+        
+        Args:
+            n_clusters: Küme (bölge) sayısı
+            connectivity: n×n seyrek komşuluk matrisi (bkz.
+                `spatial.build_adjacency_matrix`)
+            linkage_method: Bağlantı yöntemi ('ward', 'complete', 'average', 'single')
+            
+        Returns:
+            Küme etiketleri
+        """
+        if self.data is None:
+            raise ValueError("Veri seti yüklenmedi!")
+        if connectivity.shape != (len(self.data), len(self.data)):
+            raise ValueError("Komşuluk matrisi boyutu veri satır sayısıyla uyuşmuyor!")
+        
+        self.n_clusters = n_clusters
+        self.cluster_centers = None
+        self.model = AgglomerativeClustering(
+            n_clusters=n_clusters,
+            linkage=linkage_method,
+            connectivity=connectivity
+        )
+        self.labels = self.model.fit_predict(self.data)
+        self._model_labels = self.labels
+        
+        report = contiguity_report(self.labels, connectivity)
+        print(f"✓ Bölgeselleştirme tamamlandı (K={n_clusters}, {linkage_method}, "
+              f"{report['bitisik'].sum()}/{len(report)} küme bitişik)")
+        self._print_cluster_distribution()
+        
+        return self.labels
+    
     def fit_dbscan(self, eps: float = 0.5, min_samples: int = 5) -> np.ndarray:
         """
         DBSCAN kümeleme uygula.
@@ -197,8 +896,10 @@ class ClusteringAnalyzer:
         if self.data is None:
             raise ValueError("Veri seti yüklenmedi!")
         
+        self.cluster_centers = None
         self.model = DBSCAN(eps=eps, min_samples=min_samples)
         self.labels = self.model.fit_predict(self.data)
+        self._model_labels = self.labels
         
         n_clusters = len(set(self.labels)) - (1 if -1 in self.labels else 0)
         n_noise = list(self.labels).count(-1)
@@ -211,12 +912,173 @@ class ClusteringAnalyzer:
         
         return self.labels
     
-    def fit_gaussian_mixture(self, n_components: int) -> np.ndarray:
+    def dbscan_k_distances(self, min_samples_values: List[int] = (3, 4, 5, 6)) -> pd.DataFrame:
+        """
+        DBSCAN eps seçimi için k-uzaklık eğrilerini hesapla.
+        
+        Her min_samples için her noktanın (kendisi dahil) min_samples. en
+        yakın komşusuna uzaklığı küçükten büyüğe sıralanır. Tüm eğriler tek
+        bir KD-ağacı sorgusundan çıkarılır.
+        
+        Args:
+            min_samples_values: min_samples değerleri
+            
+        Returns:
+            Her sütunu bir min_samples değerinin sıralı k-uzaklık eğrisi olan DataFrame
+        """
+        if self.data is None:
+            raise ValueError("Veri seti yüklenmedi!")
+        
+        min_samples_values = sorted(int(m) for m in min_samples_values)
+        max_neighbors = min(max(min_samples_values), len(self.data))
+        neighbors = NearestNeighbors(n_neighbors=max_neighbors).fit(self.data)
+        # İlk sütun noktanın kendisi (uzaklık 0); sklearn min_samples sayımıyla uyumlu
+        distances, _ = neighbors.kneighbors(self.data)
+        
+        return pd.DataFrame({
+            m: np.sort(distances[:, min(m, max_neighbors) - 1]) for m in min_samples_values
+        })
+    
+    def suggest_dbscan_eps(self, min_samples_values: List[int] = (3, 4, 5, 6)) -> pd.DataFrame:
+        """
+        k-uzaklık eğrilerinin dirsek noktasından eps öner.
+        
+        Dirsek, normalize edilmiş eğride ilk ve son noktayı birleştiren
+        doğruya en uzak noktadır.
+        
+        Args:
+            min_samples_values: min_samples değerleri
+            
+        Returns:
+            min_samples, eps_onerisi ve k-uzaklık çeyreklerini içeren DataFrame
+        """
+        curves = self.dbscan_k_distances(min_samples_values)
+        
+        rows = []
+        for min_samples, curve in curves.items():
+            values = curve.to_numpy()
+            span = values[-1] - values[0]
+            x = np.linspace(0.0, 1.0, len(values))
+            y = (values - values[0]) / span if span > 0 else np.zeros_like(values)
+            rows.append({
+                'min_samples': min_samples,
+                'eps_onerisi': values[np.argmax(x - y)],
+                'k_uzaklik_q25': np.quantile(values, 0.25),
+                'k_uzaklik_q50': np.quantile(values, 0.50),
+                'k_uzaklik_q90': np.quantile(values, 0.90)
+            })
+        
+        suggestions = pd.DataFrame(rows)
+        print("✓ DBSCAN eps önerileri (k-uzaklık dirseği):")
+        for _, row in suggestions.iterrows():
+            print(f"    min_samples={int(row['min_samples'])}: eps ≈ {row['eps_onerisi']:.3f}")
+        
+        return suggestions
+    
+    def get_radius_graph(self, radius: float) -> sparse.csr_matrix:
+        """
+        En az `radius` yarıçaplı komşuluk grafiğini döndür (önbellekli).
+        
+        Grafik veri seti başına bir kez (gerekirse daha büyük yarıçapla)
+        KD-ağacı ile kurulur; daha küçük eps değerleri bu grafiğin
+        süzülmesiyle elde edilir. Önbellek yalnızca `set_data` ile
+        geçersiz kılınır.
+        
+        Args:
+            radius: Gereken en büyük eps
+            
+        Returns:
+            Kendisi hariç uzaklık değerli CSR komşuluk grafiği
+        """
+        if self._radius_graph is not None and self._radius_graph[0] >= radius:
+            return self._radius_graph[1]
+        
+        neighbors = NearestNeighbors(radius=radius).fit(self.data)
+        graph = neighbors.radius_neighbors_graph(mode='distance', sort_results=True)
+        self._radius_graph = (radius, graph)
+        
+        print(f"✓ Komşuluk grafiği oluşturuldu (eps ≤ {radius:.3f}, {graph.nnz} kenar)")
+        return graph
+    
+    def sweep_dbscan(self,
+                     eps_values: List[float] = None,
+                     min_samples_values: List[int] = (3, 4, 5, 6),
+                     with_metrics: bool = True,
+                     silhouette_options: Dict = None) -> pd.DataFrame:
+        """
+        DBSCAN'i (eps, min_samples) ızgarasında tek komşuluk grafiğinden değerlendir.
+        
+        Grafik en büyük eps için bir kez kurulur (bkz. `get_radius_graph`).
+        Her eps için grafik uzaklığa göre süzülür; her min_samples için
+        çekirdek noktalar derece sayısından, kümeler çekirdek-çekirdek alt
+        grafiğinin bağlantılı bileşenlerinden bulunur ve sınır noktaları en
+        yakın çekirdek komşunun kümesine atanır. Veri yeniden sorgulanmaz.
+        Etiketler `dbscan_sweep_labels[(eps, min_samples)]` içinde saklanır.
+        
+        Izgara noktası başına tam silhouette O(n²) olduğundan büyük veride
+        taramanın süresini belirler; varsayılan olarak silhouette tabakalı
+        örneklemle tahmin edilir (bkz. `estimate_silhouette`).
+        
+        Args:
+            eps_values: eps değerleri (None ise k-uzaklık önerilerinin
+                0.5-1.5 katı aralığında 10 değer)
+            min_samples_values: min_samples değerleri
+            with_metrics: False ise kalite metrikleri hesaplanmaz (yalnızca
+                küme/gürültü sayıları)
+            silhouette_options: Silhouette hesap ayarları {'mode', 'sample_size',
+                'n_draws'} (None ise {'mode': 'sampled', 'sample_size': 2000,
+                'n_draws': 10}; 'exact' tam hesap yapar)
+            
+        Returns:
+            eps, min_samples, küme/gürültü sayıları ve (with_metrics=True ise)
+            kalite metriklerini içeren DataFrame
+        """
+        if self.data is None:
+            raise ValueError("Veri seti yüklenmedi!")
+        
+        min_samples_values = sorted(int(m) for m in min_samples_values)
+        if eps_values is None:
+            suggested = self.suggest_dbscan_eps(min_samples_values)['eps_onerisi']
+            eps_values = np.linspace(0.5 * suggested.min(), 1.5 * suggested.max(), 10)
+        eps_values = sorted(float(eps) for eps in eps_values)
+        
+        if silhouette_options is None:
+            silhouette_options = {'mode': 'sampled', 'sample_size': 2000, 'n_draws': 10}
+        
+        graph = self.get_radius_graph(eps_values[-1])
+        
+        self.dbscan_sweep_labels = {}
+        results = []
+        for eps in eps_values:
+            eps_graph = _filter_radius_graph(graph, eps)
+            for min_samples in min_samples_values:
+                labels = _dbscan_from_graph(eps_graph, min_samples)
+                self.dbscan_sweep_labels[(eps, min_samples)] = labels
+                
+                n_noise = int((labels == -1).sum())
+                row = {
+                    'eps': eps,
+                    'min_samples': min_samples,
+                    'n_clusters': int(labels.max()) + 1,
+                    'n_noise': n_noise,
+                    'noise_ratio': n_noise / len(labels)
+                }
+                if with_metrics:
+                    row.update(self._quality_scores(labels, silhouette_options))
+                results.append(row)
+        
+        sweep = pd.DataFrame(results)
+        print(f"✓ DBSCAN taraması tamamlandı ({len(sweep)} parametre çifti, tek komşuluk grafiği)")
+        
+        return sweep
+    
+    def fit_gaussian_mixture(self, n_components: int, covariance_type: str = 'full') -> np.ndarray:
         """
         Gaussian Mixture Model (GMM) uygula.
         
         Args:
             n_components: Bileşen sayısı
+            covariance_type: Kovaryans tipi ('full', 'tied', 'diag', 'spherical')
             
         Returns:
             Küme etiketleri
@@ -224,19 +1086,119 @@ class ClusteringAnalyzer:
         if self.data is None:
             raise ValueError("Veri seti yüklenmedi!")
         
+        key = self._cache_key('gmm', n_components=n_components, n_init=5,
+                              covariance_type=covariance_type)
+        if self._restore_fit(key):
+            print(f"✓ GMM sonucu önbellekten yüklendi (K={n_components})")
+            self._print_cluster_distribution()
+            return self.labels
+        
         self.n_clusters = n_components
+        self.cluster_centers = None
         self.model = GaussianMixture(
             n_components=n_components,
+            covariance_type=covariance_type,
             random_state=self.random_state,
             n_init=5
         )
         self.labels = self.model.fit_predict(self.data)
+        self._model_labels = self.labels
+        self._store_fit(key)
         
         print(f"✓ GMM kümeleme tamamlandı (K={n_components})")
         self._print_cluster_distribution()
         
         return self.labels
     
+    def select_gaussian_mixture(self,
+                                k_range: range = None,
+                                covariance_types: List[str] = None,
+                                n_init: int = 5,
+                                n_jobs: int = 1,
+                                patience: int = 2,
+                                bic_margin: float = 10.0) -> pd.DataFrame:
+        """
+        GMM bileşen sayısı ve kovaryans tipini BIC/AIC ile seç.
+        
+        (k, kovaryans tipi) ızgarası süreç havuzunda paralel eğitilir. k
+        değerleri dalgalar halinde ilerler; bir kovaryans tipi için BIC,
+        o ana kadarki en iyi değerin `bic_margin` kadar üstünde art arda
+        `patience` k boyunca kalırsa (BIC'in dibi geçilmiş sayılır) o tip
+        için daha büyük k denenmez. En düşük BIC'li model self.model olarak
+        atanır.
+        
+        Args:
+            k_range: Denenecek bileşen sayıları (None ise config.yaml clustering.k_range)
+            covariance_types: Kovaryans tipleri (None ise full, tied, diag, spherical)
+            n_init: Model başına başlangıç sayısı
+            n_jobs: Paralel süreç sayısı (1: seri)
+            patience: Erken durdurma için art arda kötüleşen k sayısı
+                (None ise erken durdurma yok)
+            bic_margin: Anlamlı kötüleşme eşiği (ΔBIC > 10 "çok güçlü kanıt")
+            
+        Returns:
+            covariance_type, k, bic, aic, log_likelihood, converged, n_iter ve
+            fit_seconds sütunlu DataFrame
+        """
+        if self.data is None:
+            raise ValueError("Veri seti yüklenmedi!")
+        
+        if k_range is None:
+            k_range = load_config().get('clustering', {}).get('k_range', list(range(2, 11)))
+        k_values = sorted(int(k) for k in k_range)
+        if covariance_types is None:
+            covariance_types = ['full', 'tied', 'diag', 'spherical']
+        
+        pending = {cov: list(k_values) for cov in covariance_types}
+        best_bic = {cov: np.inf for cov in covariance_types}
+        worse_streak = {cov: 0 for cov in covariance_types}
+        n_workers = resolve_n_jobs(n_jobs)
+        
+        results = []
+        best_model = None
+        while any(pending.values()):
+            # Her dalgada aktif tiplerin sıradaki k değerleri birlikte gönderilir
+            active = [cov for cov in covariance_types if pending[cov]]
+            wave = max(1, -(-n_workers // len(active)))
+            tasks = []
+            for cov in active:
+                for k in pending[cov][:wave]:
+                    tasks.append((k, cov, self.random_state, n_init))
+                pending[cov] = pending[cov][wave:]
+            
+            for row, model in run_parallel(_gmm_selection_task, tasks, self.data, n_jobs):
+                results.append(row)
+                cov = row['covariance_type']
+                if row['bic'] < best_bic[cov] - bic_margin:
+                    worse_streak[cov] = 0
+                elif row['bic'] > best_bic[cov] + bic_margin:
+                    worse_streak[cov] += 1
+                if row['bic'] < best_bic[cov]:
+                    best_bic[cov] = row['bic']
+                if best_model is None or row['bic'] < best_model[0]:
+                    best_model = (row['bic'], model)
+                if patience is not None and worse_streak[cov] >= patience and pending[cov]:
+                    print(f"  {cov}: BIC minimumu geçildi, K>{row['k']} atlandı")
+                    pending[cov] = []
+        
+        selection = pd.DataFrame(results).sort_values(['covariance_type', 'k']).reset_index(drop=True)
+        
+        self.model = best_model[1]
+        self.n_clusters = self.model.n_components
+        self.cluster_centers = None
+        self.labels = self.model.predict(self.data)
+        self._model_labels = self.labels
+        
+        best = selection.loc[selection['bic'].idxmin()]
+        print(f"✓ GMM model seçimi tamamlandı ({len(selection)} model, "
+              f"{selection['fit_seconds'].sum():.1f} sn toplam eğitim)")
+        print(f"  En iyi BIC: K={best['k']}, {best['covariance_type']} (BIC={best['bic']:.1f})")
+        print(f"  En iyi AIC: K={selection.loc[selection['aic'].idxmin(), 'k']}, "
+              f"{selection.loc[selection['aic'].idxmin(), 'covariance_type']}")
+        self._print_cluster_distribution()
+        
+        return selection
+    
     def _print_cluster_distribution(self):
         """Küme dağılımını yazdır."""
         if self.labels is None:
@@ -247,12 +1209,34 @@ class ClusteringAnalyzer:
         for cluster, count in zip(unique, counts):
             print(f"    Küme {cluster}: {count} il ({count/len(self.labels)*100:.1f}%)")
     
-    def get_linkage_matrix(self, method: str = 'ward') -> np.ndarray:
+    def get_linkage_matrix(self,
+                           method: str = 'ward',
+                           engine: str = None,
+                           memory_budget_mb: float = None,
+                           n_neighbors: int = None) -> np.ndarray:
         """
         Dendrogram için linkage matrisini hesapla.
         
+        Motorlar:
+        - 'exact': scipy `linkage` (float64 yoğun uzaklık dizisi, ~8·n² byte)
+        - 'nn_chain': Ward için merkez tabanlı en yakın komşu zinciri; uzaklık
+          matrisi tutulmaz, bellek O(n·d), sonuç tam Ward ile aynıdır
+        - 'float32': 'single', 'complete', 'average', 'weighted' için float32
+          sıkıştırılmış uzaklık dizisi üzerinde en yakın komşu zinciri (~2·n² byte)
+        - 'knn': 'ward', 'complete', 'average', 'single' için k-en yakın komşu
+          bağlantı grafiğiyle sınırlandırılmış yaklaşık ağaç (bellek O(n·k));
+          yükseklikler monoton hale getirilir
+        - 'auto': bütçeye sığan ilk motor (exact → nn_chain/float32 → knn);
+          hiçbiri uygun değilse ValueError
+        
+        Tüm motorlar scipy uyumlu (n-1)×4 linkage matrisi döndürür;
+        `cut_dendrogram` ve `plot_dendrogram` ile kullanılabilir.
+        
         Args:
             method: Linkage yöntemi
+            engine: Motor adı (None ise self.linkage_params['engine'] veya 'auto')
+            memory_budget_mb: 'auto' için bellek bütçesi (MB)
+            n_neighbors: 'knn' motorunda komşu sayısı
             
         Returns:
             Linkage matrisi
@@ -260,7 +1244,43 @@ class ClusteringAnalyzer:
         if self.data is None:
             raise ValueError("Veri seti yüklenmedi!")
         
-        return linkage(self.data, method=method)
+        engine = engine or self.linkage_params.get('engine', 'auto')
+        if memory_budget_mb is None:
+            memory_budget_mb = self.linkage_params.get('memory_budget_mb', 1024)
+        if n_neighbors is None:
+            n_neighbors = self.linkage_params.get('n_neighbors', 15)
+        
+        n_samples = len(self.data)
+        if engine == 'auto':
+            budget = memory_budget_mb * 1024**2
+            # scipy uzaklık dizisini ve çalışma kopyasını float64 tutar
+            if 8.0 * n_samples * (n_samples - 1) <= budget:
+                engine = 'exact'
+            elif method == 'ward':
+                engine = 'nn_chain'
+            elif method in _CONDENSED_LINKAGES and 2.0 * n_samples * (n_samples - 1) <= budget:
+                engine = 'float32'
+            elif method in _KNN_LINKAGES:
+                engine = 'knn'
+            else:
+                raise ValueError(f"'{method}' yöntemi bellek bütçesine sığmıyor ve knn motoru "
+                                 f"bu yöntemi desteklemiyor!")
+        
+        if engine == 'exact':
+            return linkage(self.data, method=method)
+        if engine == 'nn_chain':
+            if method != 'ward':
+                raise ValueError("nn_chain motoru yalnızca 'ward' için kullanılabilir!")
+            return _nn_chain_ward(self.data)
+        if engine == 'float32':
+            if method not in _CONDENSED_LINKAGES:
+                raise ValueError(f"float32 motoru '{method}' yöntemini desteklemiyor!")
+            return _nn_chain_condensed(_condensed_distances(self.data), n_samples, method)
+        if engine == 'knn':
+            if method not in _KNN_LINKAGES:
+                raise ValueError(f"knn motoru '{method}' yöntemini desteklemiyor!")
+            return _knn_linkage(self.data, method, n_neighbors)
+        raise ValueError(f"Bilinmeyen linkage motoru: {engine}")
     
     def cut_dendrogram(self, 
                       linkage_matrix: np.ndarray,
@@ -287,18 +1307,155 @@ class ClusteringAnalyzer:
         # 1-indexed'den 0-indexed'e çevir
         self.labels = self.labels - 1
         self.n_clusters = len(np.unique(self.labels))
+        # Etiketler artık önceki modelden gelmiyor; atama medoidlerle yapılır
+        self.model = None
+        self.cluster_centers = None
+        self._model_labels = None
         
         return self.labels
     
-    def evaluate(self, labels: np.ndarray = None) -> Dict:
+    def predict(self, new_data: np.ndarray, chunk_size: int = 100_000) -> np.ndarray:
+        """
+        Yeni satırları eğitilmiş kümelemeye ata (yeniden eğitim yapılmaz).
+        
+        Args:
+            new_data: Yeni satırlar (eğitim verisiyle aynı ölçekte normalize edilmiş)
+            chunk_size: Parça başına satır sayısı
+            
+        Returns:
+            Küme etiketleri
+        """
+        return self.assign(new_data, chunk_size)['labels']
+    
+    def assign(self, new_data: np.ndarray, chunk_size: int = 100_000) -> Dict[str, np.ndarray]:
+        """
+        Yeni satırları eğitilmiş kümelemeye ata; etiketlerle birlikte uzaklık
+        ve marjları döndür.
+        
+        - K-Means / mini-batch K-Means: en yakın merkez
+        - GMM: sonsal (posterior) olasılıkların en büyüğü
+        - Hiyerarşik ve diğerleri: mevcut etiketlerin küme medoidlerinden
+          en yakını (DBSCAN gürültü noktaları medoid hesabına girmez)
+        
+        Merkez/olasılık yolu yalnızca self.labels modelin ürettiği etiketlerse
+        kullanılır; etiketler başka yoldan değiştiyse (ör. `cut_dendrogram`)
+        mevcut etiketlerin medoidleri kullanılır.
+        
+        Satırlar `chunk_size` parçalar halinde işlenir; bellek kullanımı
+        parça boyutuyla sınırlıdır.
+        
+        Args:
+            new_data: Yeni satırlar (eğitim verisiyle aynı ölçekte normalize edilmiş)
+            chunk_size: Parça başına satır sayısı
+            
+        Returns:
+            Dictionary:
+            - 'labels': Küme etiketleri
+            - 'distances': Atanan merkeze/medoide Öklid uzaklığı (GMM'de yok)
+            - 'margins': Merkez/medoid tabanlı atamada ikinci en yakına uzaklık
+              ile en yakına uzaklık farkı; GMM'de en yüksek iki olasılık farkı
+            - 'probabilities': n×k sonsal olasılıklar (yalnızca GMM)
+        """
+        if self.labels is None or self.data is None:
+            raise ValueError("Önce bir kümeleme modeli eğitilmeli!")
+        
+        new_data = np.asarray(new_data)
+        if new_data.ndim == 1:
+            new_data = new_data.reshape(1, -1)
+        if new_data.shape[1] != self.data.shape[1]:
+            raise ValueError(f"Özellik sayısı uyuşmuyor: {new_data.shape[1]} != {self.data.shape[1]}")
+        
+        n_samples = len(new_data)
+        model_current = self.model is not None and self._model_labels is self.labels
+        
+        if model_current and isinstance(self.model, GaussianMixture):
+            probabilities = np.empty((n_samples, self.model.n_components))
+            for start in range(0, n_samples, chunk_size):
+                chunk = np.asarray(new_data[start:start + chunk_size], dtype=np.float64)
+                probabilities[start:start + len(chunk)] = self.model.predict_proba(chunk)
+            if probabilities.shape[1] > 1:
+                top_two = np.partition(probabilities, -2, axis=1)[:, -2:]
+                margins = top_two[:, 1] - top_two[:, 0]
+            else:
+                margins = np.ones(n_samples)
+            return {
+                'labels': probabilities.argmax(axis=1),
+                'margins': margins,
+                'probabilities': probabilities
+            }
+        
+        if (model_current and isinstance(self.model, (KMeans, MiniBatchKMeans))
+                and self.cluster_centers is not None):
+            references = self.cluster_centers
+            reference_labels = np.arange(len(references))
+        else:
+            reference_labels, references = self._cluster_medoids()
+        
+        labels = np.empty(n_samples, dtype=np.int64)
+        distances = np.empty(n_samples)
+        margins = np.full(n_samples, np.inf)
+        for start in range(0, n_samples, chunk_size):
+            chunk = np.asarray(new_data[start:start + chunk_size], dtype=np.float64)
+            squared = cdist(chunk, references, 'sqeuclidean')
+            rows = np.arange(len(chunk))
+            nearest = squared.argmin(axis=1)
+            best = squared[rows, nearest]
+            squared[rows, nearest] = np.inf
+            
+            end = start + len(chunk)
+            labels[start:end] = reference_labels[nearest]
+            distances[start:end] = np.sqrt(best)
+            if len(references) > 1:
+                margins[start:end] = np.sqrt(squared.min(axis=1)) - distances[start:end]
+        
+        return {'labels': labels, 'distances': distances, 'margins': margins}
+    
+    def _cluster_medoids(self, chunk_size: int = 2048) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mevcut etiketler için küme medoidlerini hesapla (önbellekli).
+        
+        Medoid, küme içi diğer üyelere Öklid uzaklıkları toplamı en küçük
+        olan üyedir; uzaklıklar satır parçaları halinde hesaplanır.
+        
+        Returns:
+            (Küme etiketleri, medoid satırları) tuple
+        """
+        if self._medoid_cache is not None and self._medoid_cache[0] is self.labels:
+            return self._medoid_cache[1], self._medoid_cache[2]
+        
+        clusters = np.unique(self.labels[self.labels != -1])
+        medoids = np.empty((len(clusters), self.data.shape[1]))
+        for i, cluster in enumerate(clusters):
+            members = np.asarray(self.data[self.labels == cluster], dtype=np.float64)
+            totals = np.empty(len(members))
+            for start in range(0, len(members), chunk_size):
+                totals[start:start + chunk_size] = cdist(members[start:start + chunk_size], members).sum(axis=1)
+            medoids[i] = members[totals.argmin()]
+        
+        self._medoid_cache = (self.labels, clusters, medoids)
+        return clusters, medoids
+    
+    def evaluate(self,
+                 labels: np.ndarray = None,
+                 silhouette_mode: str = 'exact',
+                 sample_size: int = 2000,
+                 n_draws: int = 10,
+                 confidence: float = 0.95) -> Dict:
         """
         Kümeleme performansını değerlendir.
         
         Args:
             labels: Değerlendirilecek etiketler (None ise self.labels kullanılır)
+            silhouette_mode: 'exact' (tam, O(n²)), 'sampled' (kümeye göre
+                tabakalı, tekrarlı örneklem) veya 'centroid' (merkez tabanlı
+                basitleştirilmiş silhouette, O(n·k)); bkz. `estimate_silhouette`
+            sample_size: 'sampled' modunda çekiliş başına örnek boyutu
+            n_draws: 'sampled' modunda çekiliş sayısı
+            confidence: Güven aralığı düzeyi
             
         Returns:
-            Değerlendirme metrikleri dictionary
+            Değerlendirme metrikleri dictionary (yaklaşık modlarda ayrıca
+            'silhouette_ci_low' ve 'silhouette_ci_high')
         """
         if labels is None:
             labels = self.labels
@@ -306,6 +1463,34 @@ class ClusteringAnalyzer:
         if labels is None or self.data is None:
             raise ValueError("Etiketler veya veri eksik!")
         
+        key = None
+        if self.result_cache is not None:
+            key = self._cache_key('evaluate', labels=array_hash(np.asarray(labels)),
+                                  silhouette_mode=silhouette_mode, sample_size=sample_size,
+                                  n_draws=n_draws, confidence=confidence)
+        metrics = self.result_cache.get(key) if key is not None else None
+        if metrics is None:
+            metrics = self._compute_metrics(labels, silhouette_mode, sample_size,
+                                            n_draws, confidence)
+            if key is not None:
+                self.result_cache.set(key, metrics)
+        metrics = dict(metrics)
+        
+        # Inertia (sadece K-Means için)
+        if hasattr(self.model, 'inertia_'):
+            metrics['inertia'] = self.model.inertia_
+        
+        self.evaluation_results = metrics
+        
+        return metrics
+    
+    def _compute_metrics(self,
+                         labels: np.ndarray,
+                         silhouette_mode: str,
+                         sample_size: int,
+                         n_draws: int,
+                         confidence: float) -> Dict:
+        """Kalite ve küme başına silhouette metriklerini hesapla (bkz. `evaluate`)."""
         # Gürültü noktalarını (-1) filtrele
         mask = labels != -1
         if mask.sum() < len(labels):
@@ -314,12 +1499,25 @@ class ClusteringAnalyzer:
         else:
             filtered_data = self.data
             filtered_labels = labels
+            mask = None
         
         metrics = {}
         
+        estimate = None
+        if silhouette_mode != 'exact' and len(np.unique(filtered_labels)) > 1:
+            estimate = self.estimate_silhouette(
+                filtered_labels, mode=silhouette_mode, sample_size=sample_size,
+                n_draws=n_draws, confidence=confidence, mask=mask
+            )
+        
         # Silhouette Score
         if len(np.unique(filtered_labels)) > 1:
-            metrics['silhouette_score'] = silhouette_score(filtered_data, filtered_labels)
+            if estimate is None:
+                metrics['silhouette_score'] = self._silhouette(filtered_labels, mask)
+            else:
+                metrics['silhouette_score'] = estimate['silhouette']
+                metrics['silhouette_ci_low'] = estimate['ci_low']
+                metrics['silhouette_ci_high'] = estimate['ci_high']
             metrics['calinski_harabasz'] = calinski_harabasz_score(filtered_data, filtered_labels)
             metrics['davies_bouldin'] = davies_bouldin_score(filtered_data, filtered_labels)
         else:
@@ -328,21 +1526,61 @@ class ClusteringAnalyzer:
             metrics['davies_bouldin'] = float('inf')
         
         # Küme başına metrikler
-        sample_silhouettes = silhouette_samples(filtered_data, filtered_labels)
-        cluster_silhouettes = {}
-        for cluster in np.unique(filtered_labels):
-            cluster_mask = filtered_labels == cluster
-            cluster_silhouettes[f'cluster_{cluster}_silhouette'] = sample_silhouettes[cluster_mask].mean()
+        if estimate is None:
+            sample_silhouettes = self._silhouette_samples(filtered_labels, mask)
+            cluster_silhouettes = {}
+            for cluster in np.unique(filtered_labels):
+                cluster_mask = filtered_labels == cluster
+                cluster_silhouettes[f'cluster_{cluster}_silhouette'] = sample_silhouettes[cluster_mask].mean()
+        else:
+            cluster_silhouettes = {f'cluster_{cluster}_silhouette': value
+                                   for cluster, value in estimate['per_cluster'].items()}
         
         metrics.update(cluster_silhouettes)
         
-        # Inertia (sadece K-Means için)
-        if hasattr(self.model, 'inertia_'):
-            metrics['inertia'] = self.model.inertia_
+        return metrics
+    
+    def estimate_silhouette(self,
+                            labels: np.ndarray = None,
+                            mode: str = 'sampled',
+                            sample_size: int = 2000,
+                            n_draws: int = 10,
+                            confidence: float = 0.95,
+                            mask: np.ndarray = None) -> Dict:
+        """
+        Büyük n için yaklaşık silhouette hesapla.
         
-        self.evaluation_results = metrics
+        'sampled': Her çekilişte kümelerden boyutlarıyla orantılı (tabakalı)
+        örnek alınır ve örnek üzerinde silhouette hesaplanır; çekilişlerin
+        ortalaması ve t dağılımına dayalı güven aralığı raporlanır. Maliyet
+        n'den bağımsız olarak O(n_draws · sample_size²) ile sınırlıdır.
         
-        return metrics
+        'centroid': Basitleştirilmiş silhouette; a(i) kendi küme merkezine,
+        b(i) en yakın diğer küme merkezine uzaklıktır. O(n·k). Örnekleme
+        yapılmadığı için güven aralığı tanımsızdır (ci_low/ci_high NaN).
+        
+        Args:
+            labels: Küme etiketleri (None ise self.labels)
+            mode: 'sampled' veya 'centroid'
+            sample_size: Çekiliş başına örnek boyutu
+            n_draws: Çekiliş sayısı
+            confidence: Güven aralığı düzeyi
+            mask: Verinin hangi satırlarının etiketlere karşılık geldiği
+            
+        Returns:
+            'silhouette', 'ci_low', 'ci_high' ve 'per_cluster' ({küme: değer})
+        """
+        if labels is None:
+            labels = self.labels
+        labels = np.asarray(labels)
+        data = self.data if mask is None else self.data[mask]
+        
+        if mode == 'centroid':
+            return _centroid_silhouette(data, labels)
+        if mode == 'sampled':
+            return _sampled_silhouette(data, labels, sample_size, n_draws,
+                                       confidence, self.random_state)
+        raise ValueError(f"Bilinmeyen silhouette modu: {mode}")
     
     def get_cluster_profiles(self, 
                             df: pd.DataFrame,
@@ -362,15 +1600,16 @@ class ClusteringAnalyzer:
         if labels is None:
             labels = self.labels
         
-        df_with_clusters = df.copy()
-        df_with_clusters['kume'] = labels
-        
-        # Küme ortalamaları
-        profiles = df_with_clusters.groupby('kume')[feature_columns].mean()
-        
-        # Küme boyutları
-        cluster_sizes = df_with_clusters['kume'].value_counts().sort_index()
-        profiles['il_sayisi'] = cluster_sizes
+        # Etiketler DataFrame'e kopyalanıp yazılmak yerine yan dizi olarak verilir
+        with track_peak_memory(self.memory_profile, 'kume_profilleri', self.track_memory):
+            kume = pd.Series(np.asarray(labels), index=df.index, name='kume')
+            grouped = df[feature_columns].groupby(kume)
+            
+            # Küme ortalamaları
+            profiles = grouped.mean()
+            
+            # Küme boyutları
+            profiles['il_sayisi'] = grouped.size()
         
         return profiles
     
@@ -392,13 +1631,15 @@ class ClusteringAnalyzer:
         if labels is None:
             labels = self.labels
         
-        df_with_clusters = df.copy()
-        df_with_clusters['kume'] = labels
+        labels = np.asarray(labels)
+        if len(labels) != len(df):
+            raise ValueError("Etiket sayısı satır sayısıyla uyuşmuyor!")
         
-        members = {}
-        for cluster in sorted(df_with_clusters['kume'].unique()):
-            mask = df_with_clusters['kume'] == cluster
-            members[cluster] = df_with_clusters.loc[mask, id_column].tolist()
+        with track_peak_memory(self.memory_profile, 'kume_uyeleri', self.track_memory):
+            ids = df[id_column].to_numpy()
+            members = {}
+            for cluster in np.unique(labels):
+                members[cluster] = ids[labels == cluster].tolist()
         
         return members
     
@@ -426,72 +1667,599 @@ class ClusteringAnalyzer:
         
         return transformed, pca
     
-    def compare_algorithms(self, n_clusters: int) -> pd.DataFrame:
+    def compare_algorithms(self,
+                           n_clusters: int,
+                           algorithms: List[Dict] = None,
+                           n_jobs: int = 1,
+                           measure_memory: bool = False) -> pd.DataFrame:
         """
         Farklı kümeleme algoritmalarını karşılaştır.
         
         Args:
             n_clusters: Küme sayısı
+            algorithms: Algoritma tanımları listesi; her biri
+                {'name': ..., 'algorithm': ..., 'params': {...}} biçimindedir.
+                'algorithm' değerleri: 'kmeans', 'hierarchical', 'gmm', 'dbscan'
+                (None ise DEFAULT_COMPARISON_ALGORITHMS)
+            n_jobs: Eğitimler için paralel süreç sayısı (1: seri)
+            measure_memory: True ise tepe bellek, süre ölçümünden ayrı ikinci
+                bir eğitimle ölçülür; her algoritma iki kez eğitildiğinden
+                karşılaştırma süresi yaklaşık iki katına çıkar ve bu ek
+                eğitim fit_seconds'a dahil değildir (False ise peak_memory_mb NaN)
             
         Returns:
-            Karşılaştırma sonuçları DataFrame
+            Karşılaştırma sonuçları DataFrame (kalite metrikleri ile
+            fit_seconds, metric_seconds ve peak_memory_mb sütunları; önbellekten
+            dönen sonuçlarda süreler ilk çalıştırmaya aittir). Paylaşılan
+            uzaklık önbelleği zamanlanan döngüden önce kurulur; kurulum süresi
+            satırlara dağıtılmaz, `attrs['distance_cache_seconds']` içinde
+            ayrıca raporlanır.
         """
         if self.data is None:
             raise ValueError("Veri seti yüklenmedi!")
         
-        results = []
+        if algorithms is None:
+            algorithms = DEFAULT_COMPARISON_ALGORITHMS
         
-        # K-Means
-        kmeans = KMeans(n_clusters=n_clusters, random_state=self.random_state, n_init=10)
-        kmeans_labels = kmeans.fit_predict(self.data)
-        results.append({
-            'algoritma': 'K-Means',
-            'silhouette': silhouette_score(self.data, kmeans_labels),
-            'calinski_harabasz': calinski_harabasz_score(self.data, kmeans_labels),
-            'davies_bouldin': davies_bouldin_score(self.data, kmeans_labels)
-        })
+        key = self._cache_key('compare', n_clusters=n_clusters, algorithms=algorithms,
+                              measure_memory=measure_memory)
+        comparison_df = self.result_cache.get(key) if key is not None else None
+        if comparison_df is not None:
+            print("\nAlgoritma Karşılaştırması (önbellekten):")
+            print("=" * 70)
+            print(comparison_df.to_string(index=False))
+            print("=" * 70)
+            return comparison_df
         
-        # Hierarchical (Ward)
-        hier_ward = AgglomerativeClustering(n_clusters=n_clusters, linkage='ward')
-        hier_ward_labels = hier_ward.fit_predict(self.data)
-        results.append({
-            'algoritma': 'Hierarchical (Ward)',
-            'silhouette': silhouette_score(self.data, hier_ward_labels),
-            'calinski_harabasz': calinski_harabasz_score(self.data, hier_ward_labels),
-            'davies_bouldin': davies_bouldin_score(self.data, hier_ward_labels)
-        })
+        tasks = [(spec, n_clusters, self.random_state, measure_memory) for spec in algorithms]
+        fits = run_parallel(_compare_fit_task, tasks, self.data, n_jobs)
         
-        # Hierarchical (Complete)
-        hier_complete = AgglomerativeClustering(n_clusters=n_clusters, linkage='complete')
-        hier_complete_labels = hier_complete.fit_predict(self.data)
-        results.append({
-            'algoritma': 'Hierarchical (Complete)',
-            'silhouette': silhouette_score(self.data, hier_complete_labels),
-            'calinski_harabasz': calinski_harabasz_score(self.data, hier_complete_labels),
-            'davies_bouldin': davies_bouldin_score(self.data, hier_complete_labels)
-        })
+        # Önbellek ilk algoritmanın metric_seconds değerine eklenmesin
+        self.get_distance_matrix()
         
-        # GMM
-        gmm = GaussianMixture(n_components=n_clusters, random_state=self.random_state)
-        gmm_labels = gmm.fit_predict(self.data)
-        results.append({
-            'algoritma': 'Gaussian Mixture',
-            'silhouette': silhouette_score(self.data, gmm_labels),
-            'calinski_harabasz': calinski_harabasz_score(self.data, gmm_labels),
-            'davies_bouldin': davies_bouldin_score(self.data, gmm_labels)
-        })
+        results = []
+        for spec, (labels, fit_seconds, peak_mb) in zip(algorithms, fits):
+            metric_start = time.perf_counter()
+            scores = self._quality_scores(labels)
+            results.append({
+                'algoritma': spec['name'],
+                **scores,
+                'fit_seconds': fit_seconds,
+                'metric_seconds': time.perf_counter() - metric_start,
+                'peak_memory_mb': peak_mb
+            })
         
         comparison_df = pd.DataFrame(results)
+        comparison_df.attrs['distance_cache_seconds'] = self.distance_cache_seconds
+        if key is not None:
+            self.result_cache.set(key, comparison_df)
         
         print("\nAlgoritma Karşılaştırması:")
         print("=" * 70)
         print(comparison_df.to_string(index=False))
         print("=" * 70)
         print("Not: Silhouette ve CH yüksek, DB düşük olması iyidir.")
+        if self.distance_cache_seconds is not None:
+            print(f"Uzaklık önbelleği kurulumu: {self.distance_cache_seconds:.3f} sn "
+                  f"(metric_seconds'a dahil değil)")
         
         return comparison_df
 
 
+def _sampled_silhouette(data: np.ndarray,
+                        labels: np.ndarray,
+                        sample_size: int,
+                        n_draws: int,
+                        confidence: float,
+                        random_state: int) -> Dict:
+    """Kümeye göre tabakalı, tekrarlı örneklemle silhouette tahmini."""
+    rng = np.random.RandomState(random_state)
+    clusters, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    weights = counts / counts.sum()
+    members = [np.flatnonzero(inverse == i) for i in range(len(clusters))]
+    per_cluster_n = np.minimum(counts, np.maximum(2, np.round(weights * sample_size).astype(int)))
+    
+    draw_means = np.empty(n_draws)
+    draw_clusters = np.empty((n_draws, len(clusters)))
+    for draw in range(n_draws):
+        idx = np.concatenate([rng.choice(rows, size, replace=False)
+                              for rows, size in zip(members, per_cluster_n)])
+        sample_inverse = inverse[idx]
+        values = silhouette_samples(np.asarray(data[idx], dtype=np.float64), sample_inverse)
+        cluster_means = (np.bincount(sample_inverse, weights=values, minlength=len(clusters))
+                         / np.bincount(sample_inverse, minlength=len(clusters)))
+        draw_clusters[draw] = cluster_means
+        # Yuvarlama kaynaklı oran farklarını düzeltmek için küme ağırlıklı ortalama
+        draw_means[draw] = (weights * cluster_means).sum()
+    
+    mean = draw_means.mean()
+    if n_draws > 1:
+        half_width = (stats.t.ppf((1 + confidence) / 2, n_draws - 1)
+                      * draw_means.std(ddof=1) / np.sqrt(n_draws))
+    else:
+        half_width = np.nan
+    
+    return {
+        'silhouette': mean,
+        'ci_low': mean - half_width,
+        'ci_high': mean + half_width,
+        'per_cluster': dict(zip(clusters, draw_clusters.mean(axis=0)))
+    }
+
+
+def _centroid_silhouette(data: np.ndarray, labels: np.ndarray, chunk_size: int = 100_000) -> Dict:
+    """Merkez tabanlı basitleştirilmiş silhouette (O(n·k))."""
+    clusters, inverse = np.unique(labels, return_inverse=True)
+    n_clusters = len(clusters)
+    n_samples = len(labels)
+    
+    sums = np.zeros((n_clusters, data.shape[1]))
+    for start in range(0, n_samples, chunk_size):
+        chunk = np.asarray(data[start:start + chunk_size], dtype=np.float64)
+        np.add.at(sums, inverse[start:start + chunk_size], chunk)
+    counts = np.bincount(inverse, minlength=n_clusters)
+    centroids = sums / counts[:, None]
+    
+    values = np.empty(n_samples)
+    for start in range(0, n_samples, chunk_size):
+        chunk = np.asarray(data[start:start + chunk_size], dtype=np.float64)
+        own = inverse[start:start + chunk_size]
+        distances = cdist(chunk, centroids)
+        a = distances[np.arange(len(chunk)), own]
+        distances[np.arange(len(chunk)), own] = np.inf
+        b = distances.min(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            values[start:start + len(chunk)] = np.nan_to_num((b - a) / np.maximum(a, b))
+    
+    # sklearn ile uyumlu: tek elemanlı kümelerde silhouette 0
+    values[counts[inverse] == 1] = 0.0
+    per_cluster = np.bincount(inverse, weights=values, minlength=n_clusters) / counts
+    mean = values.mean()
+    
+    return {
+        'silhouette': mean,
+        # Deterministik yaklaşım: örnekleme belirsizliği yok, güven aralığı tanımsız
+        'ci_low': np.nan,
+        'ci_high': np.nan,
+        'per_cluster': dict(zip(clusters, per_cluster))
+    }
+
+
+def _kmeans_restarts(data: np.ndarray,
+                     n_clusters: int,
+                     n_init: int,
+                     random_state: int) -> Tuple[KMeans, int]:
+    """
+    K-Means'i n_init tek başlangıçlı eğitimle çalıştır; en düşük inertia'lı
+    modeli ve tüm başlangıçların toplam Lloyd iterasyonunu döndür.
+    
+    sklearn `n_iter_` yalnızca en iyi başlangıcın iterasyonunu raporlar;
+    iş miktarını karşılaştırmak için başlangıçlar ayrı eğitilir. Tohumlar
+    random_state'ten türetilir (aynı random_state ile aynı başlangıçlar).
+    """
+    seeds = np.random.RandomState(random_state).randint(np.iinfo(np.int32).max, size=n_init)
+    runs = [KMeans(n_clusters=n_clusters, random_state=int(seed), n_init=1).fit(data)
+            for seed in seeds]
+    best = min(runs, key=lambda model: model.inertia_)
+    return best, sum(model.n_iter_ for model in runs)
+
+
+def _split_worst_clusters(data: np.ndarray, centers: np.ndarray, n_clusters: int) -> np.ndarray:
+    """
+    Merkez sayısı n_clusters olana kadar kareler toplamı en yüksek kümeyi
+    birinci temel bileşeni boyunca ikiye böl.
+    """
+    centers = np.array(centers, dtype=np.float64)
+    while len(centers) < n_clusters:
+        distances = cdist(data, centers, 'sqeuclidean')
+        labels = distances.argmin(axis=1)
+        sse = np.bincount(labels, weights=distances.min(axis=1), minlength=len(centers))
+        worst = int(sse.argmax())
+        
+        members = data[labels == worst]
+        if len(members) < 2:
+            # Bölünecek küme yoksa merkezden en uzak noktayı yeni merkez yap
+            new_centers = [data[distances.min(axis=1).argmax()]]
+            centers = np.vstack([centers, new_centers])
+            continue
+        
+        centered = members - members.mean(axis=0)
+        _, singular_values, vt = np.linalg.svd(centered, full_matrices=False)
+        offset = vt[0] * singular_values[0] / np.sqrt(len(members))
+        
+        center = centers[worst].copy()
+        centers[worst] = center + offset
+        centers = np.vstack([centers, center - offset])
+    
+    return centers
+
+
+def _within_cluster_ss(data: np.ndarray, labels: np.ndarray) -> float:
+    """Küme içi kareler toplamını (inertia) vektörel hesapla."""
+    data = np.asarray(data, dtype=np.float64)
+    n_clusters = labels.max() + 1
+    counts = np.bincount(labels, minlength=n_clusters).astype(np.float64)
+    sums = np.zeros((n_clusters, data.shape[1]))
+    np.add.at(sums, labels, data)
+    nonempty = counts > 0
+    return float(np.einsum('ij,ij->', data, data)
+                 - (np.einsum('ij,ij->i', sums[nonempty], sums[nonempty]) / counts[nonempty]).sum())
+
+
+def _sweep_metrics_task(k: int,
+                        inertia: float,
+                        labels: np.ndarray,
+                        with_silhouette: bool = True) -> Dict:
+    """Paralel görev: verilen etiketler için k taraması metriklerini hesapla."""
+    data = get_shared_data()
+    return {
+        'k': k,
+        'inertia': inertia,
+        'silhouette': silhouette_score(data, labels) if with_silhouette else np.nan,
+        'calinski_harabasz': calinski_harabasz_score(data, labels),
+        'davies_bouldin': davies_bouldin_score(data, labels),
+        'labels': labels
+    }
+
+
+def _kmeans_sweep_task(k: int, random_state: int, n_init: int, with_silhouette: bool = True) -> Dict:
+    """Paralel görev: tek bir k için K-Means eğit ve metrikleri hesapla."""
+    data = get_shared_data()
+    kmeans = KMeans(n_clusters=k, random_state=random_state, n_init=n_init)
+    labels = kmeans.fit_predict(data)
+    return _sweep_metrics_task(k, kmeans.inertia_, labels, with_silhouette)
+
+
+def _kmeans_restart_task(k: int, seed: int) -> Tuple[int, float, np.ndarray]:
+    """Paralel görev: tek bir K-Means başlangıcını çalıştır."""
+    kmeans = KMeans(n_clusters=k, random_state=seed, n_init=1)
+    labels = kmeans.fit_predict(get_shared_data())
+    return k, kmeans.inertia_, labels
+
+
+def _build_estimator(algorithm: str, n_clusters: int, random_state: int, params: Dict):
+    """Algoritma adından kümeleme modelini oluştur."""
+    if algorithm == 'kmeans':
+        return KMeans(n_clusters=n_clusters, random_state=random_state, **params)
+    if algorithm == 'hierarchical':
+        return AgglomerativeClustering(n_clusters=n_clusters, **params)
+    if algorithm == 'gmm':
+        return GaussianMixture(n_components=n_clusters, random_state=random_state, **params)
+    if algorithm == 'dbscan':
+        return DBSCAN(**params)
+    raise ValueError(f"Bilinmeyen algoritma: {algorithm}")
+
+
+def _gmm_selection_task(k: int, covariance_type: str, random_state: int, n_init: int) -> Tuple[Dict, GaussianMixture]:
+    """Paralel görev: tek bir (k, kovaryans tipi) GMM'i eğit ve BIC/AIC hesapla."""
+    data = get_shared_data()
+    model = GaussianMixture(n_components=k, covariance_type=covariance_type,
+                            random_state=random_state, n_init=n_init)
+    start = time.perf_counter()
+    model.fit(data)
+    fit_seconds = time.perf_counter() - start
+    
+    row = {
+        'covariance_type': covariance_type,
+        'k': k,
+        'bic': model.bic(data),
+        'aic': model.aic(data),
+        'log_likelihood': model.score(data) * len(data),
+        'converged': model.converged_,
+        'n_iter': model.n_iter_,
+        'fit_seconds': fit_seconds
+    }
+    return row, model
+
+
+def _compare_fit_task(spec: Dict,
+                      n_clusters: int,
+                      random_state: int,
+                      measure_memory: bool) -> Tuple[np.ndarray, float, float]:
+    """
+    Paralel görev: bir algoritmayı eğit; etiket, süre ve tepe belleği döndür.
+    
+    tracemalloc her bellek ayırmayı izlediği için süreyi şişirir; süre
+    izlemesiz eğitimden, tepe bellek aynı parametrelerle yapılan ayrı bir
+    eğitimden ölçülür.
+    """
+    data = get_shared_data()
+    params = spec.get('params', {})
+    
+    model = _build_estimator(spec['algorithm'], n_clusters, random_state, params)
+    start = time.perf_counter()
+    labels = model.fit_predict(data)
+    fit_seconds = time.perf_counter() - start
+    
+    peak_mb = np.nan
+    if measure_memory:
+        memory = {}
+        model = _build_estimator(spec['algorithm'], n_clusters, random_state, params)
+        with track_peak_memory(memory, 'fit'):
+            model.fit_predict(data)
+        peak_mb = memory['fit']['tepe_mb']
+    
+    return np.asarray(labels), fit_seconds, peak_mb
+
+
+def _filter_radius_graph(graph: sparse.csr_matrix, eps: float) -> sparse.csr_matrix:
+    """Komşuluk grafiğinden uzaklığı eps'i aşan kenarları at (0 uzaklıklar korunur)."""
+    keep = graph.data <= eps
+    rows = np.repeat(np.arange(graph.shape[0]), np.diff(graph.indptr))
+    counts = np.bincount(rows[keep], minlength=graph.shape[0])
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+    return sparse.csr_matrix((graph.data[keep], graph.indices[keep], indptr), shape=graph.shape)
+
+
+def _dbscan_from_graph(graph: sparse.csr_matrix, min_samples: int) -> np.ndarray:
+    """
+    eps'e süzülmüş komşuluk grafiğinden DBSCAN etiketleri üret.
+    
+    Çekirdek nokta: kendisi dahil komşu sayısı >= min_samples (sklearn ile
+    aynı tanım). Sınır noktaları en yakın çekirdek komşuya atanır.
+    """
+    n_samples = graph.shape[0]
+    degrees = np.diff(graph.indptr) + 1
+    core = degrees >= min_samples
+    
+    labels = np.full(n_samples, -1, dtype=np.int64)
+    if not core.any():
+        return labels
+    
+    rows = np.repeat(np.arange(n_samples), np.diff(graph.indptr))
+    cols = graph.indices
+    
+    core_edges = core[rows] & core[cols]
+    core_graph = sparse.csr_matrix((np.ones(core_edges.sum()), (rows[core_edges], cols[core_edges])),
+                                   shape=graph.shape)
+    _, components = connected_components(core_graph, directed=False)
+    
+    # Bileşen kimliklerini çekirdek noktalar için 0..k-1'e sıkıştır
+    _, labels[core] = np.unique(components[core], return_inverse=True)
+    
+    border = ~core[rows] & core[cols]
+    if border.any():
+        border_rows, border_cols = rows[border], cols[border]
+        order = np.lexsort((graph.data[border], border_rows))
+        first = np.unique(border_rows[order], return_index=True)[1]
+        nearest = order[first]
+        labels[border_rows[nearest]] = labels[border_cols[nearest]]
+    
+    return labels
+
+
+def _merges_to_linkage(merges: List[Tuple[int, int, float]], n_samples: int) -> np.ndarray:
+    """
+    En yakın komşu zinciri birleşmelerini scipy linkage biçimine çevir.
+    
+    Birleşmeler yüksekliğe göre (kararlı) sıralanır ve küme kimlikleri
+    scipy kuralına göre (yeni küme n+i) union-find ile yeniden adlandırılır.
+    """
+    merges = sorted(merges, key=lambda merge: merge[2])
+    parent = np.arange(2 * n_samples - 1)
+    sizes = np.ones(2 * n_samples - 1, dtype=np.int64)
+    
+    def find(node):
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+    
+    linkage_matrix = np.empty((n_samples - 1, 4))
+    for i, (a, b, height) in enumerate(merges):
+        root_a, root_b = find(a), find(b)
+        new_id = n_samples + i
+        parent[root_a] = parent[root_b] = new_id
+        sizes[new_id] = sizes[root_a] + sizes[root_b]
+        linkage_matrix[i] = (min(root_a, root_b), max(root_a, root_b), height, sizes[new_id])
+    
+    return linkage_matrix
+
+
+def _nn_chain(n_samples: int, nearest_row, merge) -> List[Tuple[int, int, float]]:
+    """
+    Genel en yakın komşu zinciri (indirgenebilir bağlantılar için).
+    
+    Args:
+        n_samples: Gözlem sayısı
+        nearest_row: slot -> (aktif slotlara uzaklıklar, aktif slotlar)
+        merge: (kalan slot, silinen slot) birleşmesini uygulayan fonksiyon
+        
+    Returns:
+        (slot, slot, yükseklik) birleşme listesi
+    """
+    active = np.ones(n_samples, dtype=bool)
+    merges = []
+    chain = []
+    
+    while len(merges) < n_samples - 1:
+        if not chain:
+            chain.append(int(np.argmax(active)))
+        
+        while True:
+            x = chain[-1]
+            distances, slots = nearest_row(x, active)
+            best = distances.min()
+            # Eşitlikte zincirdeki önceki eleman tercih edilir (döngü önlenir)
+            if len(chain) > 1 and distances[np.searchsorted(slots, chain[-2])] <= best:
+                break
+            chain.append(int(slots[distances.argmin()]))
+        
+        x, y = chain.pop(), chain.pop()
+        height = float(distances[np.searchsorted(slots, y)])
+        merge(y, x)
+        active[x] = False
+        merges.append((y, x, height))
+    
+    return merges
+
+
+def _nn_chain_ward(data: np.ndarray) -> np.ndarray:
+    """
+    Merkez tabanlı Ward en yakın komşu zinciri (bellek O(n·d)).
+    
+    Ward uzaklığı sqrt(2·|A|·|B| / (|A|+|B|)) · ||c_A − c_B|| scipy ile
+    aynıdır; uzaklık matrisi hiç oluşturulmaz.
+    """
+    centroids = np.array(data, dtype=np.float64)
+    sizes = np.ones(len(centroids))
+    
+    def nearest_row(x, active):
+        active[x] = False
+        slots = np.flatnonzero(active)
+        active[x] = True
+        diff = centroids[slots] - centroids[x]
+        squared = np.einsum('ij,ij->i', diff, diff)
+        weights = 2.0 * sizes[slots] * sizes[x] / (sizes[slots] + sizes[x])
+        return np.sqrt(weights * squared), slots
+    
+    def merge(keep, drop):
+        total = sizes[keep] + sizes[drop]
+        centroids[keep] = (sizes[keep] * centroids[keep] + sizes[drop] * centroids[drop]) / total
+        sizes[keep] = total
+    
+    return _merges_to_linkage(_nn_chain(len(centroids), nearest_row, merge), len(centroids))
+
+
+def _condensed_distances(data: np.ndarray, chunk_size: int = 1024) -> np.ndarray:
+    """Öklid uzaklıklarını satır blokları halinde float32 sıkıştırılmış diziye yaz."""
+    data = np.asarray(data, dtype=np.float64)
+    n_samples = len(data)
+    condensed = np.empty(n_samples * (n_samples - 1) // 2, dtype=np.float32)
+    
+    position = 0
+    for start in range(0, n_samples - 1, chunk_size):
+        distances = cdist(data[start:start + chunk_size], data[start:])
+        for offset, row in enumerate(distances):
+            tail = row[offset + 1:]
+            condensed[position:position + len(tail)] = tail
+            position += len(tail)
+        del distances
+    
+    return condensed
+
+
+def _condensed_silhouette_samples(condensed: np.ndarray,
+                                  n_samples: int,
+                                  labels: np.ndarray,
+                                  rows: np.ndarray = None,
+                                  chunk_size: int = 1024) -> np.ndarray:
+    """
+    Sıkıştırılmış uzaklık dizisinden örnek bazlı silhouette değerlerini hesapla.
+    
+    `rows` verilirse yalnızca bu satırlar arasındaki uzaklıklar kullanılır
+    (`labels` bu satırlara karşılık gelir). Her blokta yalnızca
+    chunk_size × len(rows) boyutunda ara diziler oluşturulur.
+    """
+    rows = np.arange(n_samples) if rows is None else np.asarray(rows)
+    _, codes = np.unique(labels, return_inverse=True)
+    counts = np.bincount(codes)
+    # Sütunlar kümeye göre sıralanır; küme toplamları tek reduceat ile alınır
+    order = np.argsort(codes, kind='stable')
+    columns = rows[order]
+    boundaries = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    
+    scores = np.empty(len(rows))
+    for start in range(0, len(rows), chunk_size):
+        block = rows[start:start + chunk_size, None]
+        own = codes[start:start + chunk_size]
+        positions = np.arange(len(own))
+        
+        # (i, j), i < j çiftinin konumu: i·(2n - i - 1)/2 + (j - i - 1)
+        diagonal = block == columns
+        low = np.minimum(block, columns)
+        index = np.maximum(block, columns)
+        index -= low
+        index -= 1
+        offset = 2 * n_samples - 1 - low
+        offset *= low
+        offset //= 2
+        index += offset
+        del low, offset
+        index[diagonal] = 0
+        distances = condensed[index].astype(np.float64)
+        del index
+        distances[diagonal] = 0.0
+        del diagonal
+        
+        sums = np.add.reduceat(distances, boundaries, axis=1)
+        del distances
+        intra = sums[positions, own] / np.maximum(counts[own] - 1, 1)
+        sums /= counts
+        sums[positions, own] = np.inf
+        nearest = sums.min(axis=1)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            block_scores = (nearest - intra) / np.maximum(intra, nearest)
+        block_scores[counts[own] == 1] = 0.0
+        scores[start:start + chunk_size] = np.nan_to_num(block_scores)
+    
+    return scores
+
+
+def _nn_chain_condensed(condensed: np.ndarray, n_samples: int, method: str) -> np.ndarray:
+    """Sıkıştırılmış float32 uzaklıklar üzerinde Lance-Williams güncellemeli zincir."""
+    sizes = np.ones(n_samples)
+    all_slots = np.arange(n_samples, dtype=np.int64)
+    
+    def row_index(x, slots):
+        low, high = np.minimum(slots, x), np.maximum(slots, x)
+        return n_samples * low - low * (low + 1) // 2 + (high - low - 1)
+    
+    def nearest_row(x, active):
+        active[x] = False
+        slots = all_slots[active]
+        active[x] = True
+        return condensed[row_index(x, slots)].astype(np.float64), slots
+    
+    active_for_merge = np.ones(n_samples, dtype=bool)
+    
+    def merge(keep, drop):
+        active_for_merge[drop] = False
+        active_for_merge[keep] = False
+        slots = all_slots[active_for_merge]
+        active_for_merge[keep] = True
+        
+        keep_index, drop_index = row_index(keep, slots), row_index(drop, slots)
+        d_keep, d_drop = condensed[keep_index], condensed[drop_index]
+        if method == 'single':
+            updated = np.minimum(d_keep, d_drop)
+        elif method == 'complete':
+            updated = np.maximum(d_keep, d_drop)
+        elif method == 'average':
+            updated = (sizes[keep] * d_keep + sizes[drop] * d_drop) / (sizes[keep] + sizes[drop])
+        else:  # weighted
+            updated = (d_keep + d_drop) / 2
+        condensed[keep_index] = updated
+        sizes[keep] += sizes[drop]
+    
+    return _merges_to_linkage(_nn_chain(n_samples, nearest_row, merge), n_samples)
+
+
+def _knn_linkage(data: np.ndarray, method: str, n_neighbors: int) -> np.ndarray:
+    """k-NN bağlantı grafiğiyle sınırlandırılmış yaklaşık linkage matrisi."""
+    n_samples = len(data)
+    connectivity = kneighbors_graph(data, n_neighbors=min(n_neighbors, n_samples - 1),
+                                    include_self=False)
+    model = AgglomerativeClustering(n_clusters=None, distance_threshold=0,
+                                    linkage=method, connectivity=connectivity,
+                                    compute_full_tree=True, compute_distances=True)
+    model.fit(data)
+    
+    children = model.children_
+    sizes = np.ones(2 * n_samples - 1)
+    for i, (a, b) in enumerate(children):
+        sizes[n_samples + i] = sizes[a] + sizes[b]
+    
+    # Bağlantı kısıtı yükseklik sırasını bozabilir; dendrogram/fcluster için
+    # yükseklikler kümülatif maksimumla monoton yapılır
+    heights = np.maximum.accumulate(model.distances_)
+    return np.column_stack([children.min(axis=1), children.max(axis=1),
+                            heights, sizes[n_samples:]]).astype(np.float64)
+
+
 def run_clustering_pipeline(data: np.ndarray,
                            df: pd.DataFrame,
                            feature_columns: List[str],
@@ -0,0 +1,66 @@
+﻿"""
+Türkiye İlleri Sosyo-Ekonomik Kümeleme Projesi
+Konfigürasyon Modülü
+
+Bu modül config.yaml dosyasını okuma ve değişken şemasını çıkarma
+işlemlerini içerir.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+import yaml
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'config.yaml')
+
+
+def load_config(config_path: str = None) -> Dict:
+    """
+    Proje konfigürasyonunu yükle.
+    
+    Args:
+        config_path: YAML dosya yolu (None ise proje kökündeki config.yaml)
+        
+    Returns:
+        Konfigürasyon dictionary
+    """
+    if config_path is None:
+        config_path = DEFAULT_CONFIG_PATH
+    
+    # Dosya UTF-8 BOM ile başlayabilir
+    with open(config_path, 'r', encoding='utf-8-sig') as f:
+        return yaml.safe_load(f) or {}
+
+
+def resolve_path(path: Optional[str]) -> Optional[str]:
+    """
+    Konfigürasyondaki göreli yolu proje köküne göre çözümle.
+    
+    Böylece yol, çalışma dizininden (ör. notebooks/) bağımsız olur.
+    
+    Args:
+        path: Göreli veya mutlak yol (None ise None döner)
+        
+    Returns:
+        Mutlak yol veya None
+    """
+    if path is None:
+        return None
+    return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+
+def get_variable_schema(config: Dict = None) -> Dict[str, List[str]]:
+    """
+    Konfigürasyondaki 'variables' bölümünü (kategori: gösterge listesi) döndür.
+    
+    Args:
+        config: Konfigürasyon dictionary (None ise config.yaml okunur)
+        
+    Returns:
+        Kategori: Gösterge sütunları dictionary
+    """
+    if config is None:
+        config = load_config()
+    
+    return config.get('variables', {}) or {}
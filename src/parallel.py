@@ -0,0 +1,136 @@
+﻿"""
+Türkiye İlleri Sosyo-Ekonomik Kümeleme Projesi
+Paralel Çalıştırma Modülü
+
+Bu modül veri matrisini süreçler arasında paylaşılan bellekte tutarak
+(görev başına pickle etmeden) süreç havuzunda görev çalıştırma
+araçlarını içerir.
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Sequence, Tuple
+import os
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # scikit-learn ile gelir; yoksa sınırlama yapılmaz
+    threadpool_limits = None
+
+# İşçi süreçte paylaşılan veri görünümü (ve bağlı SharedMemory nesnesi)
+_SHARED_DATA = None
+_SHARED_HANDLE = None
+
+
+def resolve_n_jobs(n_jobs: int = None) -> int:
+    """
+    n_jobs değerini süreç sayısına çevir.
+    
+    Args:
+        n_jobs: None veya -1 ise tüm CPU'lar, negatif ise (CPU + 1 + n_jobs)
+        
+    Returns:
+        Pozitif süreç sayısı
+    """
+    n_cpus = os.cpu_count() or 1
+    if n_jobs is None or n_jobs == -1:
+        return n_cpus
+    if n_jobs < 0:
+        return max(1, n_cpus + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def get_shared_data() -> np.ndarray:
+    """İşçi süreçte (veya seri çalışmada) paylaşılan veri matrisini döndür."""
+    if _SHARED_DATA is None:
+        raise RuntimeError("Paylaşılan veri ayarlanmadı!")
+    return _SHARED_DATA
+
+
+def _init_worker(spec: Tuple, n_threads: int):
+    """Süreç havuzu başlatıcısı: paylaşılan veriye bağlan, thread sayısını sınırla."""
+    global _SHARED_DATA, _SHARED_HANDLE
+    
+    kind, location, shape, dtype = spec
+    if kind == 'memmap':
+        _SHARED_DATA = np.memmap(location, dtype=dtype, mode='r', shape=shape)
+    else:
+        _SHARED_HANDLE = shared_memory.SharedMemory(name=location)
+        _SHARED_DATA = np.ndarray(shape, dtype=dtype, buffer=_SHARED_HANDLE.buf)
+        _SHARED_DATA.flags.writeable = False
+    
+    if threadpool_limits is not None:
+        threadpool_limits(n_threads)
+
+
+@contextmanager
+def shared_array(data: np.ndarray):
+    """
+    Veriyi süreçler arası paylaşılabilir hale getir.
+    
+    Dosyaya bağlı memmap diziler dosya yolu üzerinden paylaşılır; diğer
+    diziler bir kez SharedMemory bloğuna kopyalanır ve işçiler bu bloğa
+    kopyasız bağlanır.
+    
+    Args:
+        data: Veri matrisi
+        
+    Yields:
+        İşçi başlatıcısına verilecek paylaşım tanımı
+    """
+    if isinstance(data, np.memmap) and data.filename is not None and data.offset == 0 \
+            and data.flags['C_CONTIGUOUS']:
+        yield ('memmap', data.filename, data.shape, data.dtype.str)
+        return
+    
+    data = np.ascontiguousarray(data)
+    block = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+    try:
+        view = np.ndarray(data.shape, dtype=data.dtype, buffer=block.buf)
+        view[...] = data
+        del view
+        yield ('shm', block.name, data.shape, data.dtype.str)
+    finally:
+        block.close()
+        block.unlink()
+
+
+def run_parallel(func: Callable,
+                 tasks: Sequence[Tuple],
+                 data: np.ndarray,
+                 n_jobs: int = None) -> List[Any]:
+    """
+    Görevleri paylaşılan veri matrisiyle süreç havuzunda çalıştır.
+    
+    `func` modül düzeyinde tanımlı olmalı ve veriye `get_shared_data()` ile
+    erişmelidir. n_jobs=1 ise görevler aynı süreçte sırayla çalışır.
+    
+    Args:
+        func: Görev fonksiyonu
+        tasks: Görev argümanları listesi
+        data: Paylaşılacak veri matrisi
+        n_jobs: Süreç sayısı (bkz. `resolve_n_jobs`)
+        
+    Returns:
+        Görev sırasıyla sonuç listesi
+    """
+    global _SHARED_DATA
+    
+    n_workers = min(resolve_n_jobs(n_jobs), max(1, len(tasks)))
+    
+    if n_workers == 1:
+        previous, _SHARED_DATA = _SHARED_DATA, data
+        try:
+            return [func(*args) for args in tasks]
+        finally:
+            _SHARED_DATA = previous
+    
+    n_threads = max(1, (os.cpu_count() or 1) // n_workers)
+    with shared_array(data) as spec:
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_worker,
+                                 initargs=(spec, n_threads)) as executor:
+            futures = [executor.submit(func, *args) for args in tasks]
+            return [future.result() for future in futures]
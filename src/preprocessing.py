@@ -8,12 +8,31 @@ aykırı değer tespiti işlemlerini içerir.
 
 import pandas as pd
 import numpy as np
+from pandas.api.types import union_categoricals
 from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
 from sklearn.impute import SimpleImputer, KNNImputer
+from sklearn.neighbors import NearestNeighbors
 from scipy import stats
-from typing import Tuple, List, Optional, Union
+from typing import Tuple, List, Dict, Iterator, Optional, Union
+from collections import OrderedDict
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
+import pickle
+import tempfile
 import warnings
 
+try:
+    from .cache import DiskCache, read_csv_cached
+    from .config import load_config, resolve_path
+    from .profiling import StageProfiler, quiet_output, track_peak_memory
+except ImportError:  # doğrudan `python src/preprocessing.py` ile çalıştırma
+    from cache import DiskCache, read_csv_cached
+    from config import load_config, resolve_path
+    from profiling import StageProfiler, quiet_output, track_peak_memory
+
 warnings.filterwarnings('ignore')
 
 
@@ -29,35 +48,153 @@ class DataPreprocessor:
     - Özellik seçimi
     """
     
-    def __init__(self, data: pd.DataFrame = None):
+    # Şema ile yüklemede kategorik olarak okunacak sütunlar
+    CATEGORICAL_COLUMNS = ['bolge', 'il_adi']
+    
+    def __init__(self,
+                 data: pd.DataFrame = None,
+                 copy_on_write: bool = False,
+                 track_memory: bool = False,
+                 cache_dir: str = None,
+                 cache_max_mb: float = 512):
         """
         DataPreprocessor sınıfını başlat.
         
         Args:
             data: İşlenecek pandas DataFrame
+            copy_on_write: True ise ve pandas copy-on-write etkinse (bkz.
+                `copy_on_write_active`) orijinal veri tam kopya yerine tembel
+                (sığ) kopya olarak tutulur; süreç geneli ayarlar değiştirilmez
+            track_memory: True ise aşama bazında tepe bellek kullanımı
+                `memory_profile` içine yazılır
+            cache_dir: `load_data` için varsayılan ikili önbellek dizini
+                (None ise önbellek kapalı)
+            cache_max_mb: Varsayılan önbellek boyut sınırı (MB)
         """
+        self.copy_on_write = copy_on_write and copy_on_write_active()
+        if copy_on_write and not self.copy_on_write:
+            print("⚠ pandas copy-on-write etkin değil; orijinal veri tam kopya olarak tutulacak "
+                  "(pandas 2.x için copy_on_write_mode() kullanın)")
+        self.track_memory = track_memory
+        self.cache_dir = cache_dir
+        self.cache_max_mb = cache_max_mb
+        self.memory_profile = {}
+        self.stage_profile = pd.DataFrame()
         self.data = data
-        self.original_data = data.copy() if data is not None else None
+        self.original_data = self._copy_original(data) if data is not None else None
         self.scaler = None
         self.imputer = None
         self.numeric_columns = []
         self.categorical_columns = []
         self.feature_columns = []
+        self.outlier_bounds = None
+    
+    @classmethod
+    def from_config(cls, data: pd.DataFrame = None, config: Dict = None, **kwargs) -> 'DataPreprocessor':
+        """
+        config.yaml 'data' bölümünden ön işleyici oluştur.
+        
+        cache_path (proje köküne göre çözümlenir) ve cache_max_mb okunur.
+        
+        Args:
+            data: İşlenecek pandas DataFrame
+            config: Konfigürasyon dictionary (None ise config.yaml okunur)
+            **kwargs: DataPreprocessor parametreleri
+            
+        Returns:
+            DataPreprocessor
+        """
+        if config is None:
+            config = load_config()
+        section = config.get('data', {}) or {}
         
-    def load_data(self, filepath: str, encoding: str = 'utf-8') -> pd.DataFrame:
+        kwargs.setdefault('cache_dir', resolve_path(section.get('cache_path')))
+        kwargs.setdefault('cache_max_mb', section.get('cache_max_mb', 512))
+        
+        return cls(data, **kwargs)
+    
+    def _copy_original(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Orijinal veri kopyasını oluştur (CoW modunda sığ kopya)."""
+        return data.copy(deep=not self.copy_on_write)
+    
+    @property
+    def original_data(self) -> Optional[pd.DataFrame]:
+        """Orijinal veri (lazy modda ilk erişimde dosyadan yeniden okunur)."""
+        if self._original_data is None and self._original_loader is not None:
+            self._original_data = self._original_loader()
+            self._original_loader = None
+        return self._original_data
+    
+    @original_data.setter
+    def original_data(self, value: Optional[pd.DataFrame]):
+        self._original_data = value
+        self._original_loader = None
+        
+    def load_data(self,
+                  filepath: str,
+                  encoding: str = 'utf-8',
+                  schema: Dict[str, List[str]] = None,
+                  chunksize: int = None,
+                  keep_original: Union[bool, str] = True,
+                  usecols: List[str] = None,
+                  cache_dir: str = None,
+                  cache_max_mb: float = None) -> pd.DataFrame:
         """
         CSV dosyasından veri yükle.
         
         Args:
             filepath: CSV dosya yolu
             encoding: Dosya kodlaması
+            schema: Kategori: gösterge listesi dictionary (config.yaml
+                'variables' bölümü, bkz. `config.get_variable_schema`).
+                Verilirse göstergeler float32, 'bolge'/'il_adi' kategorik
+                olarak okunur.
+            chunksize: Büyük dosyalar için parça başına satır sayısı
+            keep_original: Orijinal kopya tutulsun mu (True: kopya,
+                'lazy': ilk erişimde dosyadan oku, False: tutma)
+            usecols: Yalnızca okunacak sütunlar
+            cache_dir: Verilirse ikili önbellek dizini; dosya özeti, sütunlar
+                ve dtype'lar aynıysa CSV ayrıştırılmadan önbellekten okunur
+                (None ise self.cache_dir, bkz. `from_config`)
+            cache_max_mb: Önbellek boyut sınırı (MB, LRU tahliyesi; None ise
+                self.cache_max_mb)
             
         Returns:
             Yüklenen DataFrame
         """
         try:
-            self.data = pd.read_csv(filepath, encoding=encoding)
-            self.original_data = self.data.copy()
+            read_kwargs = {'encoding': encoding}
+            if usecols is not None:
+                read_kwargs['usecols'] = usecols
+            if schema is not None:
+                read_kwargs['dtype'] = self._schema_dtypes(filepath, encoding, schema)
+            
+            if cache_dir is None:
+                cache_dir = self.cache_dir
+            if cache_max_mb is None:
+                cache_max_mb = self.cache_max_mb
+            cache = DiskCache(cache_dir, max_size_mb=cache_max_mb) if cache_dir is not None else None
+            
+            def read():
+                if cache is None:
+                    return self._read_csv(filepath, read_kwargs, chunksize)
+                return read_csv_cached(
+                    filepath, cache,
+                    reader=lambda: self._read_csv(filepath, read_kwargs, chunksize),
+                    **read_kwargs
+                )
+            
+            with track_peak_memory(self.memory_profile, 'veri_yukleme', self.track_memory):
+                self.data = read()
+            
+            if keep_original == 'lazy':
+                self.original_data = None
+                self._original_loader = read
+            elif keep_original:
+                self.original_data = self._copy_original(self.data)
+            else:
+                self.original_data = None
+            
             self._identify_column_types()
             print(f"✓ Veri başarıyla yüklendi: {self.data.shape[0]} satır, {self.data.shape[1]} sütun")
             return self.data
@@ -65,6 +202,55 @@ class DataPreprocessor:
             print(f"✗ Veri yükleme hatası: {e}")
             return None
     
+    def _schema_dtypes(self,
+                       filepath: str,
+                       encoding: str,
+                       schema: Dict[str, List[str]]) -> Dict[str, str]:
+        """Şemadan dosyada bulunan sütunlar için dtype eşlemesi oluştur."""
+        header = pd.read_csv(filepath, encoding=encoding, nrows=0).columns
+        
+        dtypes = {}
+        for indicators in schema.values():
+            for col in indicators:
+                if col in header:
+                    dtypes[col] = 'float32'
+        for col in self.CATEGORICAL_COLUMNS:
+            if col in header:
+                dtypes[col] = 'category'
+        
+        return dtypes
+    
+    @staticmethod
+    def _read_csv(filepath: str, read_kwargs: Dict, chunksize: int = None) -> pd.DataFrame:
+        """CSV dosyasını (gerekirse parça parça) oku."""
+        if chunksize is None:
+            return pd.read_csv(filepath, **read_kwargs)
+        
+        # Şema dtype'ları (float32/category) her parçaya okunurken uygulanır.
+        # Parçalar sütun sütun kopyalanıp hemen bırakılır; sonunda her sütun
+        # ayrı birleştirilir, böylece tepe bellek ~veri + bir sütun olur
+        # (tüm parçalar + birleşik tablo yerine)
+        parts = {}
+        for chunk in pd.read_csv(filepath, chunksize=chunksize, **read_kwargs):
+            for col in chunk.columns:
+                parts.setdefault(col, []).append(chunk[col].copy())
+            del chunk
+        if not parts:
+            return pd.read_csv(filepath, nrows=0, **read_kwargs)
+        
+        columns = {}
+        for col in list(parts):
+            col_parts = parts.pop(col)
+            if isinstance(col_parts[0].dtype, pd.CategoricalDtype):
+                # Parçalar farklı kategori kümeleri içerebilir; ortak kategorilere
+                # çevrilir ki sonuç object tipine düşmesin
+                columns[col] = pd.Series(union_categoricals(col_parts), name=col)
+            else:
+                columns[col] = pd.concat(col_parts, ignore_index=True)
+            del col_parts
+        
+        return pd.DataFrame(columns, copy=False)
+    
     def _identify_column_types(self):
         """Sütun tiplerini tanımla."""
         self.numeric_columns = self.data.select_dtypes(include=[np.number]).columns.tolist()
@@ -87,7 +273,9 @@ class DataPreprocessor:
             'kategorik_sutunlar': len(self.categorical_columns),
             'eksik_deger_toplam': self.data.isnull().sum().sum(),
             'eksik_deger_orani': (self.data.isnull().sum().sum() / (self.data.shape[0] * self.data.shape[1])) * 100,
-            'bellek_kullanimi_mb': self.data.memory_usage(deep=True).sum() / 1024 / 1024
+            'bellek_kullanimi_mb': self.data.memory_usage(deep=True).sum() / 1024 / 1024,
+            'orijinal_kopya_mb': (self._original_data.memory_usage(deep=True).sum() / 1024 / 1024
+                                  if self._original_data is not None else 0.0)
         }
         
         return summary
@@ -117,7 +305,10 @@ class DataPreprocessor:
     def handle_missing_values(self, 
                              method: str = 'median',
                              columns: List[str] = None,
-                             n_neighbors: int = 5) -> pd.DataFrame:
+                             n_neighbors: int = 5,
+                             knn_algorithm: str = 'brute',
+                             batch_size: int = 10_000,
+                             n_jobs: int = None) -> pd.DataFrame:
         """
         Eksik değerleri işle.
         
@@ -125,6 +316,10 @@ class DataPreprocessor:
             method: Imputation yöntemi ('mean', 'median', 'mode', 'knn', 'drop')
             columns: İşlenecek sütunlar (None ise tüm numerik sütunlar)
             n_neighbors: KNN imputation için komşu sayısı
+            knn_algorithm: KNN motoru ('brute': sklearn KNNImputer, O(n²);
+                'kd_tree'/'ball_tree': uzamsal indeksli TreeKNNImputer)
+            batch_size: Ağaç tabanlı KNN'de parti başına eksik satır sayısı
+            n_jobs: Ağaç tabanlı KNN sorguları için paralel iş sayısı
             
         Returns:
             İşlenmiş DataFrame
@@ -146,16 +341,80 @@ class DataPreprocessor:
             print(f"✓ Eksik değerler {method} yöntemiyle dolduruldu")
             
         elif method == 'knn':
-            self.imputer = KNNImputer(n_neighbors=n_neighbors)
+            if knn_algorithm == 'brute':
+                self.imputer = KNNImputer(n_neighbors=n_neighbors)
+            else:
+                self.imputer = TreeKNNImputer(
+                    n_neighbors=n_neighbors,
+                    algorithm=knn_algorithm,
+                    batch_size=batch_size,
+                    n_jobs=n_jobs
+                )
             self.data[columns] = self.imputer.fit_transform(self.data[columns])
-            print(f"✓ Eksik değerler KNN ({n_neighbors} komşu) ile dolduruldu")
+            print(f"✓ Eksik değerler KNN ({n_neighbors} komşu, {knn_algorithm}) ile dolduruldu")
         
         return self.data
     
+    def compute_outlier_bounds(self,
+                               method: str = 'iqr',
+                               columns: List[str] = None,
+                               threshold: float = 1.5,
+                               ddof: int = 1) -> pd.DataFrame:
+        """
+        Tüm sütunların aykırı değer sınırlarını tek seferde hesapla.
+        
+        Çeyreklikler (veya ortalama/std) tek bir NumPy çağrısıyla matris
+        üzerinde hesaplanır. Sonuç `self.outlier_bounds` içinde saklanır ve
+        `handle_outliers(bounds=...)` ile yeniden kullanılabilir.
+        
+        Args:
+            method: Tespit yöntemi ('zscore', 'iqr')
+            columns: Sınır hesaplanacak sütunlar
+            threshold: Eşik değeri (IQR için çarpan, zscore için z-değeri)
+            ddof: zscore için standart sapma serbestlik derecesi
+            
+        Returns:
+            Sütun bazında 'alt_sinir' ve 'ust_sinir' içeren DataFrame
+        """
+        if self.data is None:
+            return pd.DataFrame(columns=['alt_sinir', 'ust_sinir'])
+        
+        columns = self._numeric_subset(columns)
+        values = self.data[columns].to_numpy(dtype=np.float64)
+        
+        if method == 'iqr':
+            q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
+            lower_bound = q1 - threshold * iqr
+            upper_bound = q3 + threshold * iqr
+        elif method == 'zscore':
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0, ddof=ddof)
+            lower_bound = mean - threshold * std
+            upper_bound = mean + threshold * std
+        else:
+            raise ValueError(f"Bilinmeyen aykırı değer yöntemi: {method}")
+        
+        bounds = pd.DataFrame(
+            {'alt_sinir': lower_bound, 'ust_sinir': upper_bound},
+            index=pd.Index(columns, name='sutun')
+        )
+        self.outlier_bounds = bounds
+        
+        return bounds
+    
+    def _numeric_subset(self, columns: List[str] = None) -> List[str]:
+        """Verilen sütunlardan veri setinde bulunan numerik olanları döndür."""
+        if columns is None:
+            columns = self.numeric_columns
+        return [col for col in columns
+                if col in self.data.columns and pd.api.types.is_numeric_dtype(self.data[col])]
+    
     def detect_outliers(self, 
                        method: str = 'iqr',
                        columns: List[str] = None,
-                       threshold: float = 1.5) -> pd.DataFrame:
+                       threshold: float = 1.5,
+                       vectorized: bool = False) -> pd.DataFrame:
         """
         Aykırı değerleri tespit et.
         
@@ -163,6 +422,8 @@ class DataPreprocessor:
             method: Tespit yöntemi ('zscore', 'iqr', 'isolation_forest')
             columns: Kontrol edilecek sütunlar
             threshold: Eşik değeri (IQR için çarpan, zscore için z-değeri)
+            vectorized: True ise tüm sütunlar tek bir matris işlemiyle
+                değerlendirilir; sınırlar `self.outlier_bounds` içinde saklanır
             
         Returns:
             Aykırı değer analizi DataFrame
@@ -173,6 +434,9 @@ class DataPreprocessor:
         if columns is None:
             columns = self.numeric_columns
         
+        if vectorized:
+            return self._detect_outliers_vectorized(method, columns, threshold)
+        
         outlier_summary = []
         
         for col in columns:
@@ -203,11 +467,42 @@ class DataPreprocessor:
         
         return pd.DataFrame(outlier_summary)
     
+    def _detect_outliers_vectorized(self,
+                                    method: str,
+                                    columns: List[str],
+                                    threshold: float) -> pd.DataFrame:
+        """Aykırı değer özetini tek geçişte, matris üzerinde hesapla."""
+        columns = self._numeric_subset(columns)
+        if not columns:
+            return pd.DataFrame()
+        
+        # stats.zscore ile aynı sonucu vermek için tespitte ddof=0 kullanılır
+        bounds = self.compute_outlier_bounds(method=method, columns=columns,
+                                             threshold=threshold, ddof=0)
+        values = self.data[columns].to_numpy(dtype=np.float64)
+        
+        lower = bounds['alt_sinir'].to_numpy()
+        upper = bounds['ust_sinir'].to_numpy()
+        outlier_mask = (values < lower) | (values > upper)
+        n_outliers = outlier_mask.sum(axis=0)
+        
+        return pd.DataFrame({
+            'sutun': columns,
+            'aykiri_sayi': n_outliers,
+            'aykiri_oran': (n_outliers / len(self.data)) * 100,
+            'min': np.nanmin(values, axis=0),
+            'max': np.nanmax(values, axis=0),
+            'ortalama': np.nanmean(values, axis=0),
+            'medyan': np.nanmedian(values, axis=0)
+        })
+    
     def handle_outliers(self,
                        method: str = 'iqr',
                        action: str = 'clip',
                        columns: List[str] = None,
-                       threshold: float = 1.5) -> pd.DataFrame:
+                       threshold: float = 1.5,
+                       vectorized: bool = False,
+                       bounds: pd.DataFrame = None) -> pd.DataFrame:
         """
         Aykırı değerleri işle.
         
@@ -216,6 +511,12 @@ class DataPreprocessor:
             action: İşlem ('clip', 'remove', 'winsorize')
             columns: İşlenecek sütunlar
             threshold: Eşik değeri
+            vectorized: True ise sınırlar tek seferde hesaplanır ve işlem
+                tüm sütunlara tek geçişte uygulanır. 'remove' için tek bir
+                birleşik maske kullanıldığından sınırlar, sütun sütun
+                filtrelenmiş veri yerine tüm veri üzerinden hesaplanır.
+            bounds: Önceden hesaplanmış sınırlar ('alt_sinir', 'ust_sinir');
+                verilirse yeniden hesaplanmaz (vectorized modu zorunlu kılar)
             
         Returns:
             İşlenmiş DataFrame
@@ -226,6 +527,9 @@ class DataPreprocessor:
         if columns is None:
             columns = self.numeric_columns
         
+        if vectorized or bounds is not None:
+            return self._handle_outliers_vectorized(method, action, columns, threshold, bounds)
+        
         for col in columns:
             if col not in self.data.columns or not pd.api.types.is_numeric_dtype(self.data[col]):
                 continue
@@ -254,6 +558,58 @@ class DataPreprocessor:
         print(f"✓ Aykırı değerler {action} yöntemiyle işlendi")
         return self.data
     
+    def _handle_outliers_vectorized(self,
+                                    method: str,
+                                    action: str,
+                                    columns: List[str],
+                                    threshold: float,
+                                    bounds: pd.DataFrame = None) -> pd.DataFrame:
+        """Aykırı değerleri tüm sütunlarda tek geçişte işle."""
+        if bounds is not None:
+            columns = [col for col in bounds.index if col in self.data.columns]
+            bounds = bounds.loc[columns]
+            self.outlier_bounds = bounds
+        else:
+            columns = self._numeric_subset(columns)
+        
+        if not columns:
+            return self.data
+        
+        values = self.data[columns].to_numpy(dtype=np.float64)
+        
+        if action == 'winsorize' and bounds is None:
+            # stats.mstats.winsorize(limits=[0.05, 0.05]) ile aynı sıra indeksleri;
+            # np.sort NaN'ları sona attığından indeksler sütun başına eksik
+            # olmayan değer sayısından hesaplanır (NaN hücreler NaN kalır)
+            n_valid = (~np.isnan(values)).sum(axis=0)
+            low_idx = (0.05 * n_valid).astype(np.int64)
+            up_idx = n_valid - low_idx
+            sorted_values = np.sort(values, axis=0)
+            column_idx = np.arange(values.shape[1])
+            lower = sorted_values[low_idx, column_idx]
+            upper = sorted_values[np.maximum(up_idx - 1, 0), column_idx]
+            self.outlier_bounds = pd.DataFrame(
+                {'alt_sinir': lower, 'ust_sinir': upper},
+                index=pd.Index(columns, name='sutun')
+            )
+        else:
+            if bounds is None:
+                bounds = self.compute_outlier_bounds(method=method, columns=columns,
+                                                     threshold=threshold)
+            lower = bounds['alt_sinir'].to_numpy()
+            upper = bounds['ust_sinir'].to_numpy()
+        
+        if action in ('clip', 'winsorize'):
+            self.data[columns] = np.clip(values, lower, upper)
+        elif action == 'remove':
+            inside = (values >= lower) & (values <= upper)
+            self.data = self.data[inside.all(axis=1)]
+        else:
+            raise ValueError(f"Bilinmeyen aykırı değer işlemi: {action}")
+        
+        print(f"✓ Aykırı değerler {action} yöntemiyle işlendi ({len(columns)} sütun, tek geçiş)")
+        return self.data
+    
     def normalize(self,
                  method: str = 'standard',
                  columns: List[str] = None) -> Tuple[np.ndarray, object]:
@@ -293,15 +649,167 @@ class DataPreprocessor:
         
         return scaled_data, self.scaler
     
+    def normalize_streaming(self,
+                            source: Union[str, pd.DataFrame] = None,
+                            method: str = 'standard',
+                            columns: List[str] = None,
+                            chunksize: int = 100_000,
+                            output_path: str = None,
+                            dtype: str = 'float32',
+                            sample_size: int = 100_000,
+                            encoding: str = 'utf-8') -> Tuple[np.memmap, object]:
+        """
+        Belleğe sığmayan veriyi parça parça normalize et.
+        
+        İlk geçişte scaler istatistikleri parçalar üzerinden biriktirilir
+        (StandardScaler/MinMaxScaler için `partial_fit`). RobustScaler için
+        medyan ve çeyreklikler, sabit boyutlu rastgele bir rezervuar örneği
+        üzerinden yaklaşık olarak hesaplanır. İkinci geçişte ölçeklenmiş
+        matris parça parça bir bellek eşlemli (memmap) diziye yazılır; bu
+        dizi doğrudan `ClusteringAnalyzer(data=...)` ile kullanılabilir.
+        
+        Eksik değerler istatistiklerde yok sayılır ve çıktıda NaN kalır.
+        
+        Args:
+            source: CSV dosya yolu veya DataFrame (None ise self.data)
+            method: Normalizasyon yöntemi ('standard', 'minmax', 'robust')
+            columns: Normalize edilecek sütunlar (None ise self.feature_columns)
+            chunksize: Parça başına satır sayısı
+            output_path: Memmap dosya yolu (None ise geçici dosya)
+            dtype: Çıktı veri tipi
+            sample_size: RobustScaler için rezervuar örneği boyutu
+            encoding: CSV dosya kodlaması
+            
+        Returns:
+            (Normalize edilmiş memmap dizi, Scaler objesi) tuple
+        """
+        if source is None:
+            source = self.data
+        if source is None:
+            return None, None
+        
+        columns = self._streaming_columns(source, columns, encoding)
+        self.feature_columns = columns
+        
+        # 1. geçiş: istatistikleri biriktir
+        if method == 'standard':
+            self.scaler = StandardScaler()
+        elif method == 'minmax':
+            self.scaler = MinMaxScaler()
+        elif method == 'robust':
+            self.scaler = RobustScaler()
+            rng = np.random.default_rng(0)
+            reservoir = np.empty((sample_size, len(columns)), dtype=np.float64)
+        else:
+            raise ValueError(f"Bilinmeyen normalizasyon yöntemi: {method}")
+        
+        n_rows = 0
+        for chunk in self._iter_chunks(source, columns, chunksize, encoding):
+            if method == 'robust':
+                self._update_reservoir(reservoir, chunk.to_numpy(dtype=np.float64), n_rows, rng)
+            else:
+                self.scaler.partial_fit(chunk)
+            n_rows += len(chunk)
+        
+        if n_rows == 0:
+            raise ValueError("Normalize edilecek satır bulunamadı!")
+        
+        if method == 'robust':
+            sample = reservoir[:min(n_rows, sample_size)]
+            self.scaler.fit(pd.DataFrame(sample, columns=columns))
+        
+        # 2. geçiş: ölçeklenmiş parçaları memmap'e yaz
+        if output_path is None:
+            fd, output_path = tempfile.mkstemp(suffix='.dat', prefix='olcekli_')
+            os.close(fd)
+        
+        scaled_data = np.memmap(output_path, dtype=dtype, mode='w+', shape=(n_rows, len(columns)))
+        start = 0
+        for chunk in self._iter_chunks(source, columns, chunksize, encoding):
+            stop = start + len(chunk)
+            scaled_data[start:stop] = self.scaler.transform(chunk)
+            start = stop
+        scaled_data.flush()
+        
+        with open(output_path + '.json', 'w', encoding='utf-8') as f:
+            json.dump({'shape': [n_rows, len(columns)], 'dtype': dtype, 'columns': columns},
+                      f, ensure_ascii=False)
+        
+        print(f"✓ Veri {method} yöntemiyle parça parça normalize edildi "
+              f"({n_rows} satır, {len(columns)} özellik) → {output_path}")
+        
+        return scaled_data, self.scaler
+    
+    def _streaming_columns(self,
+                           source: Union[str, pd.DataFrame],
+                           columns: List[str],
+                           encoding: str) -> List[str]:
+        """Akışlı normalizasyonda kullanılacak özellik sütunlarını belirle."""
+        if columns is None:
+            columns = self.feature_columns
+        if columns:
+            return list(columns)
+        
+        exclude_cols = ['il_kodu', 'il_adi', 'plaka', 'bolge', 'sege_kademe']
+        if isinstance(source, str):
+            sample = pd.read_csv(source, encoding=encoding, nrows=1000)
+        else:
+            sample = source
+        
+        return [col for col in sample.select_dtypes(include=[np.number]).columns
+                if col not in exclude_cols]
+    
+    @staticmethod
+    def _iter_chunks(source: Union[str, pd.DataFrame],
+                     columns: List[str],
+                     chunksize: int,
+                     encoding: str = 'utf-8') -> Iterator[pd.DataFrame]:
+        """Kaynağı sütun alt kümesiyle, `columns` sırasında parça parça dolaş."""
+        if isinstance(source, str):
+            # usecols sütunları dosya sırasında döndürür; scaler, memmap ve
+            # .json eki aynı sırayı kullansın diye parça yeniden sıralanır
+            for chunk in pd.read_csv(source, encoding=encoding, usecols=columns, chunksize=chunksize):
+                yield chunk[columns]
+        else:
+            # Önce satır dilimi alınır; sütun seçimi yalnızca parçayı kopyalar
+            for start in range(0, len(source), chunksize):
+                yield source.iloc[start:start + chunksize][columns]
+    
+    @staticmethod
+    def _update_reservoir(reservoir: np.ndarray,
+                          chunk: np.ndarray,
+                          n_seen: int,
+                          rng: np.random.Generator):
+        """Rezervuar örneğini (Algorithm R) bir parça ile vektörel güncelle."""
+        capacity = len(reservoir)
+        
+        n_fill = max(0, min(capacity - n_seen, len(chunk)))
+        if n_fill > 0:
+            reservoir[n_seen:n_seen + n_fill] = chunk[:n_fill]
+        
+        rest = chunk[n_fill:]
+        if len(rest) == 0:
+            return
+        
+        # i. satır (global indeks) k/(i+1) olasılıkla rastgele bir yuvaya yazılır
+        global_idx = n_seen + n_fill + np.arange(len(rest))
+        slots = rng.integers(0, global_idx + 1)
+        accepted = slots < capacity
+        reservoir[slots[accepted]] = rest[accepted]
+    
     def select_features(self,
                        exclude_columns: List[str] = None,
-                       correlation_threshold: float = 0.95) -> List[str]:
+                       correlation_threshold: float = 0.95,
+                       block_size: int = None) -> List[str]:
         """
         Özellik seçimi yap.
         
         Args:
             exclude_columns: Hariç tutulacak sütunlar
             correlation_threshold: Yüksek korelasyon eşiği
+            block_size: Verilirse korelasyonlar sütun blokları halinde
+                hesaplanır ve tam matris bellekte tutulmaz (binlerce aday
+                gösterge için)
             
         Returns:
             Seçilen özellik listesi
@@ -316,16 +824,13 @@ class DataPreprocessor:
         numeric_data = self.data.select_dtypes(include=[np.number])
         feature_cols = [col for col in numeric_data.columns if col not in exclude_columns]
         
-        # Yüksek korelasyonlu özellikleri tespit et
-        corr_matrix = numeric_data[feature_cols].corr().abs()
-        upper_triangle = corr_matrix.where(
-            np.triu(np.ones(corr_matrix.shape), k=1).astype(bool)
+        # Yüksek korelasyonlu sütunları bul (üst üçgende eşiği aşan sütunlar)
+        high_corr_cols = find_correlated_features(
+            numeric_data, feature_cols,
+            threshold=correlation_threshold,
+            block_size=block_size
         )
         
-        # Yüksek korelasyonlu sütunları bul
-        high_corr_cols = [col for col in upper_triangle.columns 
-                         if any(upper_triangle[col] > correlation_threshold)]
-        
         # Seçilen özellikleri güncelle
         selected_features = [col for col in feature_cols if col not in high_corr_cols]
         self.feature_columns = selected_features
@@ -350,12 +855,17 @@ class DataPreprocessor:
         if columns is None:
             columns = self.feature_columns if self.feature_columns else self.numeric_columns
         
-        return self.data[columns].corr()
+        return compute_correlation_matrix(self.data, columns)
     
     def prepare_for_clustering(self,
                               exclude_columns: List[str] = None,
                               normalize_method: str = 'standard',
-                              handle_outliers_method: str = 'clip') -> Tuple[np.ndarray, pd.DataFrame, List[str]]:
+                              handle_outliers_method: str = 'clip',
+                              vectorized: bool = False,
+                              profile: bool = False,
+                              profile_memory: bool = True,
+                              profile_path: str = None,
+                              quiet: bool = False) -> Tuple[np.ndarray, pd.DataFrame, List[str]]:
         """
         Kümeleme için veriyi hazırla (tüm ön işleme adımlarını uygula).
         
@@ -363,6 +873,12 @@ class DataPreprocessor:
             exclude_columns: Hariç tutulacak sütunlar
             normalize_method: Normalizasyon yöntemi
             handle_outliers_method: Aykırı değer işleme yöntemi
+            vectorized: Aykırı değer tespiti/işleme için tek geçişli matris modu
+            profile: True ise her aşamanın süre, CPU süresi, tepe bellek ve
+                satır/sütun sayısı ölçülür (bkz. `get_stage_profile`)
+            profile_memory: Profil çıkarırken tracemalloc ile bellek ölçülsün mü
+            profile_path: Verilirse aşama kayıtları JSON lines olarak eklenir
+            quiet: True ise konsol çıktısı bastırılır
             
         Returns:
             (Normalize veri, Orijinal DataFrame, Özellik listesi) tuple
@@ -370,36 +886,74 @@ class DataPreprocessor:
         if exclude_columns is None:
             exclude_columns = ['il_kodu', 'il_adi', 'plaka', 'bolge', 'sege_endeksi', 'sege_kademe']
         
+        profiler = StageProfiler(
+            enabled=profile or self.track_memory or profile_path is not None,
+            trace_memory=profile_memory or self.track_memory,
+            jsonl_path=profile_path,
+            run_name='prepare_for_clustering'
+        )
+        
+        with quiet_output(quiet):
+            scaled_data = self._run_preparation(
+                profiler, exclude_columns, normalize_method, handle_outliers_method, vectorized
+            )
+        
+        self.stage_profile = profiler.to_frame()
+        if self.track_memory:
+            for record in profiler.records:
+                self.memory_profile[record['asama']] = {
+                    'tepe_mb': record['tepe_bellek_mb'],
+                    'net_mb': record['net_bellek_mb']
+                }
+        
+        return scaled_data, self.data, self.feature_columns
+    
+    def _run_preparation(self,
+                         profiler: StageProfiler,
+                         exclude_columns: List[str],
+                         normalize_method: str,
+                         handle_outliers_method: str,
+                         vectorized: bool) -> np.ndarray:
+        """Ön işleme aşamalarını profil kaydı tutarak çalıştır."""
         print("=" * 50)
         print("KÜMELEME İÇİN VERİ HAZIRLAMA")
         print("=" * 50)
         
         # 1. Eksik değer kontrolü
         print("\n1. Eksik Değer Kontrolü:")
-        missing = self.analyze_missing_values()
-        if len(missing) > 0:
-            print(f"   {len(missing)} sütunda eksik değer tespit edildi")
-            self.handle_missing_values(method='median')
-        else:
-            print("   ✓ Eksik değer yok")
+        with profiler.stage('eksik_deger') as record:
+            missing = self.analyze_missing_values()
+            if len(missing) > 0:
+                print(f"   {len(missing)} sütunda eksik değer tespit edildi")
+                self.handle_missing_values(method='median')
+            else:
+                print("   ✓ Eksik değer yok")
+            record['satir'], record['sutun'] = self.data.shape
         
         # 2. Özellik seçimi
         print("\n2. Özellik Seçimi:")
-        self.select_features(exclude_columns=exclude_columns)
+        with profiler.stage('ozellik_secimi') as record:
+            self.select_features(exclude_columns=exclude_columns)
+            record['satir'], record['sutun'] = len(self.data), len(self.feature_columns)
         
         # 3. Aykırı değer işleme
         print("\n3. Aykırı Değer İşleme:")
-        outlier_stats = self.detect_outliers(columns=self.feature_columns)
-        n_outliers = outlier_stats['aykiri_sayi'].sum()
-        if n_outliers > 0:
-            print(f"   Toplam {n_outliers} aykırı değer tespit edildi")
-            self.handle_outliers(action=handle_outliers_method, columns=self.feature_columns)
-        else:
-            print("   ✓ Aykırı değer yok")
+        with profiler.stage('aykiri_deger') as record:
+            outlier_stats = self.detect_outliers(columns=self.feature_columns, vectorized=vectorized)
+            n_outliers = outlier_stats['aykiri_sayi'].sum()
+            if n_outliers > 0:
+                print(f"   Toplam {n_outliers} aykırı değer tespit edildi")
+                self.handle_outliers(action=handle_outliers_method, columns=self.feature_columns,
+                                     vectorized=vectorized)
+            else:
+                print("   ✓ Aykırı değer yok")
+            record['satir'], record['sutun'] = len(self.data), len(self.feature_columns)
         
         # 4. Normalizasyon
         print("\n4. Normalizasyon:")
-        scaled_data, _ = self.normalize(method=normalize_method, columns=self.feature_columns)
+        with profiler.stage('normalizasyon') as record:
+            scaled_data, _ = self.normalize(method=normalize_method, columns=self.feature_columns)
+            record['satir'], record['sutun'] = scaled_data.shape
         
         print("\n" + "=" * 50)
         print(f"✓ Veri hazırlama tamamlandı!")
@@ -407,7 +961,676 @@ class DataPreprocessor:
         print(f"  - Özellik sayısı: {len(self.feature_columns)}")
         print("=" * 50)
         
-        return scaled_data, self.data, self.feature_columns
+        return scaled_data
+    
+    def get_stage_profile(self, as_frame: bool = True) -> Union[pd.DataFrame, Dict]:
+        """
+        Son `prepare_for_clustering` çalıştırmasının aşama profilini döndür.
+        
+        Args:
+            as_frame: True ise DataFrame, değilse {aşama: ölçümler} dictionary
+            
+        Returns:
+            Aşama profili
+        """
+        if as_frame:
+            return self.stage_profile
+        return self.stage_profile.set_index('asama').to_dict(orient='index') if len(self.stage_profile) else {}
+
+
+def copy_on_write_active() -> bool:
+    """
+    pandas copy-on-write modunun etkin olup olmadığını döndür.
+    
+    pandas >= 3.0'da CoW her zaman açıktır. 2.x sürümlerinde süreç genelindeki
+    seçenek burada değiştirilmez; çağıran `pd.set_option('mode.copy_on_write',
+    True)` ile veya `copy_on_write_mode()` bloğu içinde açmış olmalıdır.
+    
+    Returns:
+        CoW etkin mi
+    """
+    major = int(pd.__version__.split('.')[0])
+    if major >= 3:
+        return True
+    if major == 2:
+        return pd.get_option('mode.copy_on_write') is True
+    return False
+
+
+def copy_on_write_mode():
+    """
+    pandas 2.x'te copy-on-write'ı yalnızca blok süresince açan bağlam.
+    
+    Sığ kopyalar CoW kapandıktan sonra güvenli değildir; CoW modundaki
+    DataPreprocessor tüm kullanımı boyunca blok içinde kalmalıdır.
+    pandas >= 3.0'da hiçbir şey yapmaz.
+    """
+    if int(pd.__version__.split('.')[0]) == 2:
+        return pd.option_context('mode.copy_on_write', True)
+    return nullcontext()
+
+
+# (veri özeti, sütunlar) -> korelasyon matrisi; en son kullanılanlar tutulur
+_CORRELATION_CACHE: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_CORRELATION_CACHE_SIZE = 8
+
+
+def _frame_fingerprint(df: pd.DataFrame, columns: List[str]) -> str:
+    """Sütun alt kümesinin içerik özetini hesapla (veri sürümü olarak kullanılır)."""
+    row_hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+    return hashlib.sha1(row_hashes.tobytes()).hexdigest()
+
+
+def _standardize_columns(values: np.ndarray) -> np.ndarray:
+    """Sütunları ortala ve birim normlu yap (sabit sütunlar NaN olur)."""
+    centered = values - values.mean(axis=0)
+    norms = np.sqrt(np.einsum('ij,ij->j', centered, centered))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return centered / np.where(norms > 0, norms, np.nan)
+
+
+def compute_correlation_matrix(df: pd.DataFrame,
+                               columns: List[str] = None,
+                               block_size: int = None,
+                               use_cache: bool = True) -> pd.DataFrame:
+    """
+    Pearson korelasyon matrisini NumPy/BLAS ile hesapla ve önbellekle.
+    
+    Aynı veri içeriği ve sütunlar için matris bir kez hesaplanır; sonraki
+    çağrılar (özellik seçimi, `get_correlation_matrix`, ısı haritası)
+    önbellekten döner. Eksik değer içeren veride pandas'ın ikili tam
+    gözlem davranışı korunur.
+    
+    Args:
+        df: DataFrame
+        columns: Korelasyon hesaplanacak sütunlar (None ise numerik sütunlar)
+        block_size: Verilirse matris sütun blokları halinde doldurulur
+        use_cache: Önbellek kullanılsın mı
+        
+    Returns:
+        Korelasyon matrisi DataFrame
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    columns = list(columns)
+    
+    key = None
+    if use_cache:
+        key = (_frame_fingerprint(df, columns), tuple(columns))
+        if key in _CORRELATION_CACHE:
+            _CORRELATION_CACHE.move_to_end(key)
+            # Çağıranın yerinde değişikliği önbelleği bozmasın diye kopya döner
+            return _CORRELATION_CACHE[key].copy()
+    
+    values = df[columns].to_numpy(dtype=np.float64)
+    if np.isnan(values).any():
+        corr_matrix = df[columns].corr()
+    else:
+        z = _standardize_columns(values)
+        n_cols = len(columns)
+        if block_size is None:
+            corr = z.T @ z
+        else:
+            corr = np.empty((n_cols, n_cols))
+            for start in range(0, n_cols, block_size):
+                stop = min(start + block_size, n_cols)
+                corr[:, start:stop] = z.T @ z[:, start:stop]
+        np.clip(corr, -1.0, 1.0, out=corr)
+        corr_matrix = pd.DataFrame(corr, index=columns, columns=columns)
+    
+    if use_cache:
+        _CORRELATION_CACHE[key] = corr_matrix.copy()
+        while len(_CORRELATION_CACHE) > _CORRELATION_CACHE_SIZE:
+            _CORRELATION_CACHE.popitem(last=False)
+    
+    return corr_matrix
+
+
+def find_correlated_features(df: pd.DataFrame,
+                             columns: List[str],
+                             threshold: float = 0.95,
+                             block_size: int = None) -> List[str]:
+    """
+    Üst üçgende kendinden önceki herhangi bir sütunla mutlak korelasyonu
+    eşiği aşan sütunları bul.
+    
+    Blok modunda tam p×p matris oluşturulmaz; her blok için yalnızca
+    (önceki sütunlar × blok) kesiti hesaplanır.
+    
+    Args:
+        df: DataFrame
+        columns: Aday özellik sütunları
+        threshold: Yüksek korelasyon eşiği
+        block_size: Verilirse blok boyutu (sütun sayısı)
+        
+    Returns:
+        Çıkarılacak sütun listesi
+    """
+    columns = list(columns)
+    if len(columns) < 2:
+        return []
+    
+    values = df[columns].to_numpy(dtype=np.float64)
+    if block_size is None or np.isnan(values).any():
+        corr = np.abs(compute_correlation_matrix(df, columns).to_numpy())
+        upper = np.triu(np.ones(corr.shape, dtype=bool), k=1)
+        is_high = ((corr > threshold) & upper).any(axis=0)
+    else:
+        z = _standardize_columns(values)
+        is_high = np.zeros(len(columns), dtype=bool)
+        for start in range(0, len(columns), block_size):
+            stop = min(start + block_size, len(columns))
+            block = np.abs(z[:, :stop].T @ z[:, start:stop])
+            rows = np.arange(stop)[:, None]
+            cols = np.arange(start, stop)[None, :]
+            is_high[start:stop] = ((block > threshold) & (rows < cols)).any(axis=0)
+    
+    return [col for col, high in zip(columns, is_high) if high]
+
+
+def load_scaled_memmap(filepath: str) -> np.memmap:
+    """
+    `normalize_streaming` ile yazılmış ölçekli matrisi salt okunur aç.
+    
+    Args:
+        filepath: Memmap dosya yolu (yanındaki .json meta dosyası okunur)
+        
+    Returns:
+        Salt okunur memmap dizi (ClusteringAnalyzer'a doğrudan verilebilir)
+    """
+    with open(filepath + '.json', 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    
+    return np.memmap(filepath, dtype=meta['dtype'], mode='r', shape=tuple(meta['shape']))
+
+
+class TreeKNNImputer:
+    """
+    Uzamsal indeks (KD/Ball tree) kullanan, bellek sınırlı KNN imputer.
+    
+    sklearn `KNNImputer` tüm satır çiftleri arasında uzaklık hesapladığı
+    için O(n²) zaman ve bellek gerektirir. Bu sınıf her hedef sütun için
+    ayrı bir bağışçı havuzu kurar: o sütunu gözlenmiş tüm satırlar (sorgu
+    sütunları zaten tamamen doludur). Böylece çok boşluklu panellerde de
+    bağışçılar yalnızca eksiksiz satırlarla sınırlı kalmaz. Eksik hücreler
+    partiler halinde sorgulanır ve k komşunun ortalamasıyla doldurulur;
+    süre eksik hücre sayısıyla yaklaşık doğrusal artar.
+    
+    Not: Uzaklıklar yalnızca tamamen dolu sütunlar üzerinden hesaplanır;
+    `KNNImputer`'ın nan_euclidean uzaklığından bu yönüyle ayrılır.
+    """
+    
+    def __init__(self,
+                 n_neighbors: int = 5,
+                 algorithm: str = 'kd_tree',
+                 batch_size: int = 10_000,
+                 n_jobs: int = None):
+        """
+        TreeKNNImputer sınıfını başlat.
+        
+        Args:
+            n_neighbors: Komşu sayısı
+            algorithm: Uzamsal indeks ('kd_tree', 'ball_tree')
+            batch_size: Parti başına sorgulanan eksik satır sayısı
+            n_jobs: Komşu sorguları için paralel iş sayısı
+        """
+        self.n_neighbors = n_neighbors
+        self.algorithm = algorithm
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.pools = None
+        self.query_columns = None
+        self.query_fill = None
+    
+    def _build_index(self, query_values: np.ndarray) -> NearestNeighbors:
+        """Sorgu sütunları üzerinde uzamsal indeks kur."""
+        return NearestNeighbors(
+            n_neighbors=self.n_neighbors,
+            algorithm=self.algorithm,
+            n_jobs=self.n_jobs
+        ).fit(query_values)
+    
+    def fit(self, X: Union[pd.DataFrame, np.ndarray]) -> 'TreeKNNImputer':
+        """
+        Her sütun için bağışçı havuzu ve uzamsal indeksi kur.
+        
+        Tamamen dolu sütunlar tüm satırları paylaşan tek bir indeks kullanır;
+        eksik değer içeren her sütun için o sütunu gözlenmiş satırlar
+        üzerinde ayrı indeks kurulur.
+        
+        Args:
+            X: Eksik değer içerebilen veri
+            
+        Returns:
+            Eğitilmiş imputer (self)
+        """
+        values = np.asarray(X, dtype=np.float64)
+        missing = np.isnan(values)
+        
+        self.query_columns = np.flatnonzero(~missing.any(axis=0))
+        if len(self.query_columns) == 0:
+            raise ValueError("Tamamen dolu sütun yok; ağaç tabanlı KNN kurulamaz "
+                             "(knn_algorithm='brute' kullanın)")
+        if len(values) < self.n_neighbors:
+            raise ValueError(f"Satır sayısı ({len(values)}) komşu sayısından "
+                             f"({self.n_neighbors}) az (knn_algorithm='brute' kullanın)")
+        
+        query_values = values[:, self.query_columns]
+        self.query_fill = query_values.mean(axis=0)
+        shared_index = self._build_index(query_values)
+        
+        # sütun -> (indeks, bağışçıların o sütundaki değerleri)
+        self.pools = {}
+        for col in range(values.shape[1]):
+            observed = ~missing[:, col]
+            if observed.all():
+                self.pools[col] = (shared_index, values[:, col])
+                continue
+            if observed.sum() < self.n_neighbors:
+                raise ValueError(f"{col}. sütunda gözlenen satır sayısı ({observed.sum()}) "
+                                 f"komşu sayısından ({self.n_neighbors}) az")
+            self.pools[col] = (self._build_index(query_values[observed]), values[observed, col])
+        
+        return self
+    
+    def transform(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        Eksik hücreleri, sütunun bağışçı havuzundaki en yakın komşuların
+        ortalamasıyla doldur.
+        
+        Args:
+            X: Eksik değer içerebilen veri (fit ile aynı sütunlar)
+            
+        Returns:
+            Doldurulmuş veri matrisi
+        """
+        if self.pools is None:
+            raise ValueError("Imputer henüz eğitilmedi! Önce fit() çağrılmalı.")
+        
+        values = np.array(X, dtype=np.float64)
+        missing = np.isnan(values)
+        
+        # Yeni veride sorgu sütunları da eksik olabilir
+        query_all = values[:, self.query_columns]
+        query_all = np.where(np.isnan(query_all), self.query_fill, query_all)
+        
+        for col in np.flatnonzero(missing.any(axis=0)):
+            index, donor_values = self.pools[col]
+            rows = np.flatnonzero(missing[:, col])
+            for start in range(0, len(rows), self.batch_size):
+                batch_rows = rows[start:start + self.batch_size]
+                neighbor_idx = index.kneighbors(query_all[batch_rows], return_distance=False)
+                values[batch_rows, col] = donor_values[neighbor_idx].mean(axis=1)
+        
+        return values
+    
+    def fit_transform(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        Imputer'ı eğit ve aynı veriyi doldur.
+        
+        Args:
+            X: Eksik değer içerebilen veri
+            
+        Returns:
+            Doldurulmuş veri matrisi
+        """
+        return self.fit(X).transform(X)
+
+
+# PreprocessingPipeline'ın desteklediği eksik değer yöntemleri
+# ('drop' dışındakiler SimpleImputer stratejisidir)
+PIPELINE_IMPUTE_METHODS = ('mean', 'median', 'most_frequent', 'drop')
+
+
+class PreprocessingPipeline:
+    """
+    Bir kez eğitilip (fit) yeni verilere tekrar tekrar uygulanabilen
+    (transform) ön işleme hattı.
+    
+    `DataPreprocessor.prepare_for_clustering` adımlarını izler ve eğitilen
+    durumu saklar:
+    - Medyan imputer (seçilen özellikler üzerinde)
+    - Aykırı değer sınırları (`handle_outliers`)
+    - Seçilen özellik listesi (`feature_columns`)
+    - Scaler
+    
+    Böylece yeni bir yılın verisi veya yeni ilçe grubu, tüm veri üzerinde
+    yeniden eğitim yapılmadan aynı ölçekte dönüştürülebilir.
+    """
+    
+    def __init__(self,
+                 exclude_columns: List[str] = None,
+                 normalize_method: str = 'standard',
+                 outlier_method: str = 'iqr',
+                 outlier_action: str = 'clip',
+                 outlier_threshold: float = 1.5,
+                 correlation_threshold: float = 0.95,
+                 impute_method: str = 'median'):
+        """
+        PreprocessingPipeline sınıfını başlat.
+        
+        Args:
+            exclude_columns: Hariç tutulacak sütunlar
+            normalize_method: Normalizasyon yöntemi ('standard', 'minmax', 'robust')
+            outlier_method: Aykırı değer tespit yöntemi ('iqr', 'zscore')
+            outlier_action: Aykırı değer işlemi ('clip', 'remove', 'winsorize')
+            outlier_threshold: Aykırı değer eşiği
+            correlation_threshold: Yüksek korelasyon eşiği
+            impute_method: Imputation yöntemi ('mean', 'median', 'most_frequent',
+                'drop': eksik değerli satırlar eğitimde ve dönüşümde atılır)
+        """
+        if impute_method not in PIPELINE_IMPUTE_METHODS:
+            raise ValueError(f"Desteklenmeyen imputation yöntemi: {impute_method} "
+                             f"(desteklenenler: {', '.join(PIPELINE_IMPUTE_METHODS)})")
+        if exclude_columns is None:
+            exclude_columns = ['il_kodu', 'il_adi', 'plaka', 'bolge', 'sege_endeksi', 'sege_kademe']
+        
+        self.exclude_columns = exclude_columns
+        self.normalize_method = normalize_method
+        self.outlier_method = outlier_method
+        self.outlier_action = outlier_action
+        self.outlier_threshold = outlier_threshold
+        self.correlation_threshold = correlation_threshold
+        self.impute_method = impute_method
+        
+        self.imputer = None
+        self.outlier_bounds = None
+        self.feature_columns = []
+        self.scaler = None
+        self.is_fitted = False
+    
+    @classmethod
+    def from_config(cls, config: Dict, **overrides) -> 'PreprocessingPipeline':
+        """
+        config.yaml 'preprocessing' bölümünden pipeline oluştur.
+        
+        Args:
+            config: Konfigürasyon dictionary (bkz. `config.load_config`)
+            **overrides: Konfigürasyonu ezen parametreler
+            
+        Returns:
+            Eğitilmemiş PreprocessingPipeline
+        """
+        section = config.get('preprocessing', {}) or {}
+        params = {
+            'normalize_method': section.get('scaler', 'standard'),
+            'impute_method': section.get('handle_missing', 'median'),
+            'outlier_method': section.get('outlier_method', 'iqr'),
+            'outlier_threshold': section.get('outlier_threshold', 1.5)
+        }
+        params.update(overrides)
+        
+        return cls(**params)
+    
+    def get_params(self) -> Dict:
+        """Pipeline'ın kurulum parametrelerini döndür."""
+        return {
+            'exclude_columns': self.exclude_columns,
+            'normalize_method': self.normalize_method,
+            'outlier_method': self.outlier_method,
+            'outlier_action': self.outlier_action,
+            'outlier_threshold': self.outlier_threshold,
+            'correlation_threshold': self.correlation_threshold,
+            'impute_method': self.impute_method
+        }
+    
+    def fit(self, df: pd.DataFrame) -> 'PreprocessingPipeline':
+        """
+        Ön işleme durumunu verilen DataFrame üzerinde eğit.
+        
+        Args:
+            df: Eğitim verisi (ör. referans yıl)
+            
+        Returns:
+            Eğitilmiş pipeline (self)
+        """
+        self._fit(df)
+        return self
+    
+    def fit_transform(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Pipeline'ı eğit ve eğitim verisinin ölçeklenmiş halini döndür.
+        
+        Args:
+            df: Eğitim verisi
+            
+        Returns:
+            Normalize edilmiş veri matrisi
+        """
+        return self._fit(df)
+    
+    def _fit(self, df: pd.DataFrame) -> np.ndarray:
+        """Eğitim adımlarını uygula ve ölçeklenmiş eğitim verisini döndür."""
+        # Ön işleme adımları veriyi yerinde değiştirir; çağıranın DataFrame'i
+        # korunur ve imputer aşağıda bu ham kopyadan eğitilir
+        preprocessor = DataPreprocessor(df.copy())
+        preprocessor._identify_column_types()
+        
+        # 1. Eksik değerler (özellik seçimi korelasyonları için)
+        if len(preprocessor.analyze_missing_values()) > 0:
+            preprocessor.handle_missing_values(method=self.impute_method)
+        
+        # 2. Özellik seçimi
+        self.feature_columns = preprocessor.select_features(
+            exclude_columns=self.exclude_columns,
+            correlation_threshold=self.correlation_threshold
+        )
+        
+        # Imputer yalnızca seçilen özellikler üzerinde, doldurulmamış ham
+        # veriden (df) eğitilir; yeni verilerde eksik değer olabileceği için
+        # her zaman saklanır ('drop' yönteminde imputer yoktur)
+        if self.impute_method == 'drop':
+            self.imputer = None
+        else:
+            self.imputer = SimpleImputer(strategy=self.impute_method)
+            self.imputer.fit(df[self.feature_columns])
+        
+        # 3. Aykırı değer sınırları
+        preprocessor.handle_outliers(
+            method=self.outlier_method,
+            action=self.outlier_action,
+            columns=self.feature_columns,
+            threshold=self.outlier_threshold,
+            vectorized=True
+        )
+        self.outlier_bounds = preprocessor.outlier_bounds
+        
+        # 4. Normalizasyon
+        scaled_data, self.scaler = preprocessor.normalize(
+            method=self.normalize_method,
+            columns=self.feature_columns
+        )
+        self.is_fitted = True
+        
+        return scaled_data
+    
+    def transform(self,
+                  df: pd.DataFrame,
+                  return_frame: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, pd.DataFrame]]:
+        """
+        Eğitilmiş durumu yeni veriye uygula (yeniden eğitim yapılmaz).
+        
+        Args:
+            df: Dönüştürülecek veri (eğitimdeki özellik sütunlarını içermeli)
+            return_frame: True ise işlenmiş DataFrame de döndürülür
+            
+        Returns:
+            Normalize veri veya (Normalize veri, İşlenmiş DataFrame) tuple
+        """
+        if not self.is_fitted:
+            raise ValueError("Pipeline henüz eğitilmedi! Önce fit() çağrılmalı.")
+        
+        missing_cols = [col for col in self.feature_columns if col not in df.columns]
+        if missing_cols:
+            raise ValueError(f"Eksik özellik sütunları: {missing_cols}")
+        
+        if self.imputer is None:
+            # 'drop': seçilen özelliklerde eksik değeri olan satırlar atılır
+            df = df[df[self.feature_columns].notna().all(axis=1)]
+            values = df[self.feature_columns].to_numpy(dtype=np.float64)
+        else:
+            values = self.imputer.transform(df[self.feature_columns])
+        
+        lower = self.outlier_bounds['alt_sinir'].to_numpy()
+        upper = self.outlier_bounds['ust_sinir'].to_numpy()
+        if self.outlier_action == 'remove':
+            keep = ((values >= lower) & (values <= upper)).all(axis=1)
+            values = values[keep]
+            df = df[keep]
+        else:
+            values = np.clip(values, lower, upper)
+        
+        features = pd.DataFrame(values, columns=self.feature_columns, index=df.index)
+        scaled_data = self.scaler.transform(features)
+        
+        if return_frame:
+            processed = df.copy()
+            processed[self.feature_columns] = features
+            return scaled_data, processed
+        
+        return scaled_data
+    
+    def save(self, filepath: str) -> str:
+        """
+        Eğitilmiş pipeline durumunu diske kaydet.
+        
+        Args:
+            filepath: Kayıt dosya yolu (ör. 'models/pipeline_2023.pkl')
+            
+        Returns:
+            Kayıt dosya yolu
+        """
+        if not self.is_fitted:
+            raise ValueError("Pipeline henüz eğitilmedi! Önce fit() çağrılmalı.")
+        
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with open(filepath, 'wb') as f:
+            pickle.dump(self.__dict__, f)
+        
+        print(f"✓ Pipeline kaydedildi: {filepath}")
+        return filepath
+    
+    @classmethod
+    def load(cls, filepath: str) -> 'PreprocessingPipeline':
+        """
+        Kaydedilmiş pipeline durumunu yükle.
+        
+        Args:
+            filepath: Kayıt dosya yolu
+            
+        Returns:
+            Eğitilmiş PreprocessingPipeline
+        """
+        with open(filepath, 'rb') as f:
+            state = pickle.load(f)
+        
+        pipeline = cls.__new__(cls)
+        pipeline.__dict__.update(state)
+        
+        print(f"✓ Pipeline yüklendi: {filepath} ({len(pipeline.feature_columns)} özellik)")
+        return pipeline
+
+
+def _read_panel_source(source: Union[str, pd.DataFrame]) -> pd.DataFrame:
+    """Panel öğesini DataFrame olarak al (dosya yolu ise oku)."""
+    if isinstance(source, str):
+        return pd.read_csv(source)
+    return source
+
+
+def _fit_panel_item(key, source: Union[str, pd.DataFrame], params: Dict, verbose: bool):
+    """Süreç havuzu işçisi: bir panel öğesi için pipeline eğit."""
+    with quiet_output(not verbose):
+        pipeline = PreprocessingPipeline(**params)
+        scaled_data = pipeline.fit_transform(_read_panel_source(source))
+    return key, scaled_data, pipeline
+
+
+def _transform_panel_item(key, source: Union[str, pd.DataFrame], pipeline: 'PreprocessingPipeline'):
+    """Süreç havuzu işçisi: eğitilmiş pipeline'ı bir panel öğesine uygula."""
+    return key, pipeline.transform(_read_panel_source(source))
+
+
+def _split_panel(sources: Union[Dict, List[str], pd.DataFrame],
+                 year_column: str) -> Dict:
+    """Girdiyi {anahtar: dosya yolu veya DataFrame} biçimine getir."""
+    if isinstance(sources, pd.DataFrame):
+        if year_column not in sources.columns:
+            raise ValueError(f"Panel verisinde '{year_column}' sütunu yok!")
+        return {year: group.drop(columns=year_column).reset_index(drop=True)
+                for year, group in sources.groupby(year_column, sort=True)}
+    if isinstance(sources, dict):
+        return dict(sources)
+    return {os.path.splitext(os.path.basename(path))[0]: path for path in sources}
+
+
+def preprocess_panel(sources: Union[Dict, List[str], pd.DataFrame],
+                     reference=None,
+                     year_column: str = 'yil',
+                     config: Dict = None,
+                     n_jobs: int = None,
+                     verbose: bool = False,
+                     **pipeline_params) -> Tuple[Dict, Dict]:
+    """
+    Çok yıllı (veya çok düzeyli) paneli paralel olarak ön işle.
+    
+    Her öğe ortak konfigürasyonla ayrı bir süreçte işlenir. `reference`
+    verilirse ölçekleme yalnızca o yıl üzerinde eğitilir ve diğer tüm
+    yıllara aynı durum uygulanır; böylece yıllar aynı ölçekte karşılaştırılabilir.
+    
+    Args:
+        sources: {anahtar: dosya yolu/DataFrame}, dosya yolu listesi (anahtar
+            dosya adıdır) veya `year_column` içeren panel DataFrame
+        reference: Referans anahtar/yıl (None ise her öğe kendi üzerinde eğitilir)
+        year_column: Panel DataFrame'de yıl sütunu
+        config: Konfigürasyon dictionary ('preprocessing' bölümü kullanılır)
+        n_jobs: Süreç sayısı (None ise CPU sayısı, 1 ise seri)
+        verbose: İşçi çıktıları gösterilsin mi
+        **pipeline_params: PreprocessingPipeline parametreleri
+        
+    Returns:
+        ({anahtar: Normalize veri}, {anahtar: PreprocessingPipeline}) tuple
+    """
+    items = _split_panel(sources, year_column)
+    if reference is not None and reference not in items:
+        raise ValueError(f"Referans öğe bulunamadı: {reference}")
+    
+    if config is not None:
+        params = PreprocessingPipeline.from_config(config, **pipeline_params).get_params()
+    else:
+        params = pipeline_params
+    
+    scaled, pipelines = {}, {}
+    
+    if reference is not None:
+        key, scaled[key], pipelines[key] = _fit_panel_item(reference, items[reference], params, verbose)
+        jobs = [(_transform_panel_item, (k, src, pipelines[reference]))
+                for k, src in items.items() if k != reference]
+    else:
+        jobs = [(_fit_panel_item, (k, src, params, verbose)) for k, src in items.items()]
+    
+    if n_jobs == 1 or len(jobs) <= 1:
+        results = [func(*args) for func, args in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(func, *args) for func, args in jobs]
+            results = [future.result() for future in futures]
+    
+    for result in results:
+        key, scaled[key] = result[0], result[1]
+        pipelines[key] = result[2] if len(result) > 2 else pipelines[reference]
+    
+    # Girdi sırasını koru
+    scaled = {key: scaled[key] for key in items}
+    pipelines = {key: pipelines[key] for key in items}
+    
+    print(f"✓ Panel ön işleme tamamlandı ({len(items)} öğe"
+          + (f", referans: {reference}" if reference is not None else "") + ")")
+    
+    return scaled, pipelines
 
 
 def load_and_preprocess(filepath: str,
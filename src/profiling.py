@@ -0,0 +1,197 @@
+﻿"""
+Türkiye İlleri Sosyo-Ekonomik Kümeleme Projesi
+Profil Çıkarma Modülü
+
+Bu modül işlem aşamalarının süre ve bellek kullanımını ölçmek için
+yardımcı araçları içerir.
+"""
+
+import pandas as pd
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+from typing import Dict, List
+import json
+import time
+import tracemalloc
+
+MB = 1024 * 1024
+
+
+# Etkin (iç içe) ölçümlerin, iç aşamalar tepe değerini sıfırlamadan önce
+# gördükleri en yüksek mutlak tepe değerleri
+_PEAK_STACK: List[List[int]] = []
+
+
+@contextmanager
+def track_peak_memory(profile: Dict[str, Dict[str, float]],
+                      stage: str,
+                      enabled: bool = True):
+    """
+    Bir aşamanın tepe ve net bellek kullanımını (tracemalloc) ölç.
+    
+    Sonuç `profile[stage] = {'tepe_mb': ..., 'net_mb': ...}` olarak yazılır.
+    Tepe değeri aşama başındaki kullanıma göredir. İç içe aşamalarda iç
+    aşama tracemalloc tepe değerini sıfırlamadan önce mevcut tepe dış
+    aşamalara aktarılır; dış aşamanın tepe değeri korunur.
+    
+    Args:
+        profile: Sonuçların yazılacağı dictionary
+        stage: Aşama adı
+        enabled: False ise ölçüm yapılmaz
+    """
+    if not enabled:
+        yield
+        return
+    
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+    
+    _, outer_peak = tracemalloc.get_traced_memory()
+    for frame in _PEAK_STACK:
+        frame[0] = max(frame[0], outer_peak)
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    frame = [baseline]
+    _PEAK_STACK.append(frame)
+    
+    try:
+        yield
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        _PEAK_STACK.remove(frame)
+        profile[stage] = {
+            'tepe_mb': (max(frame[0], peak) - baseline) / MB,
+            'net_mb': (current - baseline) / MB
+        }
+        if started_here:
+            tracemalloc.stop()
+
+
+def format_memory_profile(profile: Dict[str, Dict[str, float]]) -> str:
+    """
+    Aşama bazlı bellek profilini okunabilir metne çevir.
+    
+    Args:
+        profile: `track_peak_memory` ile doldurulmuş dictionary
+        
+    Returns:
+        Tablo biçiminde metin
+    """
+    lines = [f"{'Aşama':<20} {'Tepe (MB)':>10} {'Net (MB)':>10}"]
+    for stage, values in profile.items():
+        lines.append(f"{stage:<20} {values['tepe_mb']:>10.2f} {values['net_mb']:>10.2f}")
+    return "\n".join(lines)
+
+
+class _NullWriter:
+    """Yazılanları yok sayan çıktı akışı."""
+    
+    def write(self, text: str) -> int:
+        return len(text)
+    
+    def flush(self):
+        pass
+
+
+@contextmanager
+def quiet_output(enabled: bool = True):
+    """
+    Konsol çıktısını (print) bastır.
+    
+    Args:
+        enabled: False ise çıktı olduğu gibi bırakılır
+    """
+    if not enabled:
+        yield
+        return
+    
+    with redirect_stdout(_NullWriter()):
+        yield
+
+
+class StageProfiler:
+    """
+    Aşama bazlı süre ve bellek ölçümü.
+    
+    Her aşama için duvar saati süresi, CPU süresi, tepe/net bellek
+    (tracemalloc) ve aşama sonundaki satır/sütun sayısı kaydedilir.
+    Kayıtlar isteğe bağlı olarak JSON lines dosyasına eklenir.
+    """
+    
+    def __init__(self,
+                 enabled: bool = True,
+                 trace_memory: bool = True,
+                 jsonl_path: str = None,
+                 run_name: str = None):
+        """
+        StageProfiler sınıfını başlat.
+        
+        Args:
+            enabled: False ise hiçbir ölçüm yapılmaz
+            trace_memory: Tepe bellek ölçülsün mü (tracemalloc ek maliyet getirir)
+            jsonl_path: Verilirse her aşama kaydı bu dosyaya bir satır olarak eklenir
+            run_name: Kayıtlara eklenecek çalıştırma adı
+        """
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.jsonl_path = jsonl_path
+        self.run_name = run_name
+        self.records: List[Dict] = []
+    
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Bir aşamayı ölç.
+        
+        Aşama gövdesi, verilen kayda 'satir' ve 'sutun' gibi alanlar
+        ekleyebilir:
+        
+            with profiler.stage('normalizasyon') as record:
+                ...
+                record['satir'], record['sutun'] = scaled.shape
+        
+        Args:
+            name: Aşama adı
+        """
+        record = {'asama': name}
+        if not self.enabled:
+            yield record
+            return
+        
+        memory = {}
+        started_at = datetime.now().isoformat(timespec='seconds')
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        
+        with track_peak_memory(memory, name, self.trace_memory):
+            yield record
+        
+        record['sure_sn'] = time.perf_counter() - wall_start
+        record['cpu_sn'] = time.process_time() - cpu_start
+        if name in memory:
+            record['tepe_bellek_mb'] = memory[name]['tepe_mb']
+            record['net_bellek_mb'] = memory[name]['net_mb']
+        record['baslangic'] = started_at
+        if self.run_name is not None:
+            record['calistirma'] = self.run_name
+        
+        self.records.append(record)
+        self._write_jsonl(record)
+    
+    def _write_jsonl(self, record: Dict):
+        """Kaydı JSON lines dosyasına ekle."""
+        if self.jsonl_path is None:
+            return
+        
+        with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=float) + "\n")
+    
+    def to_dict(self) -> Dict[str, Dict]:
+        """Kayıtları {aşama: ölçümler} biçiminde döndür."""
+        return {record['asama']: {k: v for k, v in record.items() if k != 'asama'}
+                for record in self.records}
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Kayıtları aşama başına bir satır olan DataFrame olarak döndür."""
+        return pd.DataFrame(self.records)
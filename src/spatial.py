@@ -0,0 +1,123 @@
+﻿"""
+Türkiye İlleri Sosyo-Ekonomik Kümeleme Projesi
+Mekânsal Komşuluk Modülü
+
+Bu modül yerel sınır (komşuluk) dosyasından seyrek komşuluk matrisi
+oluşturma ve kümelerin mekânsal bitişikliğini denetleme araçlarını içerir.
+"""
+
+import pandas as pd
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+from typing import Sequence
+import os
+
+try:
+    from .config import load_config
+except ImportError:  # doğrudan `python src/spatial.py` ile çalıştırma
+    from config import load_config
+
+DEFAULT_ADJACENCY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                      'data', 'external', 'il_komsuluklari.csv')
+
+
+def load_border_edges(path: str = None) -> pd.DataFrame:
+    """
+    Sınır komşuluk dosyasını oku.
+    
+    Dosya her satırı ortak sınırı olan bir birim çifti olan bir kenar
+    listesidir ('<anahtar>_1', '<anahtar>_2' sütunları; il düzeyi için
+    'il_kodu_1', 'il_kodu_2'). İlçe düzeyi dosyalar aynı biçimde başka bir
+    anahtar sütunuyla verilebilir.
+    
+    Args:
+        path: Dosya yolu (None ise config.yaml data.adjacency_file, o da
+            yoksa paketle gelen il komşulukları)
+        
+    Returns:
+        Kenar listesi DataFrame
+    """
+    if path is None:
+        data_config = load_config().get('data', {}) or {}
+        if data_config.get('adjacency_file'):
+            root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            path = os.path.join(root, data_config.get('external_path', 'data/external/'),
+                                data_config['adjacency_file'])
+        else:
+            path = DEFAULT_ADJACENCY_PATH
+    
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Komşuluk dosyası bulunamadı: {path}")
+    
+    return pd.read_csv(path, encoding='utf-8-sig')
+
+
+def build_adjacency_matrix(keys: Sequence,
+                           edges: pd.DataFrame = None,
+                           key_column: str = 'il_kodu',
+                           path: str = None) -> sparse.csr_matrix:
+    """
+    Veri satırlarının sırasıyla hizalı, simetrik seyrek komşuluk matrisi oluştur.
+    
+    Args:
+        keys: Her veri satırının birim anahtarı (ör. df['il_kodu'])
+        edges: Kenar listesi (None ise `load_border_edges(path)`)
+        key_column: Kenar listesindeki anahtar sütun adı öneki
+        path: Komşuluk dosyası yolu
+        
+    Returns:
+        n×n CSR komşuluk matrisi (kenar sayısı kadar bellek)
+    """
+    if edges is None:
+        edges = load_border_edges(path)
+    
+    keys = pd.Index(keys)
+    if keys.has_duplicates:
+        raise ValueError("Birim anahtarları tekrarsız olmalı!")
+    
+    rows = keys.get_indexer(edges[f'{key_column}_1'])
+    cols = keys.get_indexer(edges[f'{key_column}_2'])
+    # Veride olmayan birimlere ait kenarlar atlanır
+    present = (rows >= 0) & (cols >= 0)
+    rows, cols = rows[present], cols[present]
+    
+    n_units = len(keys)
+    adjacency = sparse.coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(n_units, n_units))
+    adjacency = ((adjacency + adjacency.T) > 0).astype(np.float64).tocsr()
+    
+    n_components, _ = connected_components(adjacency, directed=False)
+    print(f"✓ Komşuluk matrisi oluşturuldu ({n_units} birim, {adjacency.nnz // 2} kenar)")
+    if n_components > 1:
+        print(f"  ⚠ Komşuluk grafiği {n_components} bağlantısız parçadan oluşuyor")
+    
+    return adjacency
+
+
+def contiguity_report(labels: np.ndarray, adjacency: sparse.spmatrix) -> pd.DataFrame:
+    """
+    Her kümenin komşuluk grafiğinde kaç bağlantılı parçaya bölündüğünü hesapla.
+    
+    Args:
+        labels: Küme etiketleri
+        adjacency: Komşuluk matrisi
+        
+    Returns:
+        'Küme', 'boyut', 'parca_sayisi' ve 'bitisik' sütunlu DataFrame
+    """
+    labels = np.asarray(labels)
+    adjacency = sparse.csr_matrix(adjacency)
+    
+    # Yalnızca aynı kümedeki komşular arasındaki kenarlar tutulur
+    rows, cols = adjacency.nonzero()
+    same = labels[rows] == labels[cols]
+    within = sparse.csr_matrix((np.ones(same.sum()), (rows[same], cols[same])),
+                               shape=adjacency.shape)
+    _, components = connected_components(within, directed=False)
+    
+    report = pd.DataFrame({'Küme': labels, 'parca': components}).groupby('Küme').agg(
+        boyut=('parca', 'size'), parca_sayisi=('parca', 'nunique')
+    ).reset_index()
+    report['bitisik'] = report['parca_sayisi'] == 1
+    
+    return report
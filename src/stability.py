@@ -0,0 +1,296 @@
+﻿"""
+Türkiye İlleri Sosyo-Ekonomik Kümeleme Projesi
+Küme Kararlılığı Modülü
+
+Bu modül bootstrap veya alt örneklem ile tekrarlanan kümeleme eğitimlerinden
+ortak atama (co-association) matrisi, il bazında kararlılık, küme bazında
+Jaccard benzerliği ve ortalama ARI hesaplayan kararlılık analizini içerir.
+"""
+
+import pandas as pd
+import numpy as np
+from sklearn.metrics import adjusted_rand_score
+from typing import Dict, List
+
+try:
+    from .clustering import ClusteringAnalyzer, _build_estimator
+    from .parallel import get_shared_data, resolve_n_jobs, run_parallel
+except ImportError:  # doğrudan `python src/stability.py` ile çalıştırma
+    from clustering import ClusteringAnalyzer, _build_estimator
+    from parallel import get_shared_data, resolve_n_jobs, run_parallel
+
+
+class StabilityAnalyzer:
+    """
+    Bootstrap / alt örneklem tabanlı küme kararlılığı analizi.
+    
+    Her yeniden örneklemede seçilen algoritma aynı k ile örneklem üzerinde
+    yeniden eğitilir ve sonuç referans kümelemeyle karşılaştırılır. Eğitimler
+    süreç havuzunda çalışır; veri matrisi tüm işçilerle tek bir paylaşılan
+    bellek kopyası üzerinden paylaşılır.
+    """
+    
+    def __init__(self, analyzer: ClusteringAnalyzer, block_mb: float = 256):
+        """
+        StabilityAnalyzer sınıfını başlat.
+        
+        Args:
+            analyzer: Verisi yüklenmiş ClusteringAnalyzer
+            block_mb: Ortak atama matrisi biriktirilirken kullanılacak
+                gösterge (one-hot) bloklarının bellek bütçesi (MB)
+        """
+        self.analyzer = analyzer
+        self.block_mb = block_mb
+        self.results = {}
+    
+    def run(self,
+            n_clusters: int,
+            algorithm: str = 'kmeans',
+            params: Dict = None,
+            n_resamples: int = 200,
+            scheme: str = 'bootstrap',
+            sample_fraction: float = 0.8,
+            reference_labels: np.ndarray = None,
+            n_jobs: int = 1) -> Dict:
+        """
+        Kararlılık analizini çalıştır.
+        
+        Args:
+            n_clusters: Küme sayısı
+            algorithm: 'kmeans', 'hierarchical', 'gmm' veya 'dbscan'
+            params: Algoritma parametreleri (bkz. `compare_algorithms`)
+            n_resamples: Yeniden örnekleme sayısı
+            scheme: 'bootstrap' (iadeli, n satır) veya 'subsample'
+                (iadesiz, sample_fraction oranında)
+            sample_fraction: 'subsample' için örneklem oranı
+            reference_labels: Karşılaştırılacak referans etiketler (None ise
+                aynı algoritma tüm veride eğitilir)
+            n_jobs: Paralel süreç sayısı (1: seri)
+            
+        Returns:
+            Sonuç dictionary:
+            - 'co_association': n×n ortak atama oranları (birlikte
+              örneklendikleri eğitimler içinde aynı kümeye düşme oranı)
+            - 'province_stability': Her il için referans kümesindeki diğer
+              illerle ortalama ortak atama oranı
+            - 'cluster_jaccard': Küme bazında Jaccard özet tablosu
+            - 'mean_ari', 'ari_std': Referansa göre ARI ortalaması ve std
+            - 'reference_labels', 'n_resamples'
+        """
+        data = self.analyzer.data
+        if data is None:
+            raise ValueError("Veri seti yüklenmedi!")
+        if scheme not in ('bootstrap', 'subsample'):
+            raise ValueError(f"Bilinmeyen örnekleme şeması: {scheme}")
+        if scheme == 'subsample' and not 0 < sample_fraction <= 1:
+            raise ValueError("sample_fraction 0 ile 1 arasında olmalı!")
+        
+        params = params or {}
+        random_state = self.analyzer.random_state
+        
+        if reference_labels is None:
+            model = _build_estimator(algorithm, n_clusters, random_state, params)
+            reference_labels = model.fit_predict(data)
+        reference_labels = np.asarray(reference_labels)
+        if len(reference_labels) != len(data):
+            raise ValueError("Referans etiket sayısı veri satır sayısıyla uyuşmuyor!")
+        
+        # Her eğitim için bağımsız seed; görevler süreç başına birkaç parçaya bölünür
+        seeds = np.random.RandomState(random_state).randint(0, 2**31 - 1, size=n_resamples)
+        n_chunks = min(n_resamples, resolve_n_jobs(n_jobs) * 4)
+        tasks = [(algorithm, n_clusters, params, chunk.tolist(), scheme,
+                  sample_fraction, reference_labels)
+                 for chunk in np.array_split(seeds, n_chunks) if len(chunk)]
+        
+        runs = [run for chunk in run_parallel(_stability_task, tasks, data, n_jobs)
+                for run in chunk]
+        
+        co_association = self._co_association(len(data), runs)
+        province_stability = _province_stability(co_association, reference_labels)
+        
+        clusters = np.unique(reference_labels[reference_labels != -1])
+        jaccard = np.array([run['jaccard'] for run in runs])
+        aris = np.array([run['ari'] for run in runs])
+        
+        cluster_jaccard = pd.DataFrame({
+            'kume': clusters,
+            'boyut': [(reference_labels == c).sum() for c in clusters],
+            'jaccard_ortalama': np.nanmean(jaccard, axis=0),
+            'jaccard_std': np.nanstd(jaccard, axis=0),
+            # Hennig (2007): Jaccard < 0.5 ise küme o eğitimde "dağılmış" sayılır;
+            # kümenin örneğe girmediği (NaN) eğitimler paydadan çıkarılır
+            'dagilma_orani': np.nanmean(np.where(np.isnan(jaccard), np.nan, jaccard < 0.5), axis=0)
+        })
+        
+        self.results = {
+            'co_association': co_association,
+            'province_stability': province_stability,
+            'cluster_jaccard': cluster_jaccard,
+            'mean_ari': float(aris.mean()),
+            'ari_std': float(aris.std()),
+            'reference_labels': reference_labels,
+            'n_resamples': n_resamples
+        }
+        
+        print(f"✓ Kararlılık analizi tamamlandı ({algorithm}, K={n_clusters}, "
+              f"{n_resamples} {scheme})")
+        print(f"  Ortalama ARI: {aris.mean():.4f} (±{aris.std():.4f})")
+        for cluster, value in zip(clusters, cluster_jaccard['jaccard_ortalama']):
+            print(f"    Küme {cluster}: Jaccard = {value:.3f}")
+        
+        return self.results
+    
+    def _co_association(self, n_samples: int, runs: List[Dict]) -> np.ndarray:
+        """
+        Ortak atama matrisini blok halinde matris çarpımıyla biriktir.
+        
+        Bir eğitim bloğu için H (n × toplam küme) one-hot küme göstergesi ve
+        S (n × eğitim) örneklenme göstergesi kurulur; H·Hᵀ aynı kümeye düşme,
+        S·Sᵀ birlikte örneklenme sayılarını verir.
+        """
+        together = np.zeros((n_samples, n_samples), dtype=np.float64)
+        sampled = np.zeros((n_samples, n_samples), dtype=np.float64)
+        
+        width = max(max((run['n_clusters'] for run in runs), default=1), 1)
+        block = max(1, int(self.block_mb * 1024**2 / (4 * n_samples * (width + 1))))
+        
+        for start in range(0, len(runs), block):
+            batch = runs[start:start + block]
+            offsets = np.cumsum([0] + [run['n_clusters'] for run in batch])
+            membership = np.zeros((n_samples, offsets[-1]), dtype=np.float32)
+            presence = np.zeros((n_samples, len(batch)), dtype=np.float32)
+            
+            for j, run in enumerate(batch):
+                idx, labels = run['indices'], run['labels']
+                presence[idx, j] = 1.0
+                clustered = labels != -1
+                membership[idx[clustered], offsets[j] + labels[clustered]] = 1.0
+            
+            together += membership @ membership.T
+            sampled += presence @ presence.T
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            co_association = np.where(sampled > 0, together / sampled, np.nan)
+        np.fill_diagonal(co_association, 1.0)
+        return co_association
+    
+    def get_province_report(self, df: pd.DataFrame, name_column: str = 'il_adi') -> pd.DataFrame:
+        """
+        İl bazında kararlılık tablosu oluştur (en kararsızdan kararlıya).
+        
+        Args:
+            df: Analiz edilen satırlarla aynı sırada orijinal DataFrame
+            name_column: İl adı sütunu
+            
+        Returns:
+            İl adı, referans kümesi ve kararlılık sütunlarını içeren DataFrame
+        """
+        if not self.results:
+            raise ValueError("Önce run() çalıştırılmalı!")
+        
+        report = pd.DataFrame({
+            name_column: df[name_column].to_numpy(),
+            'Küme': self.results['reference_labels'],
+            'kararlilik': self.results['province_stability']
+        })
+        return report.sort_values('kararlilik').reset_index(drop=True)
+
+
+def _province_stability(co_association: np.ndarray, reference_labels: np.ndarray) -> np.ndarray:
+    """Her il için referans kümesindeki diğer üyelerle ortalama ortak atama."""
+    same = reference_labels[:, None] == reference_labels[None, :]
+    np.fill_diagonal(same, False)
+    same &= (reference_labels != -1)[:, None]
+    
+    values = np.where(same, np.nan_to_num(co_association), 0.0).sum(axis=1)
+    counts = (same & ~np.isnan(co_association)).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Tek elemanlı kümelerin kararlılığı tanımsız (NaN)
+        return np.where(counts > 0, values / counts, np.nan)
+
+
+def _cluster_jaccard(reference: np.ndarray, labels: np.ndarray, n_reference: int) -> np.ndarray:
+    """
+    Her referans kümesi için örneklemdeki en benzer kümeyle Jaccard benzerliği.
+    
+    Kesişimler np.bincount ile tek geçişte kurulan çapraz tablodan okunur.
+    """
+    valid = (reference != -1) & (labels != -1)
+    n_labels = labels.max() + 1 if valid.any() else 1
+    
+    table = np.bincount(reference[valid] * n_labels + labels[valid],
+                        minlength=n_reference * n_labels).reshape(n_reference, n_labels)
+    ref_sizes = np.bincount(reference[reference != -1], minlength=n_reference)
+    run_sizes = np.bincount(labels[labels != -1], minlength=n_labels)
+    union = ref_sizes[:, None] + run_sizes[None, :] - table
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        jaccard = np.where(union > 0, table / union, 0.0).max(axis=1)
+    # Örnekleme hiç girmeyen referans kümeleri değerlendirme dışı
+    return np.where(ref_sizes > 0, jaccard, np.nan)
+
+
+def _stability_task(algorithm: str,
+                    n_clusters: int,
+                    params: Dict,
+                    seeds: List[int],
+                    scheme: str,
+                    sample_fraction: float,
+                    reference_labels: np.ndarray) -> List[Dict]:
+    """Paralel görev: bir grup seed için yeniden örnekle, eğit ve karşılaştır."""
+    data = get_shared_data()
+    n_samples = len(data)
+    
+    clusters, reference = np.unique(reference_labels, return_inverse=True)
+    if clusters[0] == -1:
+        reference = reference - 1
+    n_reference = int(reference.max()) + 1
+    
+    runs = []
+    for seed in seeds:
+        rng = np.random.RandomState(seed)
+        if scheme == 'bootstrap':
+            draw = rng.randint(0, n_samples, size=n_samples)
+        else:
+            draw = np.sort(rng.choice(n_samples, max(2, int(round(sample_fraction * n_samples))),
+                                      replace=False))
+        
+        model = _build_estimator(algorithm, n_clusters, seed, params)
+        labels = np.asarray(model.fit_predict(data[draw]))
+        
+        # Bootstrap tekrarları aynı noktadır; her il bir kez sayılır
+        indices, first = np.unique(draw, return_index=True)
+        labels = labels[first]
+        if labels.max(initial=-1) >= 0:
+            _, compact = np.unique(labels[labels != -1], return_inverse=True)
+            labels = labels.copy()
+            labels[labels != -1] = compact
+        
+        sample_reference = reference[indices]
+        runs.append({
+            'indices': indices,
+            'labels': labels,
+            'n_clusters': int(labels.max(initial=-1)) + 1,
+            'jaccard': _cluster_jaccard(sample_reference, labels, n_reference),
+            'ari': adjusted_rand_score(sample_reference, labels)
+        })
+    
+    return runs
+
+
+if __name__ == "__main__":
+    # Test
+    print("Kararlılık Modülü Test")
+    print("-" * 40)
+    
+    np.random.seed(42)
+    test_data = np.random.randn(81, 10)
+    test_data[:27] += 3
+    test_data[27:54] -= 3
+    
+    analyzer = ClusteringAnalyzer(test_data)
+    stability = StabilityAnalyzer(analyzer)
+    results = stability.run(n_clusters=3, n_resamples=50)
+    print(f"  En düşük il kararlılığı: {np.nanmin(results['province_stability']):.3f}")
+    
+    print("\n✓ Kararlılık modülü test başarılı!")
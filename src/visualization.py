@@ -16,6 +16,11 @@ from typing import List, Dict, Optional, Tuple
 import warnings
 import os
 
+try:
+    from .preprocessing import compute_correlation_matrix
+except ImportError:  # doğrudan `python src/visualization.py` ile çalıştırma
+    from preprocessing import compute_correlation_matrix
+
 warnings.filterwarnings('ignore')
 
 # Türkçe karakter desteği için
@@ -66,7 +71,8 @@ class ClusterVisualizer:
             5: '#313695'   # Koyu mavi - En gelişmiş
         }
         
-        # Küme isimleri
+        # Küme isimleri (keyfi küme kimlikleri önce SEGE sırasına hizalanmalı:
+        # alignment.align_labels(labels, alignment.sege_reference(df)))
         self.cluster_names = {
             0: '6. Kademe (En Az Gelişmiş)',
             1: '5. Kademe',
@@ -367,7 +373,8 @@ class ClusterVisualizer:
         if columns is None:
             columns = df.select_dtypes(include=[np.number]).columns.tolist()
         
-        corr_matrix = df[columns].corr()
+        # Özellik seçiminde hesaplanan matris önbellekten yeniden kullanılır
+        corr_matrix = compute_correlation_matrix(df, columns)
         
         fig, ax = plt.subplots(figsize=(14, 12))
         
@@ -475,8 +482,8 @@ class ClusterVisualizer:
         Returns:
             Matplotlib figure
         """
-        df_plot = df.copy()
-        df_plot['Küme'] = labels
+        # Tüm DataFrame yerine yalnızca gösterilecek sütunlar alınır
+        df_plot = df[features].assign(Küme=np.asarray(labels))
         
         n_features = len(features)
         n_cols = 3
@@ -591,10 +598,6 @@ def create_turkey_map_html(df: pd.DataFrame,
         # Harita merkezi (Türkiye)
         m = folium.Map(location=[39.0, 35.0], zoom_start=6, tiles='CartoDB positron')
         
-        # Küme bilgilerini DataFrame'e ekle
-        df_map = df.copy()
-        df_map['kume'] = labels
-        
         # Renk skalası
         cluster_colors = {
             0: '#d73027',
@@ -605,15 +608,15 @@ def create_turkey_map_html(df: pd.DataFrame,
             5: '#313695'
         }
         
-        # Her il için marker ekle (basitleştirilmiş)
-        for _, row in df_map.iterrows():
-            cluster = row['kume']
+        # Her il için marker ekle (basitleştirilmiş); etiketler DataFrame'e
+        # kopyalanmadan il adlarıyla birlikte dolaşılır
+        for il_adi, cluster in zip(df['il_adi'], labels):
             color = cluster_colors.get(cluster, '#808080')
             
             folium.CircleMarker(
                 location=[39.0, 35.0],  # Placeholder - gerçek koordinatlar gerekli
                 radius=5,
-                popup=f"{row['il_adi']}<br>Küme: {cluster}",
+                popup=f"{il_adi}<br>Küme: {cluster}",
                 color=color,
                 fill=True,
                 fillColor=color